@@ -0,0 +1,63 @@
+from random import Random
+
+import struct
+
+from pytest import fixture
+
+from inputs import BULK_SIZE
+
+
+# The benchmarks need pytest-benchmark, which is not among the
+# test-related dependencies, so skip them when it is missing.
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    collect_ignore_glob = ["test_*.py"]
+
+
+@fixture(scope="session")
+def values():
+    # Use the same pseudo-random addresses for every run, so that
+    # results are comparable across runs.
+
+    generator = Random(48)
+    return [generator.getrandbits(48) for _ in range(BULK_SIZE)]
+
+
+@fixture(scope="session")
+def strings(values):
+    return [
+        "{:02x}:{:02x}:{:02x}:{:02x}:{:02x}:{:02x}".format(
+            *value.to_bytes(6, "big")
+        )
+        for value in values
+    ]
+
+
+@fixture(scope="session")
+def text_file(strings, tmp_path_factory):
+    path = tmp_path_factory.mktemp("benchmark") / "addresses.txt"
+    path.write_text("\n".join(strings) + "\n")
+    return path
+
+
+@fixture(scope="session")
+def pcap_file(values, tmp_path_factory):
+    # A classic capture with one 64-byte Ethernet frame per address,
+    # sent from that address to the broadcast address.
+
+    frames = [
+        b"".join([
+            struct.pack("<IIII", 1603000000, index, 64, 64),
+            b"\xff" * 6,
+            value.to_bytes(6, "big"),
+            b"\x08\x00" + b"\x00" * 50
+        ])
+        for index, value in enumerate(values)
+    ]
+    header = struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1)
+
+    path = tmp_path_factory.mktemp("benchmark") / "frames.pcap"
+    path.write_bytes(header + b"".join(frames))
+    return path
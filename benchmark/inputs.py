@@ -0,0 +1,16 @@
+NOTATIONS = {
+    "plain": "a0b1c2d3e4f5",
+    "hyphen": "a0-b1-c2-d3-e4-f5",
+    "colon": "a0:b1:c2:d3:e4:f5",
+    "dot": "a0b1.c2d3.e4f5"
+}
+
+INVALID = {
+    "length": "0a1b2c3d4e5f6",
+    "digit": "0a1b2c3d4e5g",
+    "separator": "0a-1b-2c-3d-4e5f"
+}
+
+INVALID_OCTET = "0g"
+
+BULK_SIZE = 100000
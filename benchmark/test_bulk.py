@@ -0,0 +1,290 @@
+from pickle import (
+    dumps,
+    loads
+)
+
+from pytest import (
+    importorskip,
+    mark
+)
+
+from macaddress import (
+    AddressCache,
+    AddressGenerator,
+    AddressPool,
+    MacAddressBlock,
+    MacAddressSet,
+    MediaAccessControlAddress,
+    Registry,
+    bit_reverse_many,
+    collapse_blocks,
+    extract,
+    format_many,
+    from_modified_eui64_many,
+    ingest_file,
+    ipv4_groups_many,
+    ipv4_multicast_many,
+    ipv6_groups_many,
+    ipv6_multicast_many,
+    pack_many,
+    parse_many,
+    read_pcap,
+    to_ipv6_many,
+    to_modified_eui64_many,
+    unpack_frames,
+    unpack_many
+)
+
+from inputs import (
+    BULK_SIZE,
+    NOTATIONS
+)
+
+
+numpy = importorskip("numpy")
+
+from macaddress import MacAddressArray  # noqa: E402
+
+
+ARRAY_PROPERTIES = [
+    "is_broadcast",
+    "is_multicast",
+    "is_unicast",
+    "is_uaa",
+    "is_laa",
+    "type",
+    "has_oui",
+    "has_cid"
+]
+
+
+@mark.parametrize("errors", ["raise", "skip", "mask"])
+def test_parse_many(benchmark, strings, errors):
+    benchmark.group = "bulk parsing"
+    benchmark(parse_many, strings, errors=errors)
+
+
+def test_ingest_file(benchmark, text_file):
+    benchmark.group = "bulk parsing"
+    benchmark.pedantic(ingest_file, args=(text_file,), rounds=3)
+
+
+def test_extract(benchmark, strings):
+    log = " ".join(
+        "lease {} renewed".format(string) for string in strings
+    ).encode("ascii")
+
+    benchmark.group = "bulk parsing"
+    benchmark(lambda: sum(1 for _ in extract(log)))
+
+
+def test_unpack_frames(benchmark, values):
+    buffer = b"".join(
+        value.to_bytes(6, "big") * 2 + b"\x00" * 52 for value in values
+    )
+
+    benchmark.group = "bulk parsing"
+    benchmark(unpack_frames, buffer, 64)
+
+
+def test_read_pcap(benchmark, pcap_file):
+    benchmark.group = "bulk parsing"
+    benchmark(
+        lambda: sum(len(chunk.sources) for chunk in read_pcap(pcap_file))
+    )
+
+
+def test_array_construction(benchmark, values):
+    benchmark.group = "bulk construction"
+    benchmark(MacAddressArray, values)
+
+
+@mark.parametrize("output", ["int", "str"])
+def test_generator(benchmark, output):
+    benchmark.group = "bulk construction"
+    benchmark(
+        lambda: AddressGenerator(seed=0).take(BULK_SIZE, output=output)
+    )
+
+
+def test_pool_allocate(benchmark):
+    def allocate(pool):
+        for _ in range(BULK_SIZE):
+            pool.allocate()
+
+    benchmark.group = "bulk construction"
+    benchmark.pedantic(
+        allocate,
+        setup=lambda: ((AddressPool("02:00:00:00:00:00/24"),), {}),
+        rounds=5
+    )
+
+
+def test_pool_release_and_allocate(benchmark):
+    pool = AddressPool("02:00:00:00:00:00/24")
+    macs = [pool.allocate() for _ in range(BULK_SIZE)]
+
+    def churn():
+        for mac in macs:
+            pool.release(mac)
+            pool.allocate()
+
+    benchmark.group = "bulk construction"
+    benchmark(churn)
+
+
+def test_array_from_strings(benchmark, strings):
+    benchmark.group = "bulk construction"
+    benchmark(MacAddressArray, strings)
+
+
+@mark.parametrize("name", ARRAY_PROPERTIES)
+def test_array_property(benchmark, values, name):
+    macs = MacAddressArray(values)
+    getter = getattr(MacAddressArray, name).fget
+
+    benchmark.group = "bulk properties"
+    benchmark(getter, macs)
+
+
+def test_array_to_fragments(benchmark, values):
+    macs = MacAddressArray(values)
+
+    benchmark.group = "bulk properties"
+    benchmark(macs.to_fragments)
+
+
+def test_bit_reverse_many(benchmark, values):
+    benchmark.group = "bulk properties"
+    benchmark(bit_reverse_many, values)
+
+
+def test_to_modified_eui64_many(benchmark, values):
+    benchmark.group = "bulk conversion"
+    benchmark(to_modified_eui64_many, values)
+
+
+def test_from_modified_eui64_many(benchmark, values):
+    interface_ids = to_modified_eui64_many(values)
+
+    benchmark.group = "bulk conversion"
+    benchmark(from_modified_eui64_many, interface_ids)
+
+
+def test_to_ipv6_many(benchmark, values):
+    benchmark.group = "bulk conversion"
+    benchmark(to_ipv6_many, values)
+
+
+def test_ipv4_multicast_many(benchmark, values):
+    groups = numpy.array(values, dtype=numpy.uint64) & 0x0FFFFFFF
+    groups |= 0xE0000000
+
+    benchmark.group = "bulk conversion"
+    benchmark(ipv4_multicast_many, groups)
+
+
+def test_ipv6_multicast_many(benchmark, values):
+    groups = [0xFF02 << 112 | value for value in values]
+
+    benchmark.group = "bulk conversion"
+    benchmark(ipv6_multicast_many, groups)
+
+
+def test_ipv4_groups_many(benchmark, values):
+    addresses = MacAddressArray(
+        [0x01005E000000 | value & 0x7FFFFF for value in values]
+    )
+
+    benchmark.group = "bulk conversion"
+    benchmark(ipv4_groups_many, addresses)
+
+
+def test_ipv6_groups_many(benchmark, values):
+    addresses = MacAddressArray(
+        [0x333300000000 | value & 0xFFFFFFFF for value in values]
+    )
+
+    benchmark.group = "bulk conversion"
+    benchmark(ipv6_groups_many, addresses)
+
+
+@mark.parametrize("notation", NOTATIONS)
+def test_format_many(benchmark, values, notation):
+    macs = MacAddressArray(values)
+
+    benchmark.group = "bulk formatting"
+    benchmark(format_many, macs, notation=notation)
+
+
+def test_cache_hit(benchmark):
+    cache = AddressCache()
+    cache(NOTATIONS["colon"])
+
+    benchmark.group = "cache"
+    benchmark(cache, NOTATIONS["colon"])
+
+
+def test_set_construction(benchmark, values):
+    benchmark.group = "sets"
+    benchmark(MacAddressSet, values)
+
+
+def test_set_contains(benchmark, values):
+    macs = MacAddressSet(values)
+
+    benchmark.group = "sets"
+    benchmark(macs.__contains__, values[len(values) // 2])
+
+
+@mark.parametrize(
+    "operation",
+    ["union", "intersection", "difference", "symmetric_difference"]
+)
+def test_set_algebra(benchmark, values, operation):
+    half = len(values) // 2
+    left = MacAddressSet(values[:half + half // 2])
+    right = MacAddressSet(values[half:])
+
+    benchmark.group = "sets"
+    benchmark(getattr(left, operation), right)
+
+
+def test_block_contains(benchmark):
+    block = MacAddressBlock("a0b1c2000000/24")
+
+    benchmark.group = "blocks"
+    benchmark(block.__contains__, 0xa0b1c2d3e4f5)
+
+
+def test_collapse_blocks(benchmark):
+    blocks = list(MacAddressBlock("a0b1c2000000/24").subnets(
+        new_prefix_length=36
+    ))
+
+    benchmark.group = "blocks"
+    benchmark(collapse_blocks, blocks)
+
+
+def test_registry_lookup_many(benchmark, values):
+    registry = Registry(
+        (format(value >> 24, "06x"), "Organization {}".format(index % 1000))
+        for index, value in enumerate(values[::10])
+    )
+
+    benchmark.group = "registry"
+    benchmark(registry.lookup_many, values)
+
+
+def test_pickle(benchmark, values):
+    macs = [MediaAccessControlAddress.from_int(value) for value in values]
+
+    benchmark.group = "transfer"
+    benchmark(lambda: loads(dumps(macs)))
+
+
+def test_pack_many(benchmark, values):
+    macs = [MediaAccessControlAddress.from_int(value) for value in values]
+
+    benchmark.group = "transfer"
+    benchmark(lambda: unpack_many(loads(dumps(pack_many(macs)))))
@@ -0,0 +1,110 @@
+from operator import attrgetter
+
+from pytest import (
+    mark,
+    raises
+)
+
+from macaddress import (
+    AddressError,
+    ExtendedIdentifier48,
+    IdentifierError,
+    MediaAccessControlAddress,
+    Octet,
+    OctetError
+)
+
+from inputs import (
+    INVALID,
+    INVALID_OCTET,
+    NOTATIONS
+)
+
+
+CLASSES = [
+    (ExtendedIdentifier48, IdentifierError),
+    (MediaAccessControlAddress, AddressError)
+]
+
+PROPERTIES = {
+    Octet: ["normalized", "decimal", "binary", "reverse_binary"],
+    ExtendedIdentifier48: [
+        "normalized",
+        "is_valid",
+        "octets",
+        "first_octet",
+        "type",
+        "has_oui",
+        "has_cid",
+        "decimal",
+        "binary",
+        "reverse_binary"
+    ],
+    MediaAccessControlAddress: [
+        "is_broadcast",
+        "is_multicast",
+        "is_unicast",
+        "is_uaa",
+        "is_laa"
+    ]
+}
+
+METHODS = [
+    "to_plain_notation",
+    "to_hyphen_notation",
+    "to_colon_notation",
+    "to_dot_notation",
+    "to_fragments",
+    "to_bytes"
+]
+
+
+@mark.parametrize("digits", ["A0", "a0"])
+def test_octet_construction(benchmark, digits):
+    benchmark.group = "construction"
+    benchmark(Octet, digits)
+
+
+@mark.parametrize("notation", NOTATIONS)
+@mark.parametrize("cls", [cls for cls, error in CLASSES], ids=str)
+def test_construction(benchmark, cls, notation):
+    benchmark.group = "construction"
+    benchmark(cls, NOTATIONS[notation])
+
+
+@mark.parametrize(
+    ("cls", "name"),
+    [(cls, name) for cls, names in PROPERTIES.items() for name in names],
+    ids=str
+)
+def test_property(benchmark, cls, name):
+    instance = cls("a0" if cls is Octet else NOTATIONS["colon"])
+    getter = attrgetter(name)
+
+    benchmark.group = "properties"
+    benchmark(getter, instance)
+
+
+@mark.parametrize("name", METHODS)
+def test_method(benchmark, name):
+    method = getattr(MediaAccessControlAddress(NOTATIONS["colon"]), name)
+
+    benchmark.group = "formatting"
+    benchmark(method)
+
+
+def reject(cls, error, identifier):
+    with raises(error):
+        cls(identifier)
+
+
+def test_octet_rejection(benchmark):
+    benchmark.group = "rejection"
+    benchmark(reject, Octet, OctetError, INVALID_OCTET)
+
+
+@mark.parametrize("reason", INVALID)
+@mark.parametrize(("cls", "error"), CLASSES, ids=str)
+def test_rejection(benchmark, cls, error, reason):
+    benchmark.group = "rejection"
+    benchmark(reject, cls, error, INVALID[reason])
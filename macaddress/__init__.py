@@ -14,7 +14,47 @@ __all__ = [
     "Octet",
     "IdentifierError",
     "AddressError",
-    "OctetError"
+    "OctetError",
+    "is_valid_address",
+    "try_parse",
+    "AddressCache",
+    "CacheInfo",
+    "MacAddressArray",
+    "MacAddressBlock",
+    "BlockError",
+    "collapse_blocks",
+    "bit_reverse_many",
+    "parse_many",
+    "pack_many",
+    "unpack_many",
+    "AddressPool",
+    "PoolError",
+    "read_pcap",
+    "PcapChunk",
+    "PcapError",
+    "extract",
+    "extract_file",
+    "to_modified_eui64_many",
+    "from_modified_eui64_many",
+    "to_ipv6_many",
+    "format_many",
+    "AddressGenerator",
+    "GeneratorError",
+    "stats",
+    "ingest_file",
+    "ipv4_multicast_many",
+    "ipv6_multicast_many",
+    "ipv4_groups_many",
+    "ipv6_groups_many",
+    "unpack_frames",
+    "Registry",
+    "CompiledRegistry",
+    "RegistryError",
+    "compile_registry",
+    "load_registry",
+    "lookup_vendor",
+    "lookup_vendors",
+    "MacAddressSet"
 ]
 
 
@@ -25,10 +65,87 @@ from .ei48 import (
 
 from .macaddress import (
     MediaAccessControlAddress,
-    AddressError
+    AddressError,
+    is_valid_address,
+    try_parse
 )
 
 from .octet import (
     Octet,
     OctetError
 )
+
+# The extract submodule shares its name with the extract function, so
+# it is imported with the package (its regular expressions are still
+# compiled on first use) to keep the function from being shadowed.
+
+from .extract import (
+    extract,
+    extract_file
+)
+
+# The submodule that defines each of the remaining names.  These
+# submodules (and NumPy, which several of them use) are imported
+# on first use rather than with the package.
+
+LAZY = {
+    "MacAddressArray": "array",
+    "MacAddressBlock": "block",
+    "BlockError": "block",
+    "collapse_blocks": "block",
+    "bit_reverse_many": "canonical",
+    "AddressCache": "cache",
+    "CacheInfo": "cache",
+    "to_modified_eui64_many": "eui64",
+    "from_modified_eui64_many": "eui64",
+    "to_ipv6_many": "eui64",
+    "format_many": "formatting",
+    "AddressGenerator": "generate",
+    "GeneratorError": "generate",
+    "unpack_frames": "frames",
+    "ingest_file": "ingest",
+    "ipv4_multicast_many": "multicast",
+    "ipv6_multicast_many": "multicast",
+    "ipv4_groups_many": "multicast",
+    "ipv6_groups_many": "multicast",
+    "stats": "instrument",
+    "parse_many": "parse",
+    "pack_many": "transfer",
+    "unpack_many": "transfer",
+    "AddressPool": "pool",
+    "PoolError": "pool",
+    "read_pcap": "pcap",
+    "PcapChunk": "pcap",
+    "PcapError": "pcap",
+    "Registry": "registry",
+    "CompiledRegistry": "registry",
+    "RegistryError": "registry",
+    "compile_registry": "registry",
+    "load_registry": "registry",
+    "lookup_vendor": "registry",
+    "lookup_vendors": "registry",
+    "MacAddressSet": "set"
+}
+
+
+def __getattr__(name):
+    # Import the submodule that defines a name on first access, then
+    # keep the name as an ordinary package attribute.
+
+    from importlib import import_module
+
+    if name in LAZY:
+        value = getattr(import_module("." + LAZY[name], __name__), name)
+    elif name in LAZY.values():
+        value = import_module("." + name, __name__)
+    else:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
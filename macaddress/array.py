@@ -0,0 +1,241 @@
+"""
+This module includes MacAddressArray.
+"""
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+from .ei48 import (
+    ELI_BITS,
+    ELI_MASK,
+    LOCAL_BIT,
+    MAX_VALUE,
+    MULTICAST_BIT,
+    UNIQUE_MASK
+)
+
+from .macaddress import (
+    AddressError,
+    MediaAccessControlAddress,
+    to_integer
+)
+
+from .octet import BIT_REVERSED
+
+
+def require_numpy():
+    # NumPy is an optional dependency, so fail with a helpful
+    # message when it is missing.
+
+    if numpy is None:
+        raise ImportError(
+            "MacAddressArray requires NumPy.  "
+            "Install it with `pip install macaddress[numpy]`."
+        )
+
+
+class MacAddressArray(object):
+    """
+    MacAddressArray makes it easy to work with many media access
+    control (MAC) addresses at once.
+
+    It stores each address as a 48-bit integer in a NumPy `uint64`
+    array and offers vectorized equivalents of the properties of
+    MediaAccessControlAddress, each of which returns a boolean
+    mask (or an array of strings in the case of `type`).
+
+    MacAddressArray requires NumPy.
+
+    Attributes
+    ----------
+    decimal : numpy.ndarray
+        The `uint64` array of addresses.
+
+    is_broadcast : numpy.ndarray
+        Whether each address is a broadcast address.
+
+    is_multicast : numpy.ndarray
+        Whether each address is a multicast address.
+
+    is_unicast : numpy.ndarray
+        Whether each address is a unicast address.
+
+    is_uaa : numpy.ndarray
+        Whether each address is a universally-administered
+        address (UAA).
+
+    is_laa : numpy.ndarray
+        Whether each address is a locally-administered
+        address (LAA).
+
+    type : numpy.ndarray
+        Each address's type, where type is unique, local,
+        or unknown.
+
+    has_oui : numpy.ndarray
+        Whether each address has an OUI.
+
+    has_cid : numpy.ndarray
+        Whether each address has a CID.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as strings in plain, hyphen, colon, or dot notation,
+        as integers, or as instances of ExtendedIdentifier48.  A NumPy
+        array of integers is used without conversion where possible.
+
+    Raises
+    ------
+    AddressError
+    ImportError
+    """
+
+    def __init__(self, addresses=()):
+        require_numpy()
+
+        if isinstance(addresses, MacAddressArray):
+            addresses = addresses.decimal
+
+        if isinstance(addresses, numpy.ndarray) and \
+                addresses.dtype.kind in "iu":
+            if addresses.size and (
+                addresses.min() < 0 or addresses.max() > MAX_VALUE
+            ):
+                raise AddressError("Pass in 48-bit integers.")
+
+            values = addresses.astype(numpy.uint64, copy=False)
+        else:
+            values = numpy.fromiter(
+                map(to_integer, addresses),
+                dtype=numpy.uint64
+            )
+
+        self._values = values.reshape(-1)
+
+    def __repr__(self):
+        return "MacAddressArray([{}])".format(
+            ", ".join(
+                "'{}'".format(format(int(value), "012x"))
+                for value in self._values
+            )
+        )
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        for value in self._values:
+            yield MediaAccessControlAddress._from_value(int(value))
+
+    def __getitem__(self, index):
+        selected = self._values[index]
+
+        if isinstance(selected, numpy.ndarray):
+            return MacAddressArray(selected)
+        else:
+            return MediaAccessControlAddress._from_value(int(selected))
+
+    def __array__(self, dtype=None, copy=None):
+        # Return the values themselves unless the caller asks for a
+        # copy or a different dtype, which NumPy forbids if copy is
+        # False.
+
+        if dtype is None or numpy.dtype(dtype) == self._values.dtype:
+            return self._values.copy() if copy else self._values
+
+        if copy is False:
+            raise ValueError("Pass in copy=True to convert the dtype.")
+
+        return self._values.astype(dtype)
+
+    @property
+    def decimal(self):
+        return self._values
+
+    @property
+    def is_broadcast(self):
+        return self._values == numpy.uint64(MAX_VALUE)
+
+    @property
+    def is_multicast(self):
+        # The least-significant bit in the first octet of a MAC address
+        # determines whether it is a multicast or a unicast.
+
+        return (self._values & numpy.uint64(MULTICAST_BIT)) != 0
+
+    @property
+    def is_unicast(self):
+        return (self._values & numpy.uint64(MULTICAST_BIT)) == 0
+
+    @property
+    def is_uaa(self):
+        # The second-least-significant bit in the first octet of a MAC
+        # address determines whether it is a UAA or an LAA.
+
+        mask = numpy.uint64(MULTICAST_BIT | LOCAL_BIT)
+        return (self._values & mask) == 0
+
+    @property
+    def is_laa(self):
+        # The second-least-significant bit in the first octet of a MAC
+        # address determines whether it is a UAA or an LAA.
+
+        mask = numpy.uint64(MULTICAST_BIT | LOCAL_BIT)
+        return (self._values & mask) == numpy.uint64(LOCAL_BIT)
+
+    @property
+    def has_oui(self):
+        return (self._values & numpy.uint64(UNIQUE_MASK)) == 0
+
+    @property
+    def has_cid(self):
+        mask = numpy.uint64(ELI_MASK)
+        return (self._values & mask) == numpy.uint64(ELI_BITS)
+
+    @property
+    def type(self):
+        return numpy.where(
+            self.has_oui,
+            "unique",
+            numpy.where(self.has_cid, "local", "unknown")
+        )
+
+    def bit_reverse(self):
+        """
+        Returns a new MacAddressArray with the bits of each octet of
+        each address reversed, converting between canonical (Ethernet)
+        and bit-reversed (Token Ring and FDDI) order.
+        """
+
+        # Reversing the bits of each byte leaves the bytes in place,
+        # so look up every byte of the `uint64` values at once,
+        # whatever the byte order.  The two unused bytes stay zero.
+
+        table = numpy.frombuffer(BIT_REVERSED, dtype=numpy.uint8)
+        octets = numpy.ascontiguousarray(self._values).view(numpy.uint8)
+        return MacAddressArray(table[octets].view(numpy.uint64))
+
+    def to_fragments(self, bits=24):
+        """
+        Returns each address's two "fragments" as two `uint64` arrays.
+
+        For example, if the array contains `A0-B1-C2-D3-E4-F5` and
+        the user calls this method with either `bits=24` or no keyword
+        argument, then MacAddressArray will return `([0xa0b1c2],
+        [0xd3e4f5])`.
+
+        Parameters
+        ----------
+        bits : int
+            The number of bits for the OUI or CID.
+
+            The default value is 24.
+        """
+
+        shift = numpy.uint64(48 - bits)
+        prefixes = self._values >> shift
+        suffixes = self._values & numpy.uint64((1 << (48 - bits)) - 1)
+        return (prefixes, suffixes)
@@ -0,0 +1,340 @@
+"""
+This module includes MacAddressBlock, BlockError, and collapse_blocks.
+"""
+
+from .ei48 import MAX_VALUE
+
+from .macaddress import (
+    AddressError,
+    MediaAccessControlAddress,
+    to_integer
+)
+
+
+class BlockError(Exception):
+    """
+    MacAddressBlock raises BlockError if instantiated with an invalid
+    argument.
+
+    Arguments
+    ---------
+    message : str
+        A human-readable error message.
+    """
+
+    pass
+
+
+class MacAddressBlock(object):
+    """
+    MacAddressBlock makes it easy to work with a block of media access
+    control (MAC) addresses that share a prefix (for example, all
+    of the addresses with a given 24-bit OUI, 28-bit MA-M assignment,
+    or 36-bit MA-S assignment).
+
+    Like `ipaddress.ip_network`, MacAddressBlock never builds its
+    addresses up front.  Membership tests are arithmetic, and
+    iteration is lazy, as is slicing (which returns a generator).
+    Blocks compare and sort by base address, then prefix length.
+
+    Attributes
+    ----------
+    base : MediaAccessControlAddress
+        The block's first address.
+
+    last : MediaAccessControlAddress
+        The block's last address.
+
+    prefix_length : int
+        The number of bits in the block's prefix (0 to 48).
+
+    num_addresses : int
+        The number of addresses in the block.
+
+    Parameters
+    ----------
+    address : str, int, or ExtendedIdentifier48
+        The block's base address.  A string may also carry the prefix
+        length after a slash (for example, `a0:b1:c2:00:00:00/24`).
+
+    prefix_length : int
+        The number of bits in the block's prefix.
+
+        The default value is 24 (or the prefix length after the slash).
+
+    strict : bool
+        Whether to raise BlockError if the base address has bits
+        set beyond the prefix.  If False, then those bits are cleared.
+
+        The default value is True.
+
+    Raises
+    ------
+    BlockError
+    """
+
+    __slots__ = ("_first", "_prefix_length")
+
+    def __init__(self, address, prefix_length=None, strict=True):
+        if isinstance(address, str) and "/" in address:
+            if prefix_length is not None:
+                raise BlockError("Pass in one prefix length.")
+
+            address, prefix_length = address.split("/", 1)
+
+            try:
+                prefix_length = int(prefix_length)
+            except ValueError:
+                raise BlockError("Pass in a prefix length from 0 to 48.")
+
+        if prefix_length is None:
+            prefix_length = 24
+
+        if not isinstance(prefix_length, int) or \
+                not 0 <= prefix_length <= 48:
+            raise BlockError("Pass in a prefix length from 0 to 48.")
+
+        try:
+            value = to_integer(address)
+        except AddressError:
+            raise BlockError("Pass in a valid base address.")
+
+        first = value & ~host_mask(prefix_length) & MAX_VALUE
+
+        if strict and first != value:
+            raise BlockError("Pass in a base address without host bits.")
+
+        self._first = first
+        self._prefix_length = prefix_length
+
+    @classmethod
+    def _from_integers(cls, first, prefix_length):
+        instance = cls.__new__(cls)
+        instance._first = first
+        instance._prefix_length = prefix_length
+        return instance
+
+    def __repr__(self):
+        return "MacAddressBlock('{}')".format(self)
+
+    def __str__(self):
+        return "{}/{}".format(format(self._first, "012x"), self._prefix_length)
+
+    def __eq__(self, other):
+        if not isinstance(other, MacAddressBlock):
+            return NotImplemented
+
+        return self._key() == other._key()
+
+    def __lt__(self, other):
+        if not isinstance(other, MacAddressBlock):
+            return NotImplemented
+
+        return self._key() < other._key()
+
+    def __le__(self, other):
+        if not isinstance(other, MacAddressBlock):
+            return NotImplemented
+
+        return self._key() <= other._key()
+
+    def __gt__(self, other):
+        if not isinstance(other, MacAddressBlock):
+            return NotImplemented
+
+        return self._key() > other._key()
+
+    def __ge__(self, other):
+        if not isinstance(other, MacAddressBlock):
+            return NotImplemented
+
+        return self._key() >= other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def _key(self):
+        return (self._first, self._prefix_length)
+
+    def __contains__(self, address):
+        if isinstance(address, MacAddressBlock):
+            return address._prefix_length >= self._prefix_length and \
+                address._first >> self._shift == self._first >> self._shift
+
+        try:
+            value = to_integer(address)
+        except AddressError:
+            return False
+
+        return value >> self._shift == self._first >> self._shift
+
+    def __iter__(self):
+        for value in self.values():
+            yield MediaAccessControlAddress._from_value(value)
+
+    def __getitem__(self, index):
+        values = self.values()
+
+        # A block may hold up to 2 ** 48 addresses, so a slice yields
+        # its addresses one at a time rather than building a list.
+
+        if isinstance(index, slice):
+            return (
+                MediaAccessControlAddress._from_value(value)
+                for value in values[index]
+            )
+
+        return MediaAccessControlAddress._from_value(values[index])
+
+    @property
+    def _shift(self):
+        return 48 - self._prefix_length
+
+    @property
+    def base(self):
+        return MediaAccessControlAddress._from_value(self._first)
+
+    @property
+    def last(self):
+        return MediaAccessControlAddress._from_value(self._last)
+
+    @property
+    def _last(self):
+        return self._first | host_mask(self._prefix_length)
+
+    @property
+    def prefix_length(self):
+        return self._prefix_length
+
+    @property
+    def num_addresses(self):
+        return 1 << self._shift
+
+    def values(self):
+        """
+        Returns the block's addresses as a `range` of integers,
+        which supports fast membership tests, indexing, and slicing
+        without building any addresses.
+        """
+
+        return range(self._first, self._last + 1)
+
+    def subnets(self, prefix_length_diff=1, new_prefix_length=None):
+        """
+        Yields the blocks that make up this block.
+
+        Parameters
+        ----------
+        prefix_length_diff : int
+            How many bits longer the new prefix should be.
+
+            The default value is 1.
+
+        new_prefix_length : int
+            The new prefix length.  If set, then it takes precedence
+            over prefix_length_diff.
+
+        Raises
+        ------
+        BlockError
+        """
+
+        if new_prefix_length is None:
+            new_prefix_length = self._prefix_length + prefix_length_diff
+
+        if not self._prefix_length <= new_prefix_length <= 48:
+            raise BlockError(
+                "Pass in a prefix length from {} to 48.".format(
+                    self._prefix_length
+                )
+            )
+
+        step = 1 << (48 - new_prefix_length)
+
+        for first in range(self._first, self._last + 1, step):
+            yield self._from_integers(first, new_prefix_length)
+
+    def supernet(self, prefix_length_diff=1, new_prefix_length=None):
+        """
+        Returns the block that contains this block.
+
+        Parameters
+        ----------
+        prefix_length_diff : int
+            How many bits shorter the new prefix should be.
+
+            The default value is 1.
+
+        new_prefix_length : int
+            The new prefix length.  If set, then it takes precedence
+            over prefix_length_diff.
+
+        Raises
+        ------
+        BlockError
+        """
+
+        if new_prefix_length is None:
+            new_prefix_length = self._prefix_length - prefix_length_diff
+
+        if not 0 <= new_prefix_length <= self._prefix_length:
+            raise BlockError(
+                "Pass in a prefix length from 0 to {}.".format(
+                    self._prefix_length
+                )
+            )
+
+        return MacAddressBlock(self._first, new_prefix_length, strict=False)
+
+
+def host_mask(prefix_length):
+    # The bits beyond the prefix.
+
+    return (1 << (48 - prefix_length)) - 1
+
+
+def collapse_blocks(blocks):
+    """
+    Returns the fewest blocks that cover exactly the same addresses
+    as the blocks passed in by the user, merging blocks that overlap
+    or sit next to each other.
+
+    For example, if the user passes in `a0b1c2000000/25` and
+    `a0b1c2800000/25`, then collapse_blocks will return
+    `[a0b1c2000000/24]`.
+
+    Parameters
+    ----------
+    blocks : iterable
+        Instances of MacAddressBlock.
+    """
+
+    ranges = sorted((block._first, block._last) for block in blocks)
+    merged = []
+
+    # Merge ranges that overlap or sit next to each other.
+
+    for first, last in ranges:
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+
+    # Split each merged range into the largest aligned blocks.
+
+    collapsed = []
+
+    for first, last in merged:
+        while first <= last:
+            size = first & -first if first else 1 << 48
+
+            while size > last - first + 1:
+                size >>= 1
+
+            prefix_length = 48 - (size.bit_length() - 1)
+            collapsed.append(
+                MacAddressBlock._from_integers(first, prefix_length)
+            )
+            first += size
+
+    return collapsed
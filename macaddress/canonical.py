@@ -0,0 +1,53 @@
+"""
+This module includes bit_reverse_many.
+"""
+
+from array import array
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .macaddress import to_integer
+
+from .octet import BIT_REVERSED
+
+
+def bit_reverse_many(addresses):
+    """
+    Returns many MAC addresses with the bits of each octet reversed,
+    converting between canonical (Ethernet) and bit-reversed (Token
+    Ring and FDDI) order.
+
+    Each octet is reversed through a 256-entry lookup table.  If NumPy
+    is installed, then the addresses come back as a MacAddressArray.
+    Otherwise, they come back as an `array.array` of type `Q`, which
+    is reversed with a single call to `bytes.translate`.
+
+    For example, if the user passes in `[0xa0b1c2d3e4f5]`, then
+    bit_reverse_many will return `[0x058d43cb27af]`.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if numpy is not None:
+        return MacAddressArray(addresses).bit_reverse()
+
+    # Reversing the bits of each byte leaves the bytes in place, so
+    # translate every byte of the packed values at once, whatever the
+    # byte order.  The two unused bytes of each value stay zero.
+
+    values = array("Q", map(to_integer, addresses))
+    reversed_values = array("Q")
+    reversed_values.frombytes(values.tobytes().translate(BIT_REVERSED))
+    return reversed_values
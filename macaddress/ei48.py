@@ -2,20 +2,188 @@
 This module includes ExtendedIdentifier48 and IdentifierError.
 """
 
-from functools import reduce
+from .octet import (
+    BIT_REVERSED,
+    HEX_DIGITS,
+    OCTETS,
+    REVERSE_BINARY
+)
 
-import re
 
-from .octet import Octet
+# The patterns for plain, hyphen, colon, and dot notation.
 
+NOTATIONS = {
+    "plain": "[0-9A-Fa-f]{12}",
+    "hyphen": "([0-9A-Fa-f]{2}[-]{1}){5}[0-9A-Fa-f]{2}",
+    "colon": "([0-9A-Fa-f]{2}[:]{1}){5}[0-9A-Fa-f]{2}",
+    "dot": "([0-9A-Fa-f]{4}[.]{1}){2}[0-9A-Fa-f]{4}"
+}
 
-PLAIN = re.compile("^[0-9A-Fa-f]{12}$")
-HYPHEN = re.compile("^([0-9A-Fa-f]{2}[-]{1}){5}[0-9A-Fa-f]{2}$")
-COLON = re.compile("^([0-9A-Fa-f]{2}[:]{1}){5}[0-9A-Fa-f]{2}$")
-DOT = re.compile("^([0-9A-Fa-f]{4}[.]{1}){2}[0-9A-Fa-f]{4}$")
-NOT_DIGITS = re.compile("[^0-9A-Fa-f]")
-TWO_DIGITS = re.compile("[0-9a-f]{2}")
-FOUR_DIGITS = re.compile("[0-9a-f]{4}")
+# The regular expressions built from these patterns.  Importing
+# the re module and compiling a pattern are deferred until first
+# use to keep importing this module cheap.
+
+PATTERNS = {
+    "PLAIN": "^{}$".format(NOTATIONS["plain"]),
+    "HYPHEN": "^{}$".format(NOTATIONS["hyphen"]),
+    "COLON": "^{}$".format(NOTATIONS["colon"]),
+    "DOT": "^{}$".format(NOTATIONS["dot"]),
+    "NOT_DIGITS": "[^0-9A-Fa-f]",
+    "TWO_DIGITS": "[0-9a-f]{2}",
+    "FOUR_DIGITS": "[0-9a-f]{4}",
+
+    # Match any of the four notations in a single pass.
+
+    "IDENTIFIER": "^(?:{})$".format("|".join(NOTATIONS.values()))
+}
+
+# The separator for each of IDENTIFIER's groups, by group number.
+
+SEPARATORS = (None, "-", ":", ".")
+
+# Bit masks for the packed, 48-bit integer value of an identifier.
+# The first octet occupies the eight most-significant bits.
+
+FIRST_OCTET_SHIFT = 40
+MULTICAST_BIT = 0x01 << FIRST_OCTET_SHIFT
+LOCAL_BIT = 0x02 << FIRST_OCTET_SHIFT
+UNIQUE_MASK = 0x03 << FIRST_OCTET_SHIFT
+ELI_MASK = 0x0F << FIRST_OCTET_SHIFT
+ELI_BITS = 0x0A << FIRST_OCTET_SHIFT
+MAX_VALUE = 0xFFFFFFFFFFFF
+
+
+def compile_pattern(name, patterns=PATTERNS, namespace=None):
+    """
+    Returns the compiled regular expression for one of the names in
+    a module's patterns, compiling it and caching it as an attribute
+    of that module on first use.
+
+    Each module with deferred patterns calls compile_pattern from its
+    module-level `__getattr__`, which raises AttributeError for any
+    name that is not one of its patterns.
+
+    Parameters
+    ----------
+    name : str
+        The name of the pattern, such as `IDENTIFIER`.
+
+    patterns : dict
+        The module's patterns by name.
+
+        The default value is PATTERNS.
+
+    namespace : dict or None
+        The module's globals, or None for this module's globals.
+
+        The default value is None.
+
+    Raises
+    ------
+    AttributeError
+    """
+
+    if namespace is None:
+        namespace = globals()
+
+    pattern = namespace.get(name)
+
+    if pattern is None:
+        if name not in patterns:
+            raise AttributeError(
+                "module {!r} has no attribute {!r}".format(
+                    namespace["__name__"],
+                    name
+                )
+            )
+
+        import re
+
+        pattern = namespace[name] = re.compile(patterns[name])
+
+    return pattern
+
+
+def __getattr__(name):
+    # Compile a pattern the first time someone asks for it.
+
+    return compile_pattern(name)
+
+
+def match_identifier(identifier):
+    """
+    Returns the match object for an identifier in any of the four
+    notations, or None if the identifier is invalid.
+
+    The first call compiles IDENTIFIER and replaces this function
+    with the compiled pattern's match method.
+
+    Parameters
+    ----------
+    identifier : str
+        Twelve hexadecimal digits (0-9, A-F, or a-f).
+    """
+
+    global match_identifier
+
+    match_identifier = compile_pattern("IDENTIFIER").match
+    return match_identifier(identifier)
+
+
+def parse_integer(identifier):
+    """
+    Returns the 48-bit integer equivalent of a hexadecimal identifier
+    in plain, hyphen, colon, or dot notation, or None if the identifier
+    is invalid.
+
+    Unlike ExtendedIdentifier48, this function never raises, so it
+    suits bulk validation of untrusted input.
+
+    Parameters
+    ----------
+    identifier : str
+        Twelve hexadecimal digits (0-9, A-F, or a-f).
+    """
+
+    if not isinstance(identifier, str):
+        return None
+
+    match = match_identifier(identifier)
+
+    if match is None:
+        return None
+
+    # Only hyphen, colon, and dot notation match a group.
+
+    if match.lastindex is None:
+        return int(identifier, base=16)
+
+    separator = SEPARATORS[match.lastindex]
+    return int(identifier.replace(separator, ""), base=16)
+
+
+def restore(cls, value, original=None):
+    """
+    Returns an instance of ExtendedIdentifier48 (or a subclass) from
+    its 48-bit integer equivalent without validating it, as pickle
+    does when it loads an instance.
+
+    Parameters
+    ----------
+    cls : type
+        ExtendedIdentifier48 or a subclass.
+
+    value : int
+        A 48-bit integer.
+
+    original : str or None
+        The hexadecimal identifier passed in by the user, or None if
+        it was in plain notation.
+
+        The default value is None.
+    """
+
+    return cls._from_value(value, original)
 
 
 class IdentifierError(Exception):
@@ -117,6 +285,11 @@ class ExtendedIdentifier48(object):
         then ExtendedIdentifier48 will return
         `000001011000110101000011110010110010011110101111`.
 
+    Instances compare, hash, and sort by their 48-bit integer values,
+    so `a0b1c2d3e4f5` and `A0-B1-C2-D3-E4-F5` are equal and may stand
+    in for each other as dictionary keys.  `int()`, `hex()`, and
+    other integer operations also use that value.
+
     Parameters
     ----------
     identifier : str
@@ -127,50 +300,213 @@ class ExtendedIdentifier48(object):
     IdentifierError
     """
 
+    # Parse the hexadecimal identifier once into a 48-bit integer.
+    # Every other property derives from that integer.  Instances are
+    # immutable, since caches share them and they hash by that integer.
+
+    __slots__ = ("original", "_value", "__weakref__")
+
     def __init__(self, identifier):
-        self.original = identifier
+        value = parse_integer(identifier)
 
-        if not self.is_valid:
+        if value is None:
             raise IdentifierError("Pass in 12 hexadecimal digits.")
 
+        object.__setattr__(self, "original", identifier)
+        object.__setattr__(self, "_value", value)
+
+    @classmethod
+    def _from_value(cls, value, original=None):
+        # Skip validation for a 48-bit integer that is known to be
+        # valid, recording it in plain notation as the original
+        # unless the caller already has the original.
+
+        if original is None:
+            original = format(value, "012x")
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "original", original)
+        object.__setattr__(instance, "_value", value)
+        return instance
+
+    @classmethod
+    def from_int(cls, value):
+        """
+        Returns an instance from the 48-bit integer equivalent of
+        an identifier, without parsing any hexadecimal digits.
+
+        For example, if the user passes in `176685338322165`, then
+        from_int will return `ExtendedIdentifier48('a0b1c2d3e4f5')`.
+
+        Parameters
+        ----------
+        value : int
+            A 48-bit integer.
+
+        Raises
+        ------
+        IdentifierError
+        """
+
+        if not isinstance(value, int) or not 0 <= value <= MAX_VALUE:
+            raise IdentifierError("Pass in a 48-bit integer.")
+
+        return cls._from_value(int(value))
+
+    @classmethod
+    def from_trusted(cls, identifier):
+        """
+        Returns an instance from a hexadecimal identifier in plain,
+        hyphen, colon, or dot notation without validating it.
+
+        Use from_trusted only for identifiers that were validated
+        upstream (for example, identifiers read back from your own
+        database).  The result for an invalid identifier is
+        unspecified, and it may raise ValueError.
+
+        Parameters
+        ----------
+        identifier : str
+            Twelve hexadecimal digits (0-9, A-F, or a-f).
+        """
+
+        # The length of the identifier gives away its notation, and
+        # the third character is the separator in hyphen and colon
+        # notation.
+
+        length = len(identifier)
+
+        if length == 12:
+            digits = identifier
+        elif length == 14:
+            digits = identifier.replace(".", "")
+        else:
+            digits = identifier.replace(identifier[2], "")
+
+        return cls._from_value(int(digits, base=16), identifier)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Returns an instance from the six bytes of an identifier, most-
+        significant byte first (as in an Ethernet header).
+
+        For example, if the user passes in
+        `b"\\xa0\\xb1\\xc2\\xd3\\xe4\\xf5"`, then from_bytes will return
+        `ExtendedIdentifier48('a0b1c2d3e4f5')`.
+
+        Parameters
+        ----------
+        data : bytes-like object
+            Six bytes.
+
+        Raises
+        ------
+        IdentifierError
+        """
+
+        if len(data) != 6:
+            raise IdentifierError("Pass in six bytes.")
+
+        return cls._from_value(int.from_bytes(data, "big"))
+
+    def __reduce__(self):
+        # Pickle the 48-bit integer rather than the slots, and the
+        # original only if it was not in plain notation, so that
+        # unpickling skips validation.
+
+        if self.original == format(self._value, "012x"):
+            return (restore, (type(self), self._value))
+
+        return (restore, (type(self), self._value, self.original))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "{} is immutable.".format(type(self).__name__)
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(
+            "{} is immutable.".format(type(self).__name__)
+        )
+
     def __repr__(self):
         return "ExtendedIdentifier48('{}')".format(self.original)
 
     def __str__(self):
         return self.normalized
 
+    def __eq__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value == other._value
+
+    def __ne__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value != other._value
+
+    def __lt__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value < other._value
+
+    def __le__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value <= other._value
+
+    def __gt__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value > other._value
+
+    def __ge__(self, other):
+        if not isinstance(other, ExtendedIdentifier48):
+            return NotImplemented
+
+        return self._value >= other._value
+
+    def __hash__(self):
+        # A 48-bit integer hashes to itself, so there is nothing
+        # to gain from storing the hash separately.
+
+        return hash(self._value)
+
+    def __int__(self):
+        return self._value
+
+    def __index__(self):
+        return self._value
+
     @property
     def is_valid(self):
         # Evaluate the hexadecimal identifier.
         # It must contain 12 hexadecimal digits, and it may
         # be in plain, hyphen, colon, or dot notation.
 
-        if PLAIN.match(self.original):
-            return True
-        elif HYPHEN.match(self.original):
-            return True
-        elif COLON.match(self.original):
-            return True
-        elif DOT.match(self.original):
-            return True
-        else:
-            return False
+        return bool(match_identifier(self.original))
 
     @property
     def normalized(self):
-        return NOT_DIGITS.sub("", self.original.lower())
+        return format(self._value, "012x")
 
     @property
     def octets(self):
-        # Create one instance of Octet for each of the
+        # Look up the shared instance of Octet for each of the
         # hexadecimal identifier's six octets.
 
-        matches = TWO_DIGITS.findall(self.normalized)
-        return [Octet(match) for match in matches]
+        octets = self._value.to_bytes(6, "big")
+        return [OCTETS[octet] for octet in octets]
 
     @property
     def first_octet(self):
-        return self.octets[0]
+        return OCTETS[self._value >> FIRST_OCTET_SHIFT]
 
     @property
     def type(self):
@@ -180,9 +516,9 @@ class ExtendedIdentifier48(object):
         # The four least-signficant bits in the first octet of
         # an extended identifier determine whether it is an ELI.
 
-        if self.first_octet.binary[6:] == "00":
+        if not self._value & UNIQUE_MASK:
             return "unique"
-        elif self.first_octet.binary[4:] == "1010":
+        elif self._value & ELI_MASK == ELI_BITS:
             return "local"
         else:
             return "unknown"
@@ -191,27 +527,52 @@ class ExtendedIdentifier48(object):
     def has_oui(self):
         # If the hexadecimal identifier is an EUI, then it has an OUI.
 
-        return self.type == "unique"
+        return not self._value & UNIQUE_MASK
 
     @property
     def has_cid(self):
         # If the hexadecimal identifier is an ELI, then it has a CID.
 
-        return self.type == "local"
+        return self._value & ELI_MASK == ELI_BITS
 
     @property
     def decimal(self):
-        return int(self.normalized, base=16)
+        return self._value
 
     @property
     def binary(self):
-        binaries = map(lambda x: x.binary, self.octets)
-        return reduce(lambda x, y: x + y, binaries)
+        return format(self._value, "048b")
 
     @property
     def reverse_binary(self):
-        reverse_binaries = map(lambda x: x.reverse_binary, self.octets)
-        return reduce(lambda x, y: x + y, reverse_binaries)
+        # Concatenate each octet's reverse-binary digits from the
+        # table rather than creating six instances of Octet.
+
+        octets = self._value.to_bytes(6, "big")
+        return "".join([REVERSE_BINARY[octet] for octet in octets])
+
+    def bit_reverse(self):
+        """
+        Returns a new instance with the bits of each octet reversed,
+        converting between canonical (Ethernet) and bit-reversed
+        (Token Ring and FDDI) order.
+
+        For example, if the user passes in `A0-B1-C2-D3-E4-F5`,
+        then bit_reverse will return
+        `ExtendedIdentifier48('058d43cb27af')`.
+        """
+
+        data = self._value.to_bytes(6, "big").translate(BIT_REVERSED)
+        return self._from_value(int.from_bytes(data, "big"))
+
+    def to_bytes(self):
+        """
+        Returns the hexadecimal identifier as six bytes, most-
+        significant byte first (for example,
+        `b"\\xa0\\xb1\\xc2\\xd3\\xe4\\xf5"`).
+        """
+
+        return self._value.to_bytes(6, "big")
 
     def to_fragments(self, bits=24):
         """
@@ -258,8 +619,8 @@ class ExtendedIdentifier48(object):
         (for example, `a0-b1-c2-d3-e4-f5`).
         """
 
-        matches = TWO_DIGITS.findall(self.normalized)
-        return "-".join(matches)
+        octets = self._value.to_bytes(6, "big")
+        return "-".join([HEX_DIGITS[octet] for octet in octets])
 
     def to_colon_notation(self):
         """
@@ -267,8 +628,8 @@ class ExtendedIdentifier48(object):
         (for example, `a0:b1:c2:d3:e4:f5`).
         """
 
-        matches = TWO_DIGITS.findall(self.normalized)
-        return ":".join(matches)
+        octets = self._value.to_bytes(6, "big")
+        return ":".join([HEX_DIGITS[octet] for octet in octets])
 
     def to_dot_notation(self):
         """
@@ -276,5 +637,6 @@ class ExtendedIdentifier48(object):
         (for example, `a0b1.c2d3.e4f5`).
         """
 
-        matches = FOUR_DIGITS.findall(self.normalized)
-        return ".".join(matches)
+        octets = self._value.to_bytes(6, "big")
+        digits = [HEX_DIGITS[octet] for octet in octets]
+        return "{}{}.{}{}.{}{}".format(*digits)
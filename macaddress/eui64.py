@@ -0,0 +1,193 @@
+"""
+This module includes to_modified_eui64_many, from_modified_eui64_many,
+and to_ipv6_many.
+"""
+
+from array import array
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .ei48 import LOCAL_BIT
+
+from .macaddress import (
+    AddressError,
+    INTERFACE_ID_FILLER,
+    INTERFACE_ID_FILLER_MASK,
+    INTERFACE_ID_LOCAL_BIT,
+    SUFFIX_MASK,
+    as_interface_id,
+    from_interface_id,
+    prefix_to_integer,
+    to_integer,
+    to_interface_id
+)
+
+from .parse import (
+    ERRORS,
+    convert_many
+)
+
+
+def to_modified_eui64_many(addresses):
+    """
+    Returns the modified EUI-64 interface ID of each of many MAC
+    addresses.
+
+    If NumPy is installed, then the interface IDs come back as a
+    `uint64` array computed with vectorized arithmetic.  Otherwise,
+    they come back as an `array.array` of type `Q`.
+
+    For example, if the user passes in `[0xa0b1c2d3e4f5]`, then
+    to_modified_eui64_many will return `[0xa2b1c2fffed3e4f5]`.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if numpy is None:
+        return array("Q", map(to_interface_id, map(to_integer, addresses)))
+
+    values = MacAddressArray(addresses).decimal
+
+    interface_ids = (values >> numpy.uint64(24)) << numpy.uint64(40)
+    interface_ids |= values & numpy.uint64(SUFFIX_MASK)
+    interface_ids |= numpy.uint64(INTERFACE_ID_FILLER)
+    interface_ids ^= numpy.uint64(INTERFACE_ID_LOCAL_BIT)
+    return interface_ids
+
+
+def from_modified_eui64_many(interface_ids, errors="raise"):
+    """
+    Returns the MAC addresses from which many modified EUI-64
+    interface IDs were derived, along with a validity mask, as
+    parse_many does.
+
+    An interface ID is valid if it has `fffe` in its middle two
+    octets, as every interface ID derived from a MAC address does.
+
+    Parameters
+    ----------
+    interface_ids : iterable
+        Interface IDs as 64-bit integers (including a NumPy array of
+        integers) or as `ipaddress.IPv6Address` objects, whose last
+        64 bits are the interface ID.
+
+    errors : str
+        What to do with an invalid interface ID, where errors is
+        raise, skip, or mask, as with parse_many.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    if numpy is None:
+        return convert_many(
+            interface_ids,
+            interface_id_to_integer,
+            errors,
+            "Pass in a modified EUI-64 interface ID (item {})."
+        )
+
+    if isinstance(interface_ids, numpy.ndarray) and \
+            interface_ids.dtype.kind in "iu":
+        if interface_ids.dtype.kind == "i":
+            in_range = interface_ids.reshape(-1) >= 0
+        else:
+            in_range = True
+
+        interface_ids = interface_ids.reshape(-1).astype(numpy.uint64)
+    else:
+        interface_ids = [as_interface_id(item) for item in interface_ids]
+        in_range = numpy.array(
+            [item is not None for item in interface_ids],
+            dtype=numpy.bool_
+        )
+        interface_ids = numpy.array(
+            [item or 0 for item in interface_ids],
+            dtype=numpy.uint64
+        )
+
+    filler = interface_ids & numpy.uint64(INTERFACE_ID_FILLER_MASK)
+    mask = (filler == numpy.uint64(INTERFACE_ID_FILLER)) & in_range
+
+    if errors == "raise" and not mask.all():
+        raise AddressError(
+            "Pass in a modified EUI-64 interface ID (item {}).".format(
+                int(numpy.argmin(mask))
+            )
+        )
+
+    values = (interface_ids >> numpy.uint64(40)) << numpy.uint64(24)
+    values |= interface_ids & numpy.uint64(SUFFIX_MASK)
+    values ^= numpy.uint64(LOCAL_BIT)
+
+    if errors == "skip":
+        values = values[mask]
+    elif errors == "mask":
+        values[~mask] = 0
+
+    return (MacAddressArray(values), mask)
+
+
+def to_ipv6_many(addresses, prefix="fe80::/64"):
+    """
+    Returns the IPv6 addresses that SLAAC derives from many MAC
+    addresses and a 64-bit prefix, as a list of
+    `ipaddress.IPv6Address` objects.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    prefix : str or ipaddress.IPv6Network
+        The /64 prefix.
+
+        The default value is `fe80::/64`.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    import ipaddress
+
+    high = prefix_to_integer(prefix)
+    interface_ids = to_modified_eui64_many(addresses)
+
+    return [
+        ipaddress.IPv6Address(high | interface_id)
+        for interface_id in interface_ids.tolist()
+    ]
+
+
+def interface_id_to_integer(item):
+    # Return the 48-bit integer for one interface ID, or None if it
+    # is invalid.
+
+    interface_id = as_interface_id(item)
+
+    if interface_id is None:
+        return None
+
+    return from_interface_id(interface_id)
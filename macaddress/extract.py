@@ -0,0 +1,101 @@
+"""
+This module includes extract and extract_file.
+"""
+
+import mmap
+
+from .ei48 import (
+    NOTATIONS,
+    compile_pattern
+)
+
+
+# Match any of the four notations, but only where the match is not
+# part of a longer run of hexadecimal digits and separators (for
+# example, an IPv6 address or a seven-octet identifier).
+
+BOUNDED = "".join(
+    [
+        "(?<![0-9A-Fa-f])(?<![0-9A-Fa-f][-:.])",
+        "(?:{})".format("|".join(NOTATIONS.values())),
+        "(?![0-9A-Fa-f])(?![-:.][0-9A-Fa-f])"
+    ]
+)
+
+# TEXT and BYTES, the compiled forms of BOUNDED, are compiled on
+# first use to keep importing this module cheap.
+
+PATTERNS = {
+    "TEXT": BOUNDED,
+    "BYTES": BOUNDED.encode("ascii")
+}
+
+TEXT_SEPARATORS = str.maketrans("", "", "-:.")
+BYTES_SEPARATORS = b"-:."
+
+
+def __getattr__(name):
+    # Compile a pattern the first time someone asks for it.
+
+    return compile_pattern(name, PATTERNS, globals())
+
+
+def extract(buffer):
+    """
+    Yields every hexadecimal identifier found in a buffer as a tuple
+    of its offset and its 48-bit integer equivalent.
+
+    The identifiers may be in plain, hyphen, colon, or dot notation,
+    and they may appear anywhere in the buffer (for example, in the
+    middle of a log line).
+
+    The buffer may be a `str` or any bytes-like object, including
+    an `mmap.mmap`.  Bytes-like buffers are scanned without decoding,
+    and their offsets are byte offsets.
+
+    For example, if the user passes in `b"lease a0:b1:c2:d3:e4:f5"`,
+    then extract will yield `(6, 176685338322165)`.
+
+    Parameters
+    ----------
+    buffer : str or bytes-like object
+        The text to scan.
+    """
+
+    if isinstance(buffer, str):
+        pattern = compile_pattern("TEXT", PATTERNS, globals())
+
+        def strip(digits):
+            return digits.translate(TEXT_SEPARATORS)
+    else:
+        pattern = compile_pattern("BYTES", PATTERNS, globals())
+
+        def strip(digits):
+            return digits.translate(None, BYTES_SEPARATORS)
+
+    for match in pattern.finditer(buffer):
+        yield (match.start(), int(strip(match.group()), base=16))
+
+
+def extract_file(path):
+    """
+    Yields every hexadecimal identifier found in a file as a tuple
+    of its byte offset and its 48-bit integer equivalent.
+
+    The file is memory-mapped rather than read, so its size is not
+    limited by available memory.
+
+    Parameters
+    ----------
+    path : str or path-like object
+        The file to scan.
+    """
+
+    with open(path, "rb") as file:
+        # An empty file cannot be memory-mapped.
+
+        if not file.seek(0, 2):
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from extract(buffer)
@@ -0,0 +1,124 @@
+"""
+This module includes format_many.
+"""
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .ei48 import HEX_DIGITS
+
+from .macaddress import to_integer
+
+
+# The layout of each notation, where `x` marks a hexadecimal digit.
+
+LAYOUTS = {
+    "plain": "xxxxxxxxxxxx",
+    "hyphen": "xx-xx-xx-xx-xx-xx",
+    "colon": "xx:xx:xx:xx:xx:xx",
+    "dot": "xxxx.xxxx.xxxx"
+}
+
+# The same layouts as format strings, with one field for each octet.
+
+TEMPLATES = {
+    notation: layout.replace("xx", "{}")
+    for notation, layout in LAYOUTS.items()
+}
+
+HEX_DIGITS_UPPER = tuple(digits.upper() for digits in HEX_DIGITS)
+
+
+def format_many(addresses, notation="colon", uppercase=False, separator="\n"):
+    """
+    Returns many MAC addresses as one string, with each address in
+    the same notation and separated from the next by `separator`.
+
+    If NumPy is installed, then the addresses are rendered straight
+    into a single byte buffer through a lookup table, with no
+    intermediate string for each address.
+
+    For example, if the user passes in `[0xa0b1c2d3e4f5,
+    0xaab1c2d3e4f5]` with `notation="hyphen"`, `uppercase=True`,
+    and `separator=","`, then format_many will return
+    `A0-B1-C2-D3-E4-F5,AA-B1-C2-D3-E4-F5`.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    notation : str
+        The notation, where notation is plain, hyphen, colon, or dot.
+
+        The default value is colon.
+
+    uppercase : bool
+        Whether to use uppercase letters.
+
+        The default value is False.
+
+    separator : str
+        The text to place between addresses.
+
+        The default value is a newline.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    if notation not in LAYOUTS:
+        raise ValueError("Pass in plain, hyphen, colon, or dot notation.")
+
+    if numpy is None:
+        table = HEX_DIGITS_UPPER if uppercase else HEX_DIGITS
+        template = TEMPLATES[notation]
+
+        return separator.join(
+            [
+                template.format(
+                    *[table[octet] for octet in value.to_bytes(6, "big")]
+                )
+                for value in map(to_integer, addresses)
+            ]
+        )
+
+    values = MacAddressArray(addresses).decimal
+    count = len(values)
+
+    if not count:
+        return ""
+
+    layout = LAYOUTS[notation].encode("ascii")
+    separator = separator.encode("utf-8")
+    width = len(layout) + len(separator)
+
+    # Look up the two ASCII digits for each octet of each address.
+
+    table = numpy.frombuffer(
+        "".join(HEX_DIGITS_UPPER if uppercase else HEX_DIGITS).encode(),
+        dtype=numpy.uint8
+    ).reshape(256, 2)
+
+    shifts = numpy.arange(40, -1, -8, dtype=numpy.uint64)
+    octets = (values[:, numpy.newaxis] >> shifts) & numpy.uint64(0xFF)
+    digits = table[octets.astype(numpy.intp)].reshape(count, 12)
+
+    # Lay out one row per address, including the trailing separator,
+    # then drop the separator after the last address.
+
+    row = numpy.frombuffer(layout + separator, dtype=numpy.uint8)
+    columns = numpy.flatnonzero(row[:len(layout)] == ord("x"))
+
+    buffer = numpy.empty((count, width), dtype=numpy.uint8)
+    buffer[:] = row
+    buffer[:, columns] = digits
+
+    end = count * width - len(separator)
+    return buffer.tobytes()[:end].decode("utf-8")
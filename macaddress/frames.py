@@ -0,0 +1,129 @@
+"""
+This module includes unpack_frames.
+"""
+
+from array import array
+
+import struct
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+
+# An Ethernet header starts with the destination address and then the
+# source address, six bytes each.  Unpack each address as a 16-bit
+# and a 32-bit big-endian integer.
+
+ADDRESSES = struct.Struct(">HIHI")
+
+
+def count_frames(size, stride, offset):
+    # The number of frames whose addresses fit in the buffer.
+
+    if size < offset + ADDRESSES.size:
+        return 0
+
+    return (size - offset - ADDRESSES.size) // stride + 1
+
+
+def unpack_frames(buffer, stride, offset=0, count=None):
+    """
+    Returns a tuple of the destination and source MAC addresses
+    of Ethernet frames laid out at a fixed stride in a buffer.
+
+    The addresses are read in place, without slicing or copying
+    each frame.
+
+    If NumPy is installed, then the addresses come back as two
+    MacAddressArray instances.  Otherwise, they come back as two
+    `array.array` instances of type `Q`.
+
+    For example, if the user passes in a buffer that holds frames in
+    2048-byte slots, each with a 16-byte capture header, then the
+    user should call `unpack_frames(buffer, stride=2048, offset=16)`.
+
+    Parameters
+    ----------
+    buffer : bytes-like object
+        The frames (for example, `bytes`, `bytearray`, `memoryview`,
+        or `mmap.mmap`).
+
+    stride : int
+        The number of bytes from the start of one frame to the start
+        of the next.  It must be at least 12.
+
+    offset : int
+        The position of the first frame's destination address.
+
+        The default value is 0.
+
+    count : int
+        The number of frames.  If None, then unpack_frames reads as
+        many frames as fit in the buffer.
+
+    Raises
+    ------
+    ValueError
+    """
+
+    if stride < ADDRESSES.size:
+        raise ValueError("Pass in a stride of at least 12 bytes.")
+
+    if offset < 0:
+        raise ValueError("Pass in a non-negative offset.")
+
+    size = memoryview(buffer).nbytes
+    available = count_frames(size, stride, offset)
+
+    if count is None:
+        count = available
+    elif not 0 <= count <= available:
+        raise ValueError(
+            "Pass in a count from 0 to {}.".format(available)
+        )
+
+    if numpy is None:
+        destinations = array("Q")
+        sources = array("Q")
+        unpack_from = ADDRESSES.unpack_from
+
+        for position in range(offset, offset + count * stride, stride):
+            high, low, source_high, source_low = unpack_from(buffer, position)
+            destinations.append(high << 32 | low)
+            sources.append(source_high << 32 | source_low)
+
+        return (destinations, sources)
+
+    if not count:
+        empty = numpy.empty(0, dtype=numpy.uint64)
+        return (MacAddressArray(empty), MacAddressArray(empty))
+
+    # View the addresses in place as big-endian fields, one row per
+    # frame, then combine each pair of fields into one integer.
+
+    fields = numpy.ndarray(
+        shape=(count,),
+        dtype=numpy.dtype(
+            [
+                ("destination_high", ">u2"),
+                ("destination_low", ">u4"),
+                ("source_high", ">u2"),
+                ("source_low", ">u4")
+            ]
+        ),
+        buffer=buffer,
+        offset=offset,
+        strides=(stride,)
+    )
+
+    def combine(prefix):
+        high = fields[prefix + "_high"].astype(numpy.uint64)
+        low = fields[prefix + "_low"].astype(numpy.uint64)
+        return (high << numpy.uint64(32)) | low
+
+    return (
+        MacAddressArray(combine("destination")),
+        MacAddressArray(combine("source"))
+    )
@@ -0,0 +1,319 @@
+"""
+This module includes AddressGenerator and GeneratorError.
+"""
+
+from array import array
+
+from random import Random
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .block import MacAddressBlock
+
+from .ei48 import (
+    LOCAL_BIT,
+    MULTICAST_BIT
+)
+
+from .formatting import format_many
+
+from .macaddress import MediaAccessControlAddress
+
+
+# The output types that AddressGenerator can return.
+
+OUTPUTS = ("int", "str", "object")
+
+# The number of rounds of the permutation that scrambles the counter.
+
+ROUNDS = 4
+
+# The 40 bits after the first octet, which are never part of the
+# multicast or local bits.
+
+LOW_MASK = (1 << 40) - 1
+
+LOW_BITS = 40
+
+# The first octet's six bits above the local and multicast bits.
+
+HIGH_SHIFT = 42
+
+
+class GeneratorError(Exception):
+    """
+    AddressGenerator raises GeneratorError if instantiated with an
+    invalid argument or asked for more addresses than it has left.
+
+    Arguments
+    ---------
+    message : str
+        A human-readable error message.
+    """
+
+    pass
+
+
+class AddressGenerator(object):
+    """
+    AddressGenerator makes it easy to generate many unique, random,
+    locally-administered unicast MAC addresses (for example, for
+    virtual machines or containers in a test harness).
+
+    Every address is unique without AddressGenerator remembering any
+    of them.  It numbers the addresses in its block from zero and
+    scrambles each number with a keyed, reversible permutation, so two
+    different numbers can never produce the same address.  Memory use
+    stays constant however many addresses it generates.
+
+    If NumPy is installed, then each batch is generated with vectorized
+    arithmetic, which takes a few seconds for ten million addresses.
+
+    Attributes
+    ----------
+    prefix : MacAddressBlock
+        The block that contains every generated address.
+
+    capacity : int
+        The number of locally-administered unicast addresses in the
+        block, which is the most that AddressGenerator can generate.
+
+    remaining : int
+        The number of addresses that AddressGenerator has left.
+
+    Parameters
+    ----------
+    prefix : str, MacAddressBlock, or None
+        The block in which to generate addresses (for example,
+        `02:00:00:00:00:00/24`), or None for every locally-administered
+        unicast address.  Any part of the prefix that covers the first
+        octet must have the local bit set and the multicast bit clear.
+
+        The default value is None.
+
+    seed : int or None
+        The seed for the permutation.  The same prefix and seed always
+        generate the same addresses in the same order.  If None, then
+        the seed is random.
+
+        The default value is None.
+
+    Raises
+    ------
+    GeneratorError
+    """
+
+    def __init__(self, prefix=None, seed=None):
+        if prefix is None:
+            prefix = MacAddressBlock(0, 0)
+        elif not isinstance(prefix, MacAddressBlock):
+            prefix = MacAddressBlock(prefix)
+
+        base = prefix.base.decimal
+        length = prefix.prefix_length
+
+        # The prefix may cover the local bit (the seventh bit) and the
+        # multicast bit (the eighth bit), in which case they must
+        # already have the right values.
+
+        if length >= 7 and not base & LOCAL_BIT or \
+                length >= 8 and base & MULTICAST_BIT:
+            raise GeneratorError(
+                "Pass in a prefix of locally-administered unicast addresses."
+            )
+
+        # Either bit may also fall outside the prefix, in which case
+        # it is fixed as well and leaves one fewer bit to number the
+        # addresses.
+
+        bits = 48 - length - min(2, max(0, 8 - length))
+
+        self._prefix = prefix
+        self._base = base | LOCAL_BIT
+        self._bits = bits
+        self._mask = (1 << bits) - 1
+        self._shift = max(bits // 2, 1)
+        self._count = 0
+
+        random = Random(seed)
+
+        self._multipliers = [
+            random.getrandbits(64) | 1 for _ in range(ROUNDS)
+        ]
+
+        # A block of one address has nothing to scramble, and before
+        # Python 3.9, getrandbits rejects zero bits.
+
+        self._keys = [
+            random.getrandbits(bits) if bits else 0 for _ in range(ROUNDS)
+        ]
+
+    def __repr__(self):
+        return "AddressGenerator('{}')".format(self._prefix)
+
+    def __len__(self):
+        return self.remaining
+
+    @property
+    def prefix(self):
+        return self._prefix
+
+    @property
+    def capacity(self):
+        return 1 << self._bits
+
+    @property
+    def remaining(self):
+        return self.capacity - self._count
+
+    def take(self, count, output="int", notation="colon"):
+        """
+        Returns the next batch of unique addresses.
+
+        If output is int, then the addresses come back as a
+        MacAddressArray (or, without NumPy, as an `array.array` of
+        type `Q`).  If output is str, then they come back as a list
+        of strings in the given notation.  If output is object, then
+        they come back as a list of MediaAccessControlAddress.
+
+        Parameters
+        ----------
+        count : int
+            The number of addresses.
+
+        output : str
+            The output type, where output is int, str, or object.
+
+            The default value is int.
+
+        notation : str
+            The notation for strings, where notation is plain, hyphen,
+            colon, or dot.
+
+            The default value is colon.
+
+        Raises
+        ------
+        GeneratorError
+        ValueError
+        """
+
+        if output not in OUTPUTS:
+            raise ValueError("Pass in int, str, or object output.")
+
+        if not isinstance(count, int) or count < 0:
+            raise GeneratorError("Pass in a count of zero or more.")
+
+        if count > self.remaining:
+            raise GeneratorError(
+                "Pass in a count of at most {}.".format(self.remaining)
+            )
+
+        start = self._count
+        self._count += count
+
+        if numpy is None:
+            indexes = range(start, start + count)
+            values = array("Q", map(self._address, indexes))
+        else:
+            values = self._addresses(start, start + count)
+
+        if output == "int":
+            return values if numpy is None else MacAddressArray(values)
+        elif output == "str":
+            if not count:
+                return []
+
+            return format_many(values, notation=notation).split("\n")
+        else:
+            return [
+                MediaAccessControlAddress._from_value(value)
+                for value in values.tolist()
+            ]
+
+    def batches(self, batch_size, count=None, output="int", notation="colon"):
+        """
+        Yields batches of unique addresses until it has generated
+        `count` of them or run out, as take returns them.
+
+        Parameters
+        ----------
+        batch_size : int
+            The number of addresses in each batch.  The last batch
+            may be smaller.
+
+        count : int or None
+            The total number of addresses, or None for every address
+            that AddressGenerator has left.
+
+            The default value is None.
+
+        output : str
+            The output type, where output is int, str, or object.
+
+            The default value is int.
+
+        notation : str
+            The notation for strings, where notation is plain, hyphen,
+            colon, or dot.
+
+            The default value is colon.
+
+        Raises
+        ------
+        GeneratorError
+        ValueError
+        """
+
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise GeneratorError("Pass in a batch size of one or more.")
+
+        remaining = self.remaining if count is None else count
+
+        while remaining > 0:
+            size = min(batch_size, remaining, self.remaining)
+
+            if not size:
+                return
+
+            yield self.take(size, output=output, notation=notation)
+            remaining -= size
+
+    def _address(self, index):
+        # Scramble one number, then spread its bits around the local
+        # and multicast bits of the first octet.
+
+        mask = self._mask
+        shift = self._shift
+
+        for multiplier, key in zip(self._multipliers, self._keys):
+            index = (index * multiplier) & mask
+            index ^= index >> shift
+            index ^= key
+
+        spread = (index >> LOW_BITS) << HIGH_SHIFT | index & LOW_MASK
+        return self._base | spread
+
+    def _addresses(self, start, stop):
+        # Scramble a range of numbers at once.  Multiplication wraps
+        # around at 64 bits, which the mask makes irrelevant.
+
+        mask = numpy.uint64(self._mask)
+        shift = numpy.uint64(self._shift)
+
+        indexes = numpy.arange(start, stop, dtype=numpy.uint64)
+
+        for multiplier, key in zip(self._multipliers, self._keys):
+            indexes *= numpy.uint64(multiplier)
+            indexes &= mask
+            indexes ^= indexes >> shift
+            indexes ^= numpy.uint64(key)
+
+        spread = (indexes >> numpy.uint64(LOW_BITS)) << \
+            numpy.uint64(HIGH_SHIFT)
+        spread |= indexes & numpy.uint64(LOW_MASK)
+        spread |= numpy.uint64(self._base)
+        return spread
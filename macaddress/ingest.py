@@ -0,0 +1,303 @@
+"""
+This module includes ingest_file.
+"""
+
+from array import array
+
+from concurrent.futures import ProcessPoolExecutor
+
+from itertools import compress
+
+import os
+
+try:
+    from multiprocessing import (
+        resource_tracker,
+        shared_memory
+    )
+except ImportError:  # pragma: no cover
+    shared_memory = None
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .ei48 import parse_integer
+
+from .parse import (
+    ERRORS,
+    convert_many
+)
+
+
+# The number of bytes that count_lines reads at a time.
+
+BLOCK_SIZE = 1 << 20
+
+
+def find_boundaries(path, count):
+    # Split the file into roughly equal ranges of bytes, moving each
+    # boundary forward to just after the next newline.
+
+    size = os.path.getsize(path)
+    boundaries = [0]
+
+    with open(path, "rb") as file:
+        for index in range(1, count):
+            file.seek(max(size * index // count, boundaries[-1]))
+            file.readline()
+            position = min(file.tell(), size)
+
+            if position > boundaries[-1]:
+                boundaries.append(position)
+
+    if size > boundaries[-1]:
+        boundaries.append(size)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def read_blocks(path, start, end):
+    # Yield the lines in one range a block at a time, carrying any
+    # partial last line over into the next block.
+
+    partial = b""
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+
+        while remaining > 0:
+            block = file.read(min(BLOCK_SIZE, remaining))
+
+            if not block:
+                break
+
+            remaining -= len(block)
+            lines = (partial + block).split(b"\n")
+            partial = lines.pop()
+
+            if lines:
+                yield lines
+
+    # A last line without a trailing newline still counts.
+
+    if partial:
+        yield [partial]
+
+
+def count_lines(path, start, end):
+    # Count the lines in one range (in a worker process) a block at
+    # a time, without reading the whole range or splitting it.
+
+    count = 0
+    last = b"\n"
+
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start
+
+        while remaining > 0:
+            block = file.read(min(BLOCK_SIZE, remaining))
+
+            if not block:
+                break
+
+            count += block.count(b"\n")
+            last = block[-1:]
+            remaining -= len(block)
+
+    # A last line without a trailing newline still counts.
+
+    if last != b"\n":
+        count += 1
+
+    return count
+
+
+def attach(name):
+    # Attach to shared memory that the parent process owns.  Before
+    # Python 3.13 (which adds track), attaching registers the memory
+    # with this process's resource tracker.  ingest_file starts the
+    # parent's tracker before any worker, so every worker shares it,
+    # and the parent's unlink removes that registration too.
+
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def parse_line(line):
+    # Parse one line, ignoring leading and trailing whitespace.
+
+    return parse_integer(line.decode("ascii", "replace").strip())
+
+
+def parse_lines(path, start, end, offset, values_name, mask_name, errors):
+    # Parse the lines in one range (in a worker process) a block at
+    # a time, and copy each block's results into the shared arrays,
+    # starting at `offset`.
+
+    shared_values = attach(values_name)
+    shared_mask = attach(mask_name)
+    position = offset
+
+    # Keep a zero for each skipped line, so that every worker's
+    # results line up, and let ingest_file drop them afterward.
+
+    mode = "mask" if errors == "skip" else errors
+
+    try:
+        for lines in read_blocks(path, start, end):
+            values, mask = convert_many(
+                lines,
+                parse_line,
+                mode,
+                "Pass in 12 hexadecimal digits (line {}).",
+                start=position + 1
+            )
+
+            data = values.tobytes()
+            first = position * values.itemsize
+            shared_values.buf[first:first + len(data)] = data
+            shared_mask.buf[position:position + len(mask)] = mask
+            position += len(lines)
+    finally:
+        shared_values.close()
+        shared_mask.close()
+
+    return position - offset
+
+
+def ingest_file(path, workers=None, errors="raise"):
+    """
+    Parses a file with one hexadecimal identifier per line across
+    several processes, and returns a tuple of their 48-bit integers
+    and a validity mask, as parse_many does.
+
+    The file is split on line boundaries into one range per worker.
+    Each worker parses its range a block at a time and writes each
+    block's integers and mask straight into arrays in shared memory,
+    so a worker never holds its whole range, and no addresses are
+    pickled on their way back to the parent process.
+
+    Leading and trailing whitespace on each line is ignored.
+
+    If NumPy is installed, then the integers come back as a
+    MacAddressArray and the mask as a boolean `numpy.ndarray`.
+    Otherwise, the integers come back as an `array.array` of
+    type `Q` and the mask as a `bytearray` of zeroes and ones.
+
+    ingest_file requires Python 3.8 or later.
+
+    Parameters
+    ----------
+    path : str or path-like object
+        The file to parse.
+
+    workers : int
+        The number of worker processes.
+
+        The default value is the number of CPUs.
+
+    errors : str
+        What to do with an invalid identifier, where errors is
+        raise, skip, or mask, as with parse_many.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ImportError
+    ValueError
+    """
+
+    if shared_memory is None:  # pragma: no cover
+        raise ImportError("ingest_file requires Python 3.8 or later.")
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers < 1:
+        raise ValueError("Pass in at least one worker.")
+
+    ranges = find_boundaries(path, workers)
+
+    # Start the resource tracker before the workers, so that they
+    # share it rather than each starting their own, which would
+    # unlink the shared memory when the worker exits.
+
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+    with ProcessPoolExecutor(max_workers=max(len(ranges), 1)) as executor:
+        # Count the lines in each range first, so that each worker
+        # knows where its results start in the shared arrays.
+
+        counts = list(
+            executor.map(count_lines, [path] * len(ranges), *zip(*ranges))
+        )
+
+        offsets = [sum(counts[:index]) for index in range(len(counts))]
+        total = sum(counts)
+
+        # Shared memory blocks cannot be empty.
+
+        shared_values = shared_memory.SharedMemory(
+            create=True,
+            size=max(total * 8, 1)
+        )
+        shared_mask = shared_memory.SharedMemory(
+            create=True,
+            size=max(total, 1)
+        )
+
+        try:
+            futures = [
+                executor.submit(
+                    parse_lines,
+                    path,
+                    start,
+                    end,
+                    offset,
+                    shared_values.name,
+                    shared_mask.name,
+                    errors
+                )
+                for (start, end), offset in zip(ranges, offsets)
+            ]
+
+            for future in futures:
+                future.result()
+
+            # Copy the results out once, so that the shared memory
+            # can be released before returning.
+
+            values = array("Q")
+            values.frombytes(shared_values.buf[:total * values.itemsize])
+            mask = bytearray(shared_mask.buf[:total])
+        finally:
+            shared_values.close()
+            shared_values.unlink()
+            shared_mask.close()
+            shared_mask.unlink()
+
+    if numpy is None:
+        if errors == "skip":
+            values = array("Q", compress(values, mask))
+
+        return (values, mask)
+
+    values = numpy.frombuffer(values, dtype=numpy.uint64)
+    mask = numpy.frombuffer(mask, dtype=numpy.bool_)
+
+    if errors == "skip":
+        values = values[mask]
+
+    return (MacAddressArray(values), mask)
@@ -0,0 +1,319 @@
+"""
+This module includes enable, disable, reset, and stats.
+"""
+
+from functools import wraps
+
+import sys
+
+from time import perf_counter
+
+from . import (
+    cache,
+    ei48,
+    formatting,
+    macaddress,
+    octet
+)
+
+
+# Each counter and its keys.
+
+COUNTERS = {
+    "constructions": (
+        "Octet",
+        "ExtendedIdentifier48",
+        "MediaAccessControlAddress"
+    ),
+    "validation_failures": ("plain", "hyphen", "colon", "dot", "octet"),
+    "cache": ("hits", "misses"),
+    "seconds": ("validation", "normalization", "formatting")
+}
+
+counters = {
+    counter: dict.fromkeys(keys, 0)
+    for counter, keys in COUNTERS.items()
+}
+
+patches = []
+
+# Each instrumented function and the function it replaced.  Modules
+# hold their own references to imported functions, and the package
+# loads most modules lazily, so a module imported while enabled
+# refers to the instrumented function too.
+
+replacements = {}
+
+hook = None
+
+
+def record(counter, key, amount):
+    # Update a counter and pass the update on to the hook.
+
+    values = counters[counter]
+    values[key] = values.get(key, 0) + amount
+
+    if hook is not None:
+        hook(counter, key, amount)
+
+
+def guess_notation(identifier):
+    # Guess which notation the user meant from the separators.
+
+    if not isinstance(identifier, str):
+        return "plain"
+    elif "-" in identifier:
+        return "hyphen"
+    elif ":" in identifier:
+        return "colon"
+    elif "." in identifier:
+        return "dot"
+    else:
+        return "plain"
+
+
+def timed(function, category):
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        start = perf_counter()
+
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record("seconds", category, perf_counter() - start)
+
+    return wrapper
+
+
+def counted_validation(function):
+    @wraps(function)
+    def wrapper(identifier):
+        start = perf_counter()
+        value = function(identifier)
+        record("seconds", "validation", perf_counter() - start)
+
+        if value is None:
+            record("validation_failures", guess_notation(identifier), 1)
+
+        return value
+
+    return wrapper
+
+
+def counted_construction(function):
+    @wraps(function)
+    def wrapper(self, *args, **kwargs):
+        function(self, *args, **kwargs)
+        record("constructions", type(self).__name__, 1)
+
+    return wrapper
+
+
+def counted_octet(function):
+    # Octet returns a shared instance from __new__ rather than
+    # initializing a new one, so count calls to __new__.
+
+    @wraps(function)
+    def wrapper(cls, digits):
+        try:
+            instance = function(cls, digits)
+        except octet.OctetError:
+            record("validation_failures", "octet", 1)
+            raise
+
+        record("constructions", cls.__name__, 1)
+        return instance
+
+    return wrapper
+
+
+def counted_from_value(function):
+    @wraps(function)
+    def wrapper(cls, *args):
+        instance = function(cls, *args)
+        record("constructions", cls.__name__, 1)
+        return instance
+
+    return wrapper
+
+
+def counted_cache(function):
+    @wraps(function)
+    def wrapper(self, identifier):
+        hits = self._hits
+        instance = function(self, identifier)
+        record("cache", "hits" if self._hits > hits else "misses", 1)
+        return instance
+
+    return wrapper
+
+
+def patch_attribute(owner, name, replacement):
+    patches.append((owner, name, owner.__dict__[name]))
+    setattr(owner, name, replacement)
+
+
+def package_modules():
+    # The package and each of its modules imported so far.
+
+    for name, module in list(sys.modules.items()):
+        if name == "macaddress" or name.startswith("macaddress."):
+            yield module
+
+
+def patch_function(original, replacement):
+    # Replace a function everywhere the package refers to it.
+
+    replacements[replacement] = original
+
+    for module in package_modules():
+        for attribute, value in list(vars(module).items()):
+            if value is original:
+                patch_attribute(module, attribute, replacement)
+
+
+def restore_functions():
+    # Restore every reference to an instrumented function, including
+    # those in modules imported since enable.
+
+    for module in package_modules():
+        for attribute, value in list(vars(module).items()):
+            for replacement, original in replacements.items():
+                if value is replacement:
+                    setattr(module, attribute, original)
+
+    replacements.clear()
+
+
+def enable(callback=None):
+    """
+    Starts counting constructions, validation failures, and cache hits
+    and misses, and timing validation, normalization, and formatting.
+
+    Instrumentation swaps in instrumented versions of the functions
+    and methods involved, so it costs nothing while disabled, and
+    it is meant for diagnosis rather than for constant use.
+
+    Parameters
+    ----------
+    callback : callable
+        A function to call with the counter's name, the key, and the
+        amount of each update (for example, `("constructions",
+        "MediaAccessControlAddress", 1)` or `("seconds", "validation",
+        0.000002)`), or None.
+
+        The default value is None.
+    """
+
+    global hook
+    hook = callback
+
+    if patches:
+        return
+
+    ExtendedIdentifier48 = ei48.ExtendedIdentifier48
+    MediaAccessControlAddress = macaddress.MediaAccessControlAddress
+    Octet = octet.Octet
+
+    patch_function(
+        ei48.parse_integer,
+        counted_validation(ei48.parse_integer)
+    )
+    patch_function(
+        formatting.format_many,
+        timed(formatting.format_many, "formatting")
+    )
+
+    patch_attribute(
+        ExtendedIdentifier48,
+        "__init__",
+        counted_construction(ExtendedIdentifier48.__init__)
+    )
+    # MediaAccessControlAddress parses for itself rather than calling
+    # the superclass's __init__.
+
+    patch_attribute(
+        MediaAccessControlAddress,
+        "__init__",
+        counted_construction(MediaAccessControlAddress.__init__)
+    )
+    patch_attribute(
+        ExtendedIdentifier48,
+        "_from_value",
+        classmethod(
+            counted_from_value(
+                ExtendedIdentifier48.__dict__["_from_value"].__func__
+            )
+        )
+    )
+    patch_attribute(
+        ExtendedIdentifier48,
+        "normalized",
+        property(timed(ExtendedIdentifier48.normalized.fget, "normalization"))
+    )
+
+    for name in (
+        "to_plain_notation",
+        "to_hyphen_notation",
+        "to_colon_notation",
+        "to_dot_notation"
+    ):
+        patch_attribute(
+            ExtendedIdentifier48,
+            name,
+            timed(getattr(ExtendedIdentifier48, name), "formatting")
+        )
+
+    patch_attribute(
+        Octet,
+        "__new__",
+        staticmethod(counted_octet(Octet.__dict__["__new__"].__func__))
+    )
+
+    lookup = counted_cache(cache.AddressCache.__call__)
+    patch_attribute(cache.AddressCache, "__call__", lookup)
+    patch_attribute(cache.AddressCache, "get", lookup)
+
+
+def disable():
+    """
+    Stops instrumentation, restoring the original functions and
+    methods.  The counters keep their values until reset.
+    """
+
+    global hook
+    hook = None
+
+    while patches:
+        owner, name, original = patches.pop()
+        setattr(owner, name, original)
+
+    restore_functions()
+
+
+def reset():
+    """
+    Sets every counter back to zero.
+    """
+
+    for counter, keys in COUNTERS.items():
+        counters[counter] = dict.fromkeys(keys, 0)
+
+
+def stats():
+    """
+    Returns a snapshot of the counters as a dictionary, along with
+    whether instrumentation is enabled.
+
+    For example, after enabling instrumentation and instantiating
+    MediaAccessControlAddress with `A0-B1-C2-D3-E4-F5`, stats will
+    return a dictionary in which
+    `stats()["constructions"]["MediaAccessControlAddress"]` is 1.
+    """
+
+    snapshot = {
+        counter: dict(values)
+        for counter, values in counters.items()
+    }
+    snapshot["enabled"] = bool(patches)
+    return snapshot
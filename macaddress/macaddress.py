@@ -1,14 +1,48 @@
 """
-This module includes MediaAccessControlAddress and AddressError.
+This module includes MediaAccessControlAddress, AddressError,
+is_valid_address, try_parse, to_integer, to_interface_id,
+as_interface_id, from_interface_id, prefix_to_integer, and
+to_multicast_address.
 """
 
+import operator
 
 from .ei48 import (
     ExtendedIdentifier48,
-    IdentifierError
+    IdentifierError,
+    LOCAL_BIT,
+    MAX_VALUE,
+    MULTICAST_BIT,
+    parse_integer
 )
 
 
+# A modified EUI-64 interface ID (RFC 4291, appendix A) is a MAC
+# address with `fffe` inserted after its first three octets and the
+# universal/local bit flipped.
+
+INTERFACE_ID_MASK = 0xFFFFFFFFFFFFFFFF
+INTERFACE_ID_FILLER = 0xFFFE << 24
+INTERFACE_ID_FILLER_MASK = 0xFFFF << 24
+INTERFACE_ID_LOCAL_BIT = LOCAL_BIT << 16
+SUFFIX_MASK = 0xFFFFFF
+
+# An IPv4 multicast group (224.0.0.0/4) maps its last 23 bits onto
+# `01:00:5e:00:00:00`, so 32 groups share each MAC address.  An IPv6
+# multicast group (ff00::/8) maps its last 32 bits onto
+# `33:33:00:00:00:00`.
+
+IPV4_MULTICAST_NIBBLE = 0xE
+IPV4_MULTICAST_PREFIX = 0x01005E000000
+IPV4_GROUP_MASK = 0x7FFFFF
+IPV4_GROUP_SHIFT = 23
+IPV4_CANDIDATES = 32
+IPV6_MULTICAST_OCTET = 0xFF
+IPV6_MULTICAST_PREFIX = 0x333300000000
+IPV6_GROUP_MASK = 0xFFFFFFFF
+IPV6_GROUP_SHIFT = 32
+
+
 class AddressError(Exception):
     """
     MediaAccessControlAddress raises AddressError if instantiated
@@ -69,13 +103,71 @@ class MediaAccessControlAddress(ExtendedIdentifier48):
         address determines whether it is a UAA or an LAA.
 
         1 = LAA.
+
+    vendor : str
+        The name of the organization to which the IEEE assigned the
+        MAC address's OUI or CID, according to the registry loaded
+        with `load_registry`.
+
+        If no registry has been loaded, or if the registry has no
+        matching assignment, then vendor is None.
     """
 
+    __slots__ = ()
+
     def __init__(self, address):
+        # Parse the MAC address here rather than in the superclass,
+        # so that invalid input raises one exception rather than two.
+
+        value = parse_integer(address)
+
+        if value is None:
+            raise AddressError("Pass in 12 hexadecimal digits.")
+
+        object.__setattr__(self, "original", address)
+        object.__setattr__(self, "_value", value)
+
+    @classmethod
+    def from_int(cls, value):
+        """
+        Returns an instance from the 48-bit integer equivalent of
+        a MAC address, without parsing any hexadecimal digits.
+
+        Parameters
+        ----------
+        value : int
+            A 48-bit integer.
+
+        Raises
+        ------
+        AddressError
+        """
+
         try:
-            super().__init__(address)
+            return super().from_int(value)
         except IdentifierError:
-            raise AddressError("Pass in 12 hexadecimal digits.")
+            raise AddressError("Pass in a 48-bit integer.")
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+        Returns an instance from the six bytes of a MAC address,
+        most-significant byte first (as in an Ethernet header).
+
+        Parameters
+        ----------
+        data : bytes-like object
+            Six bytes.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        try:
+            return super().from_bytes(data)
+        except IdentifierError:
+            raise AddressError("Pass in six bytes.")
 
     def __repr__(self):
         return "MediaAccessControlAddress('{}')".format(self.original)
@@ -85,29 +177,404 @@ class MediaAccessControlAddress(ExtendedIdentifier48):
 
     @property
     def is_broadcast(self):
-        return self.normalized == "ffffffffffff"
+        return self._value == MAX_VALUE
 
     @property
     def is_multicast(self):
         # The least-significant bit in the first octet of a MAC address
         # determines whether it is a multicast or a unicast.
 
-        return self.first_octet.binary[7] == "1"
+        return bool(self._value & MULTICAST_BIT)
 
     @property
     def is_unicast(self):
-        return not self.is_multicast
+        return not self._value & MULTICAST_BIT
 
     @property
     def is_uaa(self):
         # The second-least-significant bit in the first octet of a MAC
         # address determines whether it is a UAA or an LAA.
 
-        return self.is_unicast and self.first_octet.binary[6] == "0"
+        return not self._value & (MULTICAST_BIT | LOCAL_BIT)
 
     @property
     def is_laa(self):
         # The second-least-significant bit in the first octet of a MAC
         # address determines whether it is a UAA or an LAA.
 
-        return self.is_unicast and self.first_octet.binary[6] == "1"
+        return self._value & (MULTICAST_BIT | LOCAL_BIT) == LOCAL_BIT
+
+    @classmethod
+    def from_modified_eui64(cls, interface_id):
+        """
+        Returns an instance from a modified EUI-64 interface ID, or
+        from the interface ID of an IPv6 address (for example, a
+        link-local address derived with SLAAC).
+
+        For example, if the user passes in `0xa2b1c2fffed3e4f5` or
+        `IPv6Address("fe80::a2b1:c2ff:fed3:e4f5")`, then
+        from_modified_eui64 will return
+        `MediaAccessControlAddress('a0b1c2d3e4f5')`.
+
+        Parameters
+        ----------
+        interface_id : int or ipaddress.IPv6Address
+            A 64-bit interface ID, or an IPv6 address whose last 64
+            bits are the interface ID.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        interface_id = as_interface_id(interface_id)
+        value = None if interface_id is None \
+            else from_interface_id(interface_id)
+
+        if value is None:
+            raise AddressError("Pass in a modified EUI-64 interface ID.")
+
+        return cls._from_value(value)
+
+    def to_modified_eui64(self):
+        """
+        Returns the MAC address's modified EUI-64 interface ID as a
+        64-bit integer.
+
+        For example, if the user passes in `A0-B1-C2-D3-E4-F5`,
+        then to_modified_eui64 will return `0xa2b1c2fffed3e4f5`.
+        """
+
+        return to_interface_id(self._value)
+
+    def to_ipv6(self, prefix="fe80::/64"):
+        """
+        Returns the IPv6 address that SLAAC derives from the MAC
+        address and a 64-bit prefix.
+
+        For example, if the user passes in `A0-B1-C2-D3-E4-F5` and
+        calls this method without a prefix, then to_ipv6 will return
+        the link-local address `IPv6Address('fe80::a2b1:c2ff:fed3:e4f5')`.
+
+        Parameters
+        ----------
+        prefix : str or ipaddress.IPv6Network
+            The /64 prefix.
+
+            The default value is `fe80::/64`.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        # Import the ipaddress module here, as few users need it.
+
+        import ipaddress
+
+        return ipaddress.IPv6Address(
+            prefix_to_integer(prefix) | to_interface_id(self._value)
+        )
+
+    @classmethod
+    def from_multicast_group(cls, group):
+        """
+        Returns the multicast MAC address to which an IPv4 or IPv6
+        multicast group maps.
+
+        For example, if the user passes in `239.1.2.3`, then
+        from_multicast_group will return
+        `MediaAccessControlAddress('01005e010203')`.
+
+        Parameters
+        ----------
+        group : str, ipaddress.IPv4Address, or ipaddress.IPv6Address
+            The multicast group.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        # Import the ipaddress module here, as few users need it.
+
+        import ipaddress
+
+        try:
+            group = ipaddress.ip_address(group)
+        except ValueError:
+            value = None
+        else:
+            value = to_multicast_address(int(group), group.version)
+
+        if value is None:
+            raise AddressError("Pass in an IPv4 or IPv6 multicast group.")
+
+        return cls._from_value(value)
+
+    def to_multicast_groups(self, prefix="ff02::/96"):
+        """
+        Returns the IP multicast groups that map to the MAC address.
+
+        For a MAC address in `01:00:5e:00:00:00/25`, these are the 32
+        IPv4 groups that differ only in the five bits that the mapping
+        drops.  For a MAC address in `33:33:00:00:00:00/16`, this is
+        the IPv6 group in the given /96 prefix.  For any other MAC
+        address, the list is empty.
+
+        For example, if the user passes in `01-00-5E-01-02-03`, then
+        to_multicast_groups will return a list from
+        `IPv4Address('224.1.2.3')` to `IPv4Address('239.129.2.3')`.
+
+        Parameters
+        ----------
+        prefix : str or ipaddress.IPv6Network
+            The /96 prefix for IPv6 groups.
+
+            The default value is `ff02::/96` (link-local scope).  For
+            solicited-node groups, pass in `ff02::1:0:0/96`.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        import ipaddress
+
+        value = self._value
+
+        if value >> IPV4_GROUP_SHIFT == \
+                IPV4_MULTICAST_PREFIX >> IPV4_GROUP_SHIFT:
+            first = IPV4_MULTICAST_NIBBLE << 28 | value & IPV4_GROUP_MASK
+
+            return [
+                ipaddress.IPv4Address(first | index << IPV4_GROUP_SHIFT)
+                for index in range(IPV4_CANDIDATES)
+            ]
+        elif value >> IPV6_GROUP_SHIFT == \
+                IPV6_MULTICAST_PREFIX >> IPV6_GROUP_SHIFT:
+            high = prefix_to_integer(prefix, 96)
+
+            return [ipaddress.IPv6Address(high | value & IPV6_GROUP_MASK)]
+        else:
+            return []
+
+    @property
+    def vendor(self):
+        # Import the registry module here, as it depends on this one.
+
+        from . import registry
+
+        return registry.lookup_vendor(self._value)
+
+
+def is_valid_address(address):
+    """
+    Returns whether a MAC address is valid, without raising.
+
+    Parameters
+    ----------
+    address : str
+        Twelve hexadecimal digits in plain, hyphen, colon, or dot
+        notation.
+    """
+
+    return parse_integer(address) is not None
+
+
+def try_parse(address):
+    """
+    Returns an instance of MediaAccessControlAddress, or None if the
+    MAC address is invalid.
+
+    Unlike MediaAccessControlAddress, try_parse never raises, so it
+    avoids the cost of an exception for each invalid MAC address.
+
+    Parameters
+    ----------
+    address : str
+        Twelve hexadecimal digits in plain, hyphen, colon, or dot
+        notation.
+    """
+
+    value = parse_integer(address)
+
+    if value is None:
+        return None
+
+    return MediaAccessControlAddress._from_value(value, address)
+
+
+def to_integer(address):
+    """
+    Returns the 48-bit integer equivalent of a MAC address.
+
+    Parameters
+    ----------
+    address : str, int, or ExtendedIdentifier48
+        Twelve hexadecimal digits in plain, hyphen, colon, or dot
+        notation, a 48-bit integer (including a NumPy integer, but
+        not a bool), or an instance of ExtendedIdentifier48 (or
+        MediaAccessControlAddress).
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if isinstance(address, ExtendedIdentifier48):
+        return address.decimal
+
+    if isinstance(address, str) or isinstance(address, bool):
+        value = parse_integer(address)
+
+        if value is None:
+            raise AddressError("Pass in 12 hexadecimal digits.")
+
+        return value
+
+    # Accept any integer type, such as the NumPy integers that come
+    # out of MacAddressArray.decimal.
+
+    try:
+        value = operator.index(address)
+    except TypeError:
+        raise AddressError("Pass in 12 hexadecimal digits.")
+
+    if not 0 <= value <= MAX_VALUE:
+        raise AddressError("Pass in 48-bit integers.")
+
+    return value
+
+
+def to_interface_id(value):
+    """
+    Returns the modified EUI-64 interface ID of the 48-bit integer
+    equivalent of a MAC address.
+
+    Parameters
+    ----------
+    value : int
+        A 48-bit integer.
+    """
+
+    interface_id = (value >> 24) << 40 | INTERFACE_ID_FILLER
+    interface_id |= value & SUFFIX_MASK
+    return interface_id ^ INTERFACE_ID_LOCAL_BIT
+
+
+def as_interface_id(item):
+    """
+    Returns the 64-bit interface ID in an integer or in the last 64
+    bits of an `ipaddress.IPv6Address`, or None if the item is
+    neither (including a bool or a string) or is out of range.
+
+    Parameters
+    ----------
+    item : int or ipaddress.IPv6Address
+        A 64-bit integer (including a NumPy integer), or an IPv6
+        address.
+    """
+
+    if isinstance(item, bool):
+        return None
+
+    # Accept any integer type, but only IPv6 addresses among the
+    # types that merely convert to int (such as str and float).
+
+    try:
+        interface_id = operator.index(item)
+    except TypeError:
+        import ipaddress
+
+        if isinstance(item, ipaddress.IPv6Address):
+            return int(item) & INTERFACE_ID_MASK
+
+        return None
+
+    return interface_id if 0 <= interface_id <= INTERFACE_ID_MASK else None
+
+
+def from_interface_id(interface_id):
+    """
+    Returns the 48-bit integer equivalent of the MAC address from
+    which a modified EUI-64 interface ID was derived, or None if the
+    interface ID was not derived from a MAC address.
+
+    Parameters
+    ----------
+    interface_id : int
+        A 64-bit integer.
+    """
+
+    if not 0 <= interface_id <= INTERFACE_ID_MASK or \
+            interface_id & INTERFACE_ID_FILLER_MASK != INTERFACE_ID_FILLER:
+        return None
+
+    value = (interface_id >> 40) << 24 | interface_id & SUFFIX_MASK
+    return value ^ LOCAL_BIT
+
+
+def prefix_to_integer(prefix, prefix_length=64):
+    """
+    Returns the 128-bit integer equivalent of an IPv6 prefix.
+
+    Parameters
+    ----------
+    prefix : str or ipaddress.IPv6Network
+        The prefix (for example, `fe80::/64`).
+
+    prefix_length : int
+        The prefix length that the prefix must have.
+
+        The default value is 64.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    import ipaddress
+
+    message = "Pass in a /{} prefix.".format(prefix_length)
+
+    try:
+        network = ipaddress.IPv6Network(prefix)
+    except ValueError:
+        raise AddressError(message)
+
+    if network.prefixlen != prefix_length:
+        raise AddressError(message)
+
+    return int(network.network_address)
+
+
+def to_multicast_address(value, version):
+    """
+    Returns the 48-bit integer equivalent of the MAC address to which
+    an IPv4 or IPv6 multicast group maps, or None if the group is not
+    an IP multicast group.
+
+    An IPv4 group (224.0.0.0/4) maps its last 23 bits onto
+    `01:00:5e:00:00:00`, and an IPv6 group (ff00::/8) maps its last
+    32 bits onto `33:33:00:00:00:00`.
+
+    Parameters
+    ----------
+    value : int
+        The integer equivalent of the multicast group.
+
+    version : int
+        The IP version, where version is 4 or 6.
+    """
+
+    if version == 4:
+        if value >> 28 != IPV4_MULTICAST_NIBBLE:
+            return None
+
+        return IPV4_MULTICAST_PREFIX | value & IPV4_GROUP_MASK
+    else:
+        if value >> 120 != IPV6_MULTICAST_OCTET:
+            return None
+
+        return IPV6_MULTICAST_PREFIX | value & IPV6_GROUP_MASK
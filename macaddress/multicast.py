@@ -0,0 +1,322 @@
+"""
+This module includes ipv4_multicast_many, ipv6_multicast_many,
+ipv4_groups_many, and ipv6_groups_many.
+"""
+
+from array import array
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .macaddress import (
+    AddressError,
+    IPV4_CANDIDATES,
+    IPV4_GROUP_MASK,
+    IPV4_GROUP_SHIFT,
+    IPV4_MULTICAST_NIBBLE,
+    IPV4_MULTICAST_PREFIX,
+    IPV6_GROUP_MASK,
+    IPV6_GROUP_SHIFT,
+    IPV6_MULTICAST_PREFIX,
+    to_integer,
+    to_multicast_address
+)
+
+from .parse import (
+    ERRORS,
+    convert_many
+)
+
+
+# The number of bits in an address of each IP version.
+
+BITS = {4: 32, 6: 128}
+
+
+def ipv4_multicast_many(groups, errors="raise"):
+    """
+    Returns the multicast MAC addresses to which many IPv4 multicast
+    groups map, along with a validity mask, as parse_many does.
+
+    Each group maps its last 23 bits onto `01:00:5e:00:00:00`.  A
+    NumPy array of integers is mapped with vectorized arithmetic.
+
+    For example, if the user passes in `["239.1.2.3"]`, then
+    ipv4_multicast_many will return `([0x01005e010203], [True])`.
+
+    Parameters
+    ----------
+    groups : iterable
+        Groups as 32-bit integers (including a NumPy array of
+        integers), as strings, or as `ipaddress.IPv4Address` objects.
+
+    errors : str
+        What to do with a group outside 224.0.0.0/4, where errors is
+        raise, skip, or mask, as with parse_many.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    return map_groups(groups, errors, 4)
+
+
+def ipv6_multicast_many(groups, errors="raise"):
+    """
+    Returns the multicast MAC addresses to which many IPv6 multicast
+    groups map, along with a validity mask, as parse_many does.
+
+    Each group maps its last 32 bits onto `33:33:00:00:00:00`.
+
+    For example, if the user passes in `["ff02::1:ffd3:e4f5"]`, then
+    ipv6_multicast_many will return `([0x3333ffd3e4f5], [True])`.
+
+    Parameters
+    ----------
+    groups : iterable
+        Groups as 128-bit integers, as strings, or as
+        `ipaddress.IPv6Address` objects.
+
+    errors : str
+        What to do with a group outside ff00::/8, where errors is
+        raise, skip, or mask, as with parse_many.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    return map_groups(groups, errors, 6)
+
+
+def ipv4_groups_many(addresses, errors="raise"):
+    """
+    Returns the 32 candidate IPv4 multicast groups, as integers, for
+    each of many multicast MAC addresses, along with a validity mask.
+
+    The mapping drops five bits of each group, so the candidates
+    differ only in those bits.  If NumPy is installed, then the
+    candidates come back as a `uint32` array with one row per MAC
+    address.  Otherwise, they come back as an `array.array` of type
+    `I` with 32 candidates per MAC address.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    errors : str
+        What to do with a MAC address outside `01:00:5e:00:00:00/25`,
+        where errors is raise, skip, or mask, as with parse_many.
+        With mask, its candidates are all zero.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    prefix = IPV4_MULTICAST_PREFIX >> IPV4_GROUP_SHIFT
+    first = IPV4_MULTICAST_NIBBLE << 28
+
+    if numpy is None:
+        def to_group(value):
+            if value >> IPV4_GROUP_SHIFT == prefix:
+                return first | value & IPV4_GROUP_MASK
+
+            return None
+
+        groups, mask = convert_many(
+            map(to_integer, addresses),
+            to_group,
+            errors,
+            "Pass in an IPv4 multicast MAC address (item {}).",
+            typecode="I"
+        )
+
+        # Every group starts with 1110, so only a masked MAC address
+        # has a zero group, and its candidates are all zero.
+
+        offsets = [
+            index << IPV4_GROUP_SHIFT for index in range(IPV4_CANDIDATES)
+        ]
+        candidates = array("I", [
+            group | offset if group else 0
+            for group in groups
+            for offset in offsets
+        ])
+
+        return (candidates, mask)
+
+    values = MacAddressArray(addresses).decimal
+    mask = values >> numpy.uint64(IPV4_GROUP_SHIFT) == numpy.uint64(prefix)
+
+    if errors == "raise" and not mask.all():
+        raise_for(int(numpy.argmin(mask)), "an IPv4 multicast MAC address")
+
+    groups = (values & numpy.uint64(IPV4_GROUP_MASK)).astype(numpy.uint32)
+    groups |= numpy.uint32(first)
+
+    offsets = numpy.arange(IPV4_CANDIDATES, dtype=numpy.uint32)
+    candidates = groups[:, numpy.newaxis] | offsets << IPV4_GROUP_SHIFT
+
+    if errors == "skip":
+        candidates = candidates[mask]
+    elif errors == "mask":
+        candidates[~mask] = 0
+
+    return (candidates, mask)
+
+
+def ipv6_groups_many(addresses, errors="raise"):
+    """
+    Returns the last 32 bits of the IPv6 multicast group, as integers,
+    for each of many multicast MAC addresses, along with a validity
+    mask.
+
+    The mapping drops the rest of each group, so combine these bits
+    with a /96 prefix (for example, `ff02::/96`) to recover a group.
+    If NumPy is installed, then the bits come back as a `uint32`
+    array.  Otherwise, they come back as an `array.array` of type `I`.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    errors : str
+        What to do with a MAC address outside `33:33:00:00:00:00/16`,
+        where errors is raise, skip, or mask, as with parse_many.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    prefix = IPV6_MULTICAST_PREFIX >> IPV6_GROUP_SHIFT
+
+    if numpy is None:
+        def to_group_id(value):
+            if value >> IPV6_GROUP_SHIFT == prefix:
+                return value & IPV6_GROUP_MASK
+
+            return None
+
+        group_ids, mask = convert_many(
+            map(to_integer, addresses),
+            to_group_id,
+            errors,
+            "Pass in an IPv6 multicast MAC address (item {}).",
+            typecode="I"
+        )
+
+        return (group_ids, mask)
+
+    values = MacAddressArray(addresses).decimal
+    mask = values >> numpy.uint64(IPV6_GROUP_SHIFT) == numpy.uint64(prefix)
+
+    if errors == "raise" and not mask.all():
+        raise_for(int(numpy.argmin(mask)), "an IPv6 multicast MAC address")
+
+    group_ids = (values & numpy.uint64(IPV6_GROUP_MASK)).astype(numpy.uint32)
+
+    if errors == "skip":
+        group_ids = group_ids[mask]
+    elif errors == "mask":
+        group_ids[~mask] = 0
+
+    return (group_ids, mask)
+
+
+def raise_for(index, description):
+    raise AddressError("Pass in {} (item {}).".format(description, index))
+
+
+def map_groups(groups, errors, version):
+    # Map many groups of one IP version to MAC addresses.
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    description = "an IPv{} multicast group".format(version)
+
+    if numpy is not None and version == 4 and \
+            isinstance(groups, numpy.ndarray) and groups.dtype.kind in "iu":
+        groups = groups.reshape(-1)
+        mask = groups >> 28 == IPV4_MULTICAST_NIBBLE
+
+        if errors == "raise" and not mask.all():
+            raise_for(int(numpy.argmin(mask)), description)
+
+        values = (groups & IPV4_GROUP_MASK).astype(numpy.uint64)
+        values |= numpy.uint64(IPV4_MULTICAST_PREFIX)
+
+        if errors == "skip":
+            values = values[mask]
+        elif errors == "mask":
+            values[~mask] = 0
+
+        return (MacAddressArray(values), mask)
+
+    values, mask = convert_many(
+        groups,
+        lambda group: as_multicast_address(group, version),
+        errors,
+        "Pass in {} (item {{}}).".format(description)
+    )
+
+    if numpy is None:
+        return (values, mask)
+
+    return (
+        MacAddressArray(numpy.frombuffer(values, dtype=numpy.uint64)),
+        numpy.frombuffer(mask, dtype=numpy.bool_)
+    )
+
+
+def as_multicast_address(group, version):
+    # Convert a string or an IP address to the integer equivalent of
+    # a group of one IP version, then map it, or return None if it is
+    # invalid.
+
+    if isinstance(group, int):
+        if not 0 <= group < 1 << BITS[version]:
+            return None
+    else:
+        import ipaddress
+
+        try:
+            group = ipaddress.ip_address(group)
+        except ValueError:
+            return None
+
+        if group.version != version:
+            return None
+
+        group = int(group)
+
+    return to_multicast_address(group, version)
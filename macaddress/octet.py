@@ -2,12 +2,61 @@
 This module includes Octet and OctetError.
 """
 
-from functools import reduce
+from itertools import product
 
-import re
 
+# The pattern for two hexadecimal digits, compiled on first use as
+# DIGITS.  Octet itself validates with the table of spellings below.
 
-DIGITS = re.compile("^[0-9A-Fa-f]{2}$")
+PATTERN = "^[0-9A-Fa-f]{2}$"
+
+PATTERNS = {
+    "DIGITS": PATTERN
+}
+
+# The two hexadecimal digits, the eight binary digits, and the
+# eight reverse-binary digits for each of the 256 possible octets.
+
+HEX_DIGITS = tuple(format(decimal, "02x") for decimal in range(256))
+BINARY = tuple(format(decimal, "08b") for decimal in range(256))
+REVERSE_BINARY = tuple(binary[::-1] for binary in BINARY)
+
+# Each octet with its bits reversed, as a table for bytes.translate.
+
+BIT_REVERSED = bytes(int(binary, base=2) for binary in REVERSE_BINARY)
+
+
+def __getattr__(name):
+    # Compile DIGITS the first time someone asks for it.  ei48 imports
+    # this module (and looks up attributes such as __path__ while it
+    # does), so import its helper only for a pattern.
+
+    if name not in PATTERNS:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        )
+
+    from .ei48 import compile_pattern
+
+    return compile_pattern(name, PATTERNS, globals())
+
+
+def spellings(digits):
+    """
+    Returns every spelling of two lowercase hexadecimal digits,
+    with each letter in lowercase or in uppercase.
+
+    For example, if the user passes in `a0`, then spellings will
+    return `["a0", "A0"]`.
+
+    Parameters
+    ----------
+    digits : str
+        Two lowercase hexadecimal digits.
+    """
+
+    cases = [sorted({digit, digit.upper()}) for digit in digits]
+    return ["".join(spelling) for spelling in product(*cases)]
 
 
 class OctetError(Exception):
@@ -78,12 +127,38 @@ class Octet(object):
     OctetError
     """
 
-    def __init__(self, digits):
-        self.original = digits
+    # There are only 256 possible octets, so each spelling of each
+    # octet has one shared, immutable instance, created when this
+    # module is imported.  Instantiating Octet looks it up.
+
+    __slots__ = ("original", "decimal")
 
-        if not self.is_valid:
+    def __new__(cls, digits):
+        try:
+            return SPELLINGS[digits]
+        except (KeyError, TypeError):
             raise OctetError("Pass in two hexadecimal digits.")
 
+    @classmethod
+    def _create(cls, digits, decimal):
+        # Create the one instance for a spelling of an octet.
+
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "original", digits)
+        object.__setattr__(instance, "decimal", decimal)
+        return instance
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Octet is immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Octet is immutable.")
+
+    def __reduce__(self):
+        # Copying or unpickling an octet returns the shared instance.
+
+        return (Octet, (self.original,))
+
     def __repr__(self):
         return "Octet('{}')".format(self.original)
 
@@ -92,30 +167,33 @@ class Octet(object):
 
     @property
     def is_valid(self):
-        # Evaluate the hexadecimal digits.
+        # Only valid hexadecimal digits have an instance.
 
-        if DIGITS.match(self.original):
-            return True
-        else:
-            return False
+        return True
 
     @property
     def normalized(self):
-        return self.original.lower()
-
-    @property
-    def decimal(self):
-        return int(self.normalized, base=16)
+        return HEX_DIGITS[self.decimal]
 
     @property
     def binary(self):
-        # Convert from decimal digits to binary digits, padding with
-        # zeroes as necessary.
-
-        return format(self.decimal, "b").zfill(8)
+        return BINARY[self.decimal]
 
     @property
     def reverse_binary(self):
-        # Concatenate the binary digits in reverse order.
+        return REVERSE_BINARY[self.decimal]
+
+
+# The shared instances of Octet, by decimal value and by spelling.
+
+OCTETS = tuple(
+    Octet._create(digits, decimal)
+    for decimal, digits in enumerate(HEX_DIGITS)
+)
 
-        return reduce(lambda x, y: x + y, reversed(self.binary))
+SPELLINGS = {
+    spelling: octet if spelling == octet.original
+    else Octet._create(spelling, octet.decimal)
+    for octet in OCTETS
+    for spelling in spellings(octet.original)
+}
@@ -0,0 +1,117 @@
+"""
+This module includes parse_many.
+"""
+
+from array import array
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .ei48 import parse_integer
+
+from .macaddress import AddressError
+
+
+ERRORS = ("raise", "skip", "mask")
+
+
+def convert_many(items, convert, errors, message, start=0, typecode="Q"):
+    # Convert many items one at a time, where convert returns None for
+    # an invalid item, and return an `array.array` of the results and
+    # a `bytearray` mask, handling invalid items as parse_many does.
+    # With raise, message is formatted with the item's number, which
+    # counts from start.
+
+    values = array(typecode)
+    mask = bytearray()
+
+    # Bind the hot methods to local names, as the loop below may
+    # run for millions of items.
+
+    append_value = values.append
+    append_mask = mask.append
+
+    for index, item in enumerate(items, start):
+        value = convert(item)
+
+        if value is not None:
+            append_value(value)
+            append_mask(1)
+        elif errors == "raise":
+            raise AddressError(message.format(index))
+        else:
+            append_mask(0)
+
+            if errors == "mask":
+                append_value(0)
+
+    return (values, mask)
+
+
+def parse_many(identifiers, errors="raise"):
+    """
+    Parses many hexadecimal identifiers in plain, hyphen, colon, or
+    dot notation, and returns a tuple of their 48-bit integers and a
+    validity mask.
+
+    Each identifier is validated in a single pass, and invalid
+    identifiers do not raise (unless `errors="raise"`).
+
+    If NumPy is installed, then the integers come back as a
+    MacAddressArray and the mask as a boolean `numpy.ndarray`.
+    Otherwise, the integers come back as an `array.array` of
+    type `Q` and the mask as a `bytearray` of zeroes and ones.
+
+    For example, if the user passes in `["a0b1c2d3e4f5", "0a"]`, then
+    parse_many will return the following.
+
+    `errors="raise"` raises AddressError for `0a`.
+
+    `errors="skip"` returns `([0xa0b1c2d3e4f5], [True, False])`.
+
+    `errors="mask"` returns `([0xa0b1c2d3e4f5, 0], [True, False])`.
+
+    Parameters
+    ----------
+    identifiers : iterable
+        Strings with twelve hexadecimal digits (0-9, A-F, or a-f).
+
+    errors : str
+        What to do with an invalid identifier, where errors is
+        raise, skip, or mask.
+
+        With raise, raise AddressError.
+
+        With skip, leave it out of the integers.
+
+        With mask, put zero in its place among the integers.
+
+        In all cases, the mask has one entry for each identifier.
+
+        The default value is raise.
+
+    Raises
+    ------
+    AddressError
+    ValueError
+    """
+
+    if errors not in ERRORS:
+        raise ValueError("Pass in raise, skip, or mask for errors.")
+
+    values, mask = convert_many(
+        identifiers,
+        parse_integer,
+        errors,
+        "Pass in 12 hexadecimal digits (item {})."
+    )
+
+    if numpy is None:
+        return (values, mask)
+
+    return (
+        MacAddressArray(numpy.frombuffer(values, dtype=numpy.uint64)),
+        numpy.frombuffer(mask, dtype=numpy.bool_)
+    )
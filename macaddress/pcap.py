@@ -0,0 +1,315 @@
+"""
+This module includes read_pcap, PcapChunk, and PcapError.
+"""
+
+from array import array
+
+from collections import namedtuple
+
+import mmap
+
+import struct
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .frames import ADDRESSES
+
+
+# Classic pcap files start with one of these magic numbers, which also
+# give the byte order and whether timestamps are in microseconds or
+# nanoseconds.  Pcapng files start with a section header block.
+
+PCAP_MICROSECONDS = 0xA1B2C3D4
+PCAP_NANOSECONDS = 0xA1B23C4D
+PCAPNG_SECTION = 0x0A0D0D0A
+PCAPNG_BYTE_ORDER = 0x1A2B3C4D
+PCAPNG_BYTE_ORDER_SWAPPED = 0x4D3C2B1A
+
+# Pcapng block types.
+
+PCAPNG_INTERFACE = 0x00000001
+PCAPNG_OBSOLETE_PACKET = 0x00000002
+PCAPNG_SIMPLE_PACKET = 0x00000003
+PCAPNG_ENHANCED_PACKET = 0x00000006
+
+# The if_tsresol option of an interface description block.
+
+PCAPNG_RESOLUTION = 9
+
+# The link type for Ethernet.
+
+ETHERNET = 1
+
+PcapChunk = namedtuple("PcapChunk", ["timestamps", "destinations", "sources"])
+
+
+class PcapError(Exception):
+    """
+    read_pcap raises PcapError if given a file that is not a pcap
+    or pcapng file with Ethernet frames.
+
+    Arguments
+    ---------
+    message : str
+        A human-readable error message.
+    """
+
+    pass
+
+
+class Columns(object):
+    # Collect timestamps and addresses, one packet at a time, into
+    # arrays of integers, and hand them out in chunks.
+
+    def __init__(self, chunk_size):
+        self.chunk_size = chunk_size
+        self.reset()
+
+    def reset(self):
+        self.timestamps = array("q")
+        self.destinations = array("Q")
+        self.sources = array("Q")
+
+    def add(self, buffer, position, timestamp):
+        high, low, source_high, source_low = ADDRESSES.unpack_from(
+            buffer,
+            position
+        )
+        self.timestamps.append(timestamp)
+        self.destinations.append(high << 32 | low)
+        self.sources.append(source_high << 32 | source_low)
+
+        return len(self.timestamps) >= self.chunk_size
+
+    def take(self):
+        if numpy is None:
+            chunk = PcapChunk(self.timestamps, self.destinations, self.sources)
+        else:
+            chunk = PcapChunk(
+                numpy.frombuffer(self.timestamps, dtype=numpy.int64),
+                MacAddressArray(
+                    numpy.frombuffer(self.destinations, dtype=numpy.uint64)
+                ),
+                MacAddressArray(
+                    numpy.frombuffer(self.sources, dtype=numpy.uint64)
+                )
+            )
+
+        self.reset()
+        return chunk
+
+    def __len__(self):
+        return len(self.timestamps)
+
+
+def read_pcap(path, chunk_size=65536):
+    """
+    Yields the timestamps, destination MAC addresses, and source MAC
+    addresses of the Ethernet frames in a pcap or pcapng file, in
+    chunks of up to `chunk_size` frames.
+
+    The file is memory-mapped and walked with `struct`, so no object
+    is built for any packet, and the file's size is not limited by
+    available memory.
+
+    Each chunk is a PcapChunk, whose `timestamps` are integers
+    (nanoseconds since the epoch) and whose `destinations` and
+    `sources` are 48-bit integers.  If NumPy is installed, then
+    the timestamps come back as an `int64` array and the addresses
+    as MacAddressArray instances.  Otherwise, they come back as
+    `array.array` instances.
+
+    Frames too short to hold both addresses are skipped, as are
+    packets captured on pcapng interfaces that are not Ethernet.
+
+    Parameters
+    ----------
+    path : str or path-like object
+        The pcap or pcapng file.
+
+    chunk_size : int
+        The maximum number of frames in each chunk.
+
+        The default value is 65536.
+
+    Raises
+    ------
+    PcapError
+    ValueError
+    """
+
+    if chunk_size < 1:
+        raise ValueError("Pass in a positive chunk size.")
+
+    with open(path, "rb") as file:
+        try:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            raise PcapError("Pass in a pcap or pcapng file.")
+
+    with buffer:
+        columns = Columns(chunk_size)
+
+        if len(buffer) < 4:
+            raise PcapError("Pass in a pcap or pcapng file.")
+
+        magic = struct.unpack_from("<I", buffer)[0]
+
+        if magic == PCAPNG_SECTION:
+            packets = read_pcapng_packets(buffer, columns)
+        else:
+            packets = read_classic_packets(buffer, columns)
+
+        for full in packets:
+            if full:
+                yield columns.take()
+
+        if len(columns):
+            yield columns.take()
+
+
+def read_classic_packets(buffer, columns):
+    # Walk the records of a classic pcap file, adding each frame to
+    # the columns, and report whether the columns are full.
+
+    for order in "<>":
+        magic = struct.unpack_from(order + "I", buffer)[0]
+
+        if magic in (PCAP_MICROSECONDS, PCAP_NANOSECONDS):
+            break
+    else:
+        raise PcapError("Pass in a pcap or pcapng file.")
+
+    if len(buffer) < 24:
+        raise PcapError("Pass in a complete pcap file.")
+
+    link_type = struct.unpack_from(order + "I", buffer, 20)[0]
+
+    if link_type & 0xFFFF != ETHERNET:
+        raise PcapError("Pass in a capture with Ethernet frames.")
+
+    scale = 1000 if magic == PCAP_MICROSECONDS else 1
+    record = struct.Struct(order + "IIII")
+    position = 24
+    size = len(buffer)
+
+    while position + record.size <= size:
+        seconds, fraction, captured, _ = record.unpack_from(buffer, position)
+        position += record.size
+
+        if position + captured > size:
+            raise PcapError("Pass in a complete pcap file.")
+
+        if captured >= ADDRESSES.size:
+            timestamp = seconds * 1000000000 + fraction * scale
+            yield columns.add(buffer, position, timestamp)
+
+        position += captured
+
+
+def read_resolution(buffer, order, start, end):
+    # Return the numerator and denominator that convert an interface's
+    # timestamps to nanoseconds, based on its if_tsresol option.
+
+    option = struct.Struct(order + "HH")
+    position = start
+
+    while position + option.size <= end:
+        code, length = option.unpack_from(buffer, position)
+        position += option.size
+
+        if code == 0:
+            break
+
+        if code == PCAPNG_RESOLUTION and length >= 1:
+            resolution = buffer[position]
+
+            if resolution & 0x80:
+                return (1000000000, 1 << (resolution & 0x7F))
+            else:
+                return (1000000000, 10 ** resolution)
+
+        position += (length + 3) & ~3
+
+    return (1000, 1)
+
+
+def read_pcapng_packets(buffer, columns):
+    # Walk the blocks of a pcapng file, adding each frame captured on
+    # an Ethernet interface to the columns, and report whether the
+    # columns are full.
+
+    size = len(buffer)
+    position = 0
+    order = "<"
+    interfaces = []
+
+    while position + 12 <= size:
+        block_type = struct.unpack_from(order + "I", buffer, position)[0]
+
+        if block_type == PCAPNG_SECTION:
+            # Each section sets its own byte order and interfaces.
+
+            magic = struct.unpack_from("<I", buffer, position + 8)[0]
+
+            if magic == PCAPNG_BYTE_ORDER:
+                order = "<"
+            elif magic == PCAPNG_BYTE_ORDER_SWAPPED:
+                order = ">"
+            else:
+                raise PcapError("Pass in a pcap or pcapng file.")
+
+            interfaces = []
+
+        length = struct.unpack_from(order + "I", buffer, position + 4)[0]
+
+        if length < 12 or length % 4 or position + length > size:
+            raise PcapError("Pass in a complete pcapng file.")
+
+        body = position + 8
+        end = position + length - 4
+
+        if block_type == PCAPNG_INTERFACE:
+            link_type = struct.unpack_from(order + "H", buffer, body)[0]
+            numerator, denominator = read_resolution(
+                buffer,
+                order,
+                body + 8,
+                end
+            )
+            interfaces.append(
+                (link_type == ETHERNET, numerator, denominator)
+            )
+        elif block_type in (PCAPNG_ENHANCED_PACKET, PCAPNG_OBSOLETE_PACKET):
+            if block_type == PCAPNG_ENHANCED_PACKET:
+                fields = struct.unpack_from(order + "IIII", buffer, body)
+                interface, high, low, captured = fields
+                data = body + 20
+            else:
+                fields = struct.unpack_from(order + "HHIII", buffer, body)
+                interface, _, high, low, captured = fields
+                data = body + 20
+
+            if interface >= len(interfaces):
+                raise PcapError("Pass in a complete pcapng file.")
+
+            ethernet, numerator, denominator = interfaces[interface]
+
+            if ethernet and captured >= ADDRESSES.size and \
+                    data + captured <= end:
+                timestamp = (high << 32 | low) * numerator // denominator
+                yield columns.add(buffer, data, timestamp)
+        elif block_type == PCAPNG_SIMPLE_PACKET:
+            # Simple packet blocks have no timestamp and belong to
+            # the first interface.
+
+            captured = end - (body + 4)
+
+            if interfaces and interfaces[0][0] and \
+                    captured >= ADDRESSES.size:
+                yield columns.add(buffer, body + 4, 0)
+
+        position += length
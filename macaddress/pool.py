@@ -0,0 +1,389 @@
+"""
+This module includes AddressPool and PoolError.
+"""
+
+from array import array
+
+import os
+
+import struct
+
+import tempfile
+
+from threading import Lock
+
+from .block import (
+    BlockError,
+    MacAddressBlock
+)
+
+from .ei48 import (
+    LOCAL_BIT,
+    MULTICAST_BIT
+)
+
+from .macaddress import (
+    AddressError,
+    MediaAccessControlAddress,
+    to_integer
+)
+
+from .octet import BINARY
+
+
+# The longest pool has a 24-bit prefix, so its bitmap takes 2 MiB.
+
+MIN_PREFIX_LENGTH = 24
+
+# A saved pool starts with a magic number and a header, which holds
+# the base address, the prefix length, and the number of addresses in
+# use.  The bitmap follows, with one bit for each address.
+
+MAGIC = b"MACPOOL\x01"
+HEADER = struct.Struct("<8sQII")
+
+# The number of bits set in each of the 256 possible octets, as a
+# table for bytes.translate.
+
+POPCOUNTS = bytes(binary.count("1") for binary in BINARY)
+
+
+class PoolError(Exception):
+    """
+    AddressPool raises PoolError if instantiated with an invalid
+    argument, asked to allocate from a full pool, or asked to reserve
+    or release an address that it cannot.
+
+    Arguments
+    ---------
+    message : str
+        A human-readable error message.
+    """
+
+    pass
+
+
+class AddressPool(object):
+    """
+    AddressPool hands out locally-administered unicast MAC addresses
+    from a block (for example, to virtual network interfaces) and
+    takes them back.
+
+    The pool keeps one bit for each address in a bitmap.  Allocating
+    takes the most recently released address or, if there is none,
+    the next free address after the last one allocated, so allocating
+    and releasing take constant time (amortized) however full the
+    pool is.
+
+    AddressPool is thread-safe, and it saves to and loads from a file
+    so that allocations survive a restart.
+
+    Attributes
+    ----------
+    block : MacAddressBlock
+        The block from which the pool allocates.
+
+    size : int
+        The number of addresses in the pool.
+
+    allocated : int
+        The number of addresses allocated or reserved.
+
+    available : int
+        The number of free addresses.
+
+    Parameters
+    ----------
+    prefix : str, int, ExtendedIdentifier48, or MacAddressBlock
+        The pool's block, or its base address.  The block's prefix
+        must cover the first octet, which must have the local bit
+        set and the multicast bit clear.
+
+    prefix_length : int
+        The number of bits in the block's prefix (24 to 48), if
+        `prefix` is a base address.
+
+        The default value is 24 (or the prefix length after the slash).
+
+    Raises
+    ------
+    PoolError
+    """
+
+    def __init__(self, prefix, prefix_length=None):
+        if not isinstance(prefix, MacAddressBlock):
+            try:
+                prefix = MacAddressBlock(prefix, prefix_length)
+            except BlockError as error:
+                raise PoolError(str(error))
+
+        if prefix.prefix_length < MIN_PREFIX_LENGTH:
+            raise PoolError(
+                "Pass in a prefix length from {} to 48.".format(
+                    MIN_PREFIX_LENGTH
+                )
+            )
+
+        first = prefix.base.decimal
+
+        if first & (MULTICAST_BIT | LOCAL_BIT) != LOCAL_BIT:
+            raise PoolError(
+                "Pass in a prefix of locally-administered unicast addresses."
+            )
+
+        self._block = prefix
+        self._first = first
+        self._size = prefix.num_addresses
+        self._bitmap = bytearray((self._size + 7) // 8)
+        self._count = 0
+        self._lock = Lock()
+
+        # The next index to check for a free address, and the indexes
+        # below it that were released since.
+
+        self._mark = 0
+        self._released = array("Q")
+
+    def __repr__(self):
+        return "AddressPool('{}')".format(self._block)
+
+    def __len__(self):
+        return self.allocated
+
+    @property
+    def block(self):
+        return self._block
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def allocated(self):
+        return self._count
+
+    @property
+    def available(self):
+        return self._size - self._count
+
+    def allocate(self):
+        """
+        Returns a free address and marks it as allocated.
+
+        Raises
+        ------
+        PoolError
+        """
+
+        with self._lock:
+            index = self._find_free()
+
+            if index is None:
+                raise PoolError("Release an address first.  The pool is full.")
+
+            self._set(index)
+
+        return MediaAccessControlAddress._from_value(self._first + index)
+
+    def reserve(self, address):
+        """
+        Marks a specific address as allocated, so that allocate never
+        returns it (for example, for a gateway).
+
+        Parameters
+        ----------
+        address : str, int, or ExtendedIdentifier48
+            An address in the pool.
+
+        Raises
+        ------
+        PoolError
+        """
+
+        index = self._index(address)
+
+        with self._lock:
+            if self._test(index):
+                raise PoolError("Pass in a free address.")
+
+            self._set(index)
+
+    def release(self, address):
+        """
+        Marks an allocated or reserved address as free.
+
+        Parameters
+        ----------
+        address : str, int, or ExtendedIdentifier48
+            An address in the pool.
+
+        Raises
+        ------
+        PoolError
+        """
+
+        index = self._index(address)
+
+        with self._lock:
+            if not self._test(index):
+                raise PoolError("Pass in an allocated address.")
+
+            self._bitmap[index >> 3] &= ~(1 << (index & 7))
+            self._count -= 1
+
+            # Addresses at or after the mark are found by scanning.
+
+            if index < self._mark:
+                self._released.append(index)
+
+    def is_allocated(self, address):
+        """
+        Returns whether an address is allocated or reserved.
+
+        Parameters
+        ----------
+        address : str, int, or ExtendedIdentifier48
+            An address in the pool.
+
+        Raises
+        ------
+        PoolError
+        """
+
+        index = self._index(address)
+
+        with self._lock:
+            return self._test(index)
+
+    def save(self, path):
+        """
+        Writes a snapshot of the pool to a file.
+
+        The snapshot is written to a temporary file in the same
+        directory, which then replaces the file in one step, so a
+        crash never leaves a partial snapshot behind.
+
+        Parameters
+        ----------
+        path : str or path-like object
+            The file to write.
+        """
+
+        with self._lock:
+            header = HEADER.pack(
+                MAGIC,
+                self._first,
+                self._block.prefix_length,
+                self._count
+            )
+            bitmap = bytes(self._bitmap)
+
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(header)
+                file.write(bitmap)
+                file.flush()
+                os.fsync(file.fileno())
+
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        """
+        Returns a pool restored from a snapshot written by save.
+
+        Parameters
+        ----------
+        path : str or path-like object
+            The file to read.
+
+        Raises
+        ------
+        PoolError
+        """
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        if len(data) < HEADER.size or data[:len(MAGIC)] != MAGIC:
+            raise PoolError("Pass in a saved pool.")
+
+        magic, first, prefix_length, count = HEADER.unpack_from(data)
+        pool = cls(first, prefix_length)
+        bitmap = data[HEADER.size:]
+
+        if len(bitmap) != len(pool._bitmap):
+            raise PoolError("Pass in a saved pool.")
+
+        # The header's count must match the bitmap, and the bitmap
+        # must not mark any address past the end of the pool.
+
+        unused = len(bitmap) * 8 - pool._size
+
+        if bitmap and bitmap[-1] >> (8 - unused):
+            raise PoolError("Pass in a saved pool.")
+
+        if count != sum(bitmap.translate(POPCOUNTS)):
+            raise PoolError("Pass in a saved pool.")
+
+        pool._bitmap[:] = bitmap
+        pool._count = count
+        return pool
+
+    def _index(self, address):
+        # Convert an address to its position in the bitmap.
+
+        try:
+            value = to_integer(address)
+        except AddressError:
+            raise PoolError("Pass in a valid address.")
+
+        index = value - self._first
+
+        if not 0 <= index < self._size:
+            raise PoolError("Pass in an address in the pool.")
+
+        return index
+
+    def _test(self, index):
+        return bool(self._bitmap[index >> 3] & (1 << (index & 7)))
+
+    def _set(self, index):
+        self._bitmap[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def _find_free(self):
+        # Prefer the most recently released address.  An address that
+        # was reserved after its release is skipped.
+
+        while self._released:
+            index = self._released.pop()
+
+            if not self._test(index):
+                return index
+
+        # Otherwise, scan forward from the mark, skipping a whole byte
+        # of the bitmap at a time where every address is in use.
+
+        bitmap = self._bitmap
+        index = self._mark
+
+        while index < self._size:
+            octet = bitmap[index >> 3]
+
+            if octet == 0xFF:
+                index = (index | 7) + 1
+            elif octet & (1 << (index & 7)):
+                index += 1
+            else:
+                self._mark = index + 1
+                return index
+
+        self._mark = self._size
+        return None
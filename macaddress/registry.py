@@ -0,0 +1,551 @@
+"""
+This module includes Registry, CompiledRegistry, RegistryError,
+compile_registry, load_registry, lookup_vendor, and lookup_vendors.
+"""
+
+from array import array
+
+from bisect import bisect_left
+
+import csv
+
+import mmap
+
+import struct
+
+import sys
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .macaddress import to_integer
+
+
+# The IEEE assigns blocks with 24-bit (MA-L and CID), 28-bit (MA-M),
+# and 36-bit (MA-S) prefixes.  Search the longest prefixes first.
+
+BITS = (36, 28, 24)
+
+# A compiled registry starts with a header holding a magic number, the
+# number of prefixes of each size, the number of names, and the size
+# of the string pool.  It continues with the prefixes (as unsigned
+# 64-bit integers), the name indexes (as unsigned 32-bit integers),
+# the offset of each name in the string pool (also as unsigned 32-bit
+# integers), and then the string pool (as UTF-8).  All integers are
+# little-endian, and the header keeps the prefixes 8-byte aligned.
+
+MAGIC = b"MACREG\x00\x01"
+HEADER = struct.Struct("<8sIIIIII")
+
+default_registry = None
+
+
+class RegistryError(Exception):
+    """
+    Registry raises RegistryError if given an invalid assignment.
+
+    Arguments
+    ---------
+    message : str
+        A human-readable error message.
+    """
+
+    pass
+
+
+class Registry(object):
+    """
+    Registry makes it easy to find the organization to which the IEEE
+    assigned a MAC address's OUI or CID.
+
+    Registry holds one sorted array of prefixes for each of the 24-,
+    28-, and 36-bit assignment sizes, along with one shared tuple
+    of organization names, so a lookup is a binary search rather
+    than a scan.  The longest matching prefix wins.
+
+    Attributes
+    ----------
+    names : tuple
+        Each distinct organization name.
+
+    Parameters
+    ----------
+    assignments : iterable
+        Tuples of the assignment's hexadecimal digits (6, 7, or 9
+        digits, as in the IEEE's registries) and the organization's
+        name.
+
+    Raises
+    ------
+    RegistryError
+    """
+
+    def __init__(self, assignments=()):
+        entries = {bits: {} for bits in BITS}
+        indexes = {}
+
+        for digits, name in assignments:
+            bits = len(digits) * 4
+
+            if bits not in entries:
+                raise RegistryError(
+                    "Pass in 6, 7, or 9 hexadecimal digits."
+                )
+
+            try:
+                prefix = int(digits, base=16)
+            except ValueError:
+                raise RegistryError(
+                    "Pass in 6, 7, or 9 hexadecimal digits."
+                )
+
+            # Store each distinct name once.
+
+            index = indexes.setdefault(name, len(indexes))
+            entries[bits][prefix] = index
+
+        self.names = tuple(indexes)
+        self._prefixes = {}
+        self._indexes = {}
+
+        for bits in BITS:
+            prefixes = sorted(entries[bits])
+            self._prefixes[bits] = array("Q", prefixes)
+            self._indexes[bits] = array(
+                "I",
+                [entries[bits][prefix] for prefix in prefixes]
+            )
+
+    @classmethod
+    def from_csv(cls, *paths):
+        """
+        Returns a Registry built from one or more of the IEEE's
+        registry files in CSV format (for example, `oui.csv`,
+        `mam.csv`, `oui36.csv`, and `cid.csv`).
+
+        Each file's first row is a header, and each subsequent row
+        has the registry, the assignment, and the organization's
+        name as its first three columns.
+
+        Parameters
+        ----------
+        paths : str or path-like object
+            The files to load.
+
+        Raises
+        ------
+        RegistryError
+        """
+
+        def assignments():
+            for path in paths:
+                with open(path, newline="", encoding="utf-8") as file:
+                    rows = csv.reader(file)
+                    next(rows, None)
+
+                    for row in rows:
+                        if len(row) >= 3:
+                            yield (row[1].strip(), row[2].strip())
+
+        return cls(assignments())
+
+    def __repr__(self):
+        return "Registry({} assignments)".format(len(self))
+
+    def __len__(self):
+        return sum(len(self._prefixes[bits]) for bits in BITS)
+
+    def lookup(self, address):
+        """
+        Returns the name of the organization to which the IEEE
+        assigned the MAC address's OUI or CID, or None if the
+        registry has no matching assignment.
+
+        Parameters
+        ----------
+        address : str, int, or ExtendedIdentifier48
+            The MAC address.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        value = to_integer(address)
+
+        for bits in BITS:
+            prefixes = self._prefixes[bits]
+            prefix = value >> (48 - bits)
+            index = bisect_left(prefixes, prefix)
+
+            if index < len(prefixes) and prefixes[index] == prefix:
+                return self.names[self._indexes[bits][index]]
+
+        return None
+
+    def lookup_many(self, addresses):
+        """
+        Returns a list with the name of the organization for each
+        MAC address (or None where the registry has no matching
+        assignment).
+
+        If NumPy is installed, then the lookups are vectorized.
+
+        Parameters
+        ----------
+        addresses : iterable
+            The MAC addresses, in any form that MacAddressArray
+            accepts.
+
+        Raises
+        ------
+        AddressError
+        """
+
+        if numpy is None:
+            return [self.lookup(address) for address in addresses]
+
+        values = MacAddressArray(addresses).decimal
+        found = numpy.full(len(values), -1, dtype=numpy.int64)
+
+        for bits in BITS:
+            prefixes = numpy.frombuffer(self._prefixes[bits], numpy.uint64)
+
+            if not len(prefixes):
+                continue
+
+            wanted = values >> numpy.uint64(48 - bits)
+            positions = numpy.searchsorted(prefixes, wanted)
+            positions[positions == len(prefixes)] = 0
+            matches = (prefixes[positions] == wanted) & (found < 0)
+
+            indexes = numpy.frombuffer(self._indexes[bits], numpy.uintc)
+            found[matches] = indexes[positions[matches]]
+
+        names = self.names
+        return [names[index] if index >= 0 else None for index in found]
+
+    def save(self, path):
+        """
+        Writes the registry to a file in the compiled format that
+        CompiledRegistry reads.
+
+        Parameters
+        ----------
+        path : str or path-like object
+            The file to write.
+        """
+
+        names = [name.encode("utf-8") for name in self.names]
+        offsets = array("I", [0])
+
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+
+        sections = [self._prefixes[bits] for bits in BITS]
+        sections += [self._indexes[bits] for bits in BITS]
+        sections.append(offsets)
+
+        header = HEADER.pack(
+            MAGIC,
+            *[len(self._prefixes[bits]) for bits in BITS],
+            len(names),
+            offsets[-1],
+            0
+        )
+
+        with open(path, "wb") as file:
+            file.write(header)
+
+            for section in sections:
+                if sys.byteorder == "big":
+                    section = array(section.typecode, section)
+                    section.byteswap()
+
+                file.write(section.tobytes())
+
+            file.write(b"".join(names))
+
+
+class NamePool(object):
+    """
+    NamePool decodes organization names from a compiled registry's
+    string pool on demand.
+
+    Parameters
+    ----------
+    offsets : sequence
+        The offset of each name in the pool, followed by the size
+        of the pool.
+
+    pool : bytes-like object
+        The UTF-8 string pool.
+    """
+
+    def __init__(self, offsets, pool):
+        self._offsets = offsets
+        self._pool = pool
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError("Pass in the index of a name.")
+
+        start = self._offsets[index]
+        end = self._offsets[index + 1]
+        return str(self._pool[start:end], "utf-8")
+
+
+class CompiledRegistry(Registry):
+    """
+    CompiledRegistry answers the same lookups as Registry, but from
+    a file written by `Registry.save` or compile_registry.
+
+    The file is memory-mapped, and lookups binary-search its prefixes
+    in place, so loading it takes next to no time or memory, and
+    processes that load the same file share one copy of it through
+    the operating system's page cache.
+
+    Attributes
+    ----------
+    names : NamePool
+        Each distinct organization name.
+
+    path : str or path-like object
+        The compiled registry file.
+
+    Parameters
+    ----------
+    path : str or path-like object
+        The compiled registry file.
+
+    Raises
+    ------
+    RegistryError
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+        with open(path, "rb") as file:
+            try:
+                self._mmap = mmap.mmap(
+                    file.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ
+                )
+            except ValueError:
+                raise RegistryError("Pass in a compiled registry.")
+
+        # Every view into the file, so that close can release them.
+
+        buffer = memoryview(self._mmap)
+        self._views = [buffer]
+
+        try:
+            self._read(buffer)
+        except (RegistryError, struct.error, TypeError):
+            # Leave the file to the garbage collector, as views into
+            # it may still be alive.
+
+            self._prefixes = None
+            self._indexes = None
+            raise RegistryError("Pass in a compiled registry.")
+
+    def _read(self, buffer):
+        fields = HEADER.unpack_from(buffer)
+
+        if fields[0] != MAGIC:
+            raise RegistryError("Pass in a compiled registry.")
+
+        counts = dict(zip(BITS, fields[1:4]))
+        name_count, pool_size = fields[4:6]
+
+        def take(start, typecode, count):
+            # Read the section in place, or copy and swap its bytes
+            # on a big-endian machine.
+
+            size = array(typecode).itemsize * count
+            section = buffer[start:start + size].cast(typecode)
+
+            if len(section) != count:
+                raise RegistryError("Pass in a compiled registry.")
+
+            if sys.byteorder == "big":
+                section = array(typecode, section)
+                section.byteswap()
+            else:
+                self._views.append(section)
+
+            return (section, start + size)
+
+        position = HEADER.size
+        self._prefixes = {}
+        self._indexes = {}
+
+        for bits in BITS:
+            self._prefixes[bits], position = take(position, "Q", counts[bits])
+
+        for bits in BITS:
+            self._indexes[bits], position = take(position, "I", counts[bits])
+
+        offsets, position = take(position, "I", name_count + 1)
+
+        if position + pool_size != len(buffer):
+            raise RegistryError("Pass in a compiled registry.")
+
+        pool = buffer[position:]
+        self._views.append(pool)
+        self.names = NamePool(offsets, pool)
+
+    def __repr__(self):
+        return "CompiledRegistry('{}')".format(self.path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def close(self):
+        """
+        Unmaps the compiled registry file.
+
+        If this registry is the default registry, then lookup_vendor
+        and lookup_vendors no longer use it.
+        """
+
+        global default_registry
+
+        if default_registry is self:
+            default_registry = None
+
+        self._prefixes = {bits: array("Q") for bits in BITS}
+        self._indexes = {bits: array("I") for bits in BITS}
+        self.names = NamePool((0,), b"")
+
+        # Release the views before unmapping the file, including any
+        # that the caller still holds through an old NamePool.  If the
+        # caller holds a buffer exported from one of them, then leave
+        # the file to the garbage collector instead.
+
+        views, self._views = self._views, []
+
+        try:
+            for view in views:
+                view.release()
+
+            self._mmap.close()
+        except BufferError:
+            pass
+
+
+def is_compiled(path):
+    # Check for the magic number at the start of the file.
+
+    with open(path, "rb") as file:
+        return file.read(len(MAGIC)) == MAGIC
+
+
+def compile_registry(output, *paths):
+    """
+    Builds a Registry from one or more of the IEEE's registry files
+    in CSV format and writes it to a file in the compiled format.
+
+    Compile the registry once (for example, at build or deployment
+    time), then load the compiled file with load_registry or
+    CompiledRegistry wherever it is needed.
+
+    Parameters
+    ----------
+    output : str or path-like object
+        The compiled registry file to write.
+
+    paths : str or path-like object
+        The files to load.
+
+    Raises
+    ------
+    RegistryError
+    """
+
+    Registry.from_csv(*paths).save(output)
+
+
+def load_registry(*paths):
+    """
+    Loads a registry, makes it the default registry, and returns it.
+
+    Pass in either one or more of the IEEE's registry files in CSV
+    format, which are parsed into a Registry, or a single file from
+    compile_registry, which is memory-mapped as a CompiledRegistry.
+
+    The default registry backs `MediaAccessControlAddress.vendor`,
+    lookup_vendor, and lookup_vendors.
+
+    Parameters
+    ----------
+    paths : str or path-like object
+        The files to load.
+
+    Raises
+    ------
+    RegistryError
+    """
+
+    global default_registry
+
+    if len(paths) == 1 and is_compiled(paths[0]):
+        default_registry = CompiledRegistry(paths[0])
+    else:
+        default_registry = Registry.from_csv(*paths)
+
+    return default_registry
+
+
+def lookup_vendor(address):
+    """
+    Returns the name of the organization for a MAC address from the
+    default registry, or None if the default registry has no matching
+    assignment or if no registry has been loaded.
+
+    Parameters
+    ----------
+    address : str, int, or ExtendedIdentifier48
+        The MAC address.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if default_registry is None:
+        return None
+
+    return default_registry.lookup(address)
+
+
+def lookup_vendors(addresses):
+    """
+    Returns a list with the name of the organization for each MAC
+    address from the default registry (or None where there is no
+    matching assignment).
+
+    Parameters
+    ----------
+    addresses : iterable
+        The MAC addresses.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if default_registry is None:
+        return [None for address in addresses]
+
+    return default_registry.lookup_many(addresses)
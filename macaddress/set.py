@@ -0,0 +1,272 @@
+"""
+This module includes MacAddressSet.
+"""
+
+from array import array
+
+from bisect import bisect_left
+
+from .array import (
+    MacAddressArray,
+    numpy
+)
+
+from .macaddress import (
+    AddressError,
+    MediaAccessControlAddress,
+    to_integer
+)
+
+
+def merge(left, right, keep_left, keep_both, keep_right):
+    # Walk two sorted arrays of unique integers in step, keeping the
+    # integers found only on the left, in both, or only on the right.
+
+    result = array("Q")
+    append = result.append
+    i = j = 0
+    left_size = len(left)
+    right_size = len(right)
+
+    while i < left_size and j < right_size:
+        x = left[i]
+        y = right[j]
+
+        if x < y:
+            if keep_left:
+                append(x)
+
+            i += 1
+        elif y < x:
+            if keep_right:
+                append(y)
+
+            j += 1
+        else:
+            if keep_both:
+                append(x)
+
+            i += 1
+            j += 1
+
+    if keep_left:
+        result.extend(left[i:])
+
+    if keep_right:
+        result.extend(right[j:])
+
+    return result
+
+
+class MacAddressSet(object):
+    """
+    MacAddressSet makes it easy to hold many distinct media access
+    control (MAC) addresses in little memory.
+
+    It stores each address once, as a 48-bit integer in a sorted
+    array, so membership tests are binary searches and set algebra
+    merges two sorted arrays (or, if NumPy is installed, runs as
+    vectorized NumPy operations).
+
+    Like `frozenset`, MacAddressSet is immutable and hashable, so sets
+    may serve as dictionary keys or members of other sets.
+
+    Attributes
+    ----------
+    decimal : array.array
+        The sorted `array.array` of addresses (with type `Q`).
+        Treat it as read-only.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as strings in plain, hyphen, colon, or dot notation,
+        as integers, as instances of ExtendedIdentifier48, or as a
+        MacAddressArray or MacAddressSet.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    def __init__(self, addresses=()):
+        if isinstance(addresses, MacAddressSet):
+            self._values = addresses.decimal
+        elif numpy is not None:
+            values = numpy.unique(MacAddressArray(addresses).decimal)
+            self._values = array("Q", values.tobytes())
+        else:
+            values = sorted(set(map(to_integer, addresses)))
+            self._values = array("Q", values)
+
+    @classmethod
+    def _from_sorted(cls, values):
+        # Wrap an array of integers that is already sorted and unique.
+
+        instance = cls.__new__(cls)
+        instance._values = values
+        return instance
+
+    def __repr__(self):
+        return "MacAddressSet([{}])".format(
+            ", ".join(
+                "'{}'".format(format(value, "012x"))
+                for value in self._values
+            )
+        )
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        for value in self._values:
+            yield MediaAccessControlAddress._from_value(value)
+
+    def __contains__(self, address):
+        try:
+            value = to_integer(address)
+        except AddressError:
+            return False
+
+        values = self._values
+        index = bisect_left(values, value)
+        return index < len(values) and values[index] == value
+
+    def __eq__(self, other):
+        if not isinstance(other, MacAddressSet):
+            return NotImplemented
+
+        return self._values == other._values
+
+    def __hash__(self):
+        # Hash the packed, sorted integers once, as equal sets pack
+        # to equal bytes.
+
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(self._values.tobytes())
+            return self._hash
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __xor__(self, other):
+        return self.symmetric_difference(other)
+
+    @property
+    def decimal(self):
+        return self._values
+
+    def _combine(self, other, keep_left, keep_both, keep_right):
+        if not isinstance(other, MacAddressSet):
+            other = MacAddressSet(other)
+
+        if numpy is None:
+            values = merge(
+                self._values,
+                other._values,
+                keep_left,
+                keep_both,
+                keep_right
+            )
+
+            return self._from_sorted(values)
+
+        left = numpy.frombuffer(self._values, dtype=numpy.uint64)
+        right = numpy.frombuffer(other._values, dtype=numpy.uint64)
+        left_in_right = numpy.isin(left, right, assume_unique=True)
+        pieces = [numpy.empty(0, dtype=numpy.uint64)]
+
+        if keep_left:
+            pieces.append(left[~left_in_right])
+
+        if keep_both:
+            pieces.append(left[left_in_right])
+
+        if keep_right:
+            right_in_left = numpy.isin(right, left, assume_unique=True)
+            pieces.append(right[~right_in_left])
+
+        values = numpy.sort(numpy.concatenate(pieces))
+        return self._from_sorted(array("Q", values.tobytes()))
+
+    def union(self, other):
+        """
+        Returns a MacAddressSet with the addresses in either set.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return self._combine(other, True, True, True)
+
+    def intersection(self, other):
+        """
+        Returns a MacAddressSet with the addresses in both sets.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return self._combine(other, False, True, False)
+
+    def difference(self, other):
+        """
+        Returns a MacAddressSet with the addresses in this set
+        but not in the other.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return self._combine(other, True, False, False)
+
+    def symmetric_difference(self, other):
+        """
+        Returns a MacAddressSet with the addresses in exactly
+        one of the sets.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return self._combine(other, True, False, True)
+
+    def isdisjoint(self, other):
+        """
+        Returns whether the sets have no addresses in common.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return not len(self.intersection(other))
+
+    def issubset(self, other):
+        """
+        Returns whether every address in this set is in the other.
+
+        Parameters
+        ----------
+        other : iterable
+            A MacAddressSet or any addresses that it accepts.
+        """
+
+        return not len(self.difference(other))
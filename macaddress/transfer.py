@@ -0,0 +1,83 @@
+"""
+This module includes pack_many and unpack_many.
+"""
+
+from array import array
+
+import sys
+
+from .macaddress import (
+    AddressError,
+    MediaAccessControlAddress,
+    to_integer
+)
+
+
+def pack_many(addresses):
+    """
+    Returns many MAC addresses packed into bytes, eight bytes per
+    address, for sending to another process (for example, through
+    a `multiprocessing` queue) or storing.
+
+    The bytes hold each address's 48-bit integer equivalent in
+    little-endian order, whatever the machine's byte order, so they
+    are a fraction of the size of the pickled addresses.
+
+    For example, if the user passes in `["a0:b1:c2:d3:e4:f5"]`, then
+    pack_many will return `b"\\xf5\\xe4\\xd3\\xc2\\xb1\\xa0\\x00\\x00"`.
+
+    Parameters
+    ----------
+    addresses : iterable
+        Addresses as a MacAddressArray, as strings in plain, hyphen,
+        colon, or dot notation, as integers, or as instances of
+        ExtendedIdentifier48.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    values = array("Q", map(to_integer, addresses))
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values.tobytes()
+
+
+def unpack_many(data, cls=MediaAccessControlAddress):
+    """
+    Returns a list of MAC addresses from bytes packed by pack_many,
+    built without validating them again.
+
+    Each address's original is its plain notation, as pack_many keeps
+    only the 48-bit integers.
+
+    Parameters
+    ----------
+    data : bytes-like object
+        The packed addresses.
+
+    cls : type
+        The class to instantiate, which is MediaAccessControlAddress
+        or another subclass of ExtendedIdentifier48.
+
+        The default value is MediaAccessControlAddress.
+
+    Raises
+    ------
+    AddressError
+    """
+
+    if len(data) % 8:
+        raise AddressError("Pass in eight bytes per address.")
+
+    values = array("Q")
+    values.frombytes(data)
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    from_value = cls._from_value
+    return [from_value(value) for value in values]
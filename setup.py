@@ -20,10 +20,20 @@ setup(
     ],
     keywords="python media-access-control mac macaddress mac-address networking",
     packages=find_packages(),
+    python_requires=">=3.7",
     extras_require={
+        "benchmark": [
+            "numpy",
+            "pytest>=3.6",
+            "pytest-benchmark"
+        ],
+        "numpy": [
+            "numpy"
+        ],
         "test": [
             "coveralls",
             "flake8",
+            "numpy",
             "pytest>=3.6",
             "pytest-cov"
         ]
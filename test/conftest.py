@@ -0,0 +1,18 @@
+from pytest import (
+    fixture,
+    importorskip
+)
+
+
+@fixture(params=[True, False], ids=["numpy", "no-numpy"])
+def with_numpy(request, monkeypatch, numpy_module):
+    # Run a test with and without NumPy in the module under test,
+    # which each test module names by overriding numpy_module.
+
+    if request.param:
+        numpy = importorskip("numpy")
+        monkeypatch.setattr(numpy_module, "numpy", numpy)
+    else:
+        monkeypatch.setattr(numpy_module, "numpy", None)
+
+    return request.param
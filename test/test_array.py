@@ -0,0 +1,143 @@
+from pytest import (
+    importorskip,
+    mark,
+    raises
+)
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from constants import (
+    BROADCAST,
+    MULTICAST,
+    UAA_UNICAST,
+    LAA_UNICAST
+)
+
+numpy = importorskip("numpy")
+
+from macaddress.array import MacAddressArray  # noqa: E402
+
+
+ADDRESSES = [BROADCAST, MULTICAST, UAA_UNICAST, LAA_UNICAST]
+
+PROPERTIES = [
+    "is_broadcast",
+    "is_multicast",
+    "is_unicast",
+    "is_uaa",
+    "is_laa",
+    "type",
+    "has_oui",
+    "has_cid"
+]
+
+
+@mark.parametrize("name", PROPERTIES)
+def test_properties(name):
+    macs = MacAddressArray(ADDRESSES)
+
+    expected = [
+        getattr(MediaAccessControlAddress(address), name)
+        for address in ADDRESSES
+    ]
+
+    assert list(getattr(macs, name)) == expected
+
+
+@mark.parametrize("bits", [24, 36])
+def test_to_fragments(bits):
+    macs = MacAddressArray(ADDRESSES)
+
+    prefixes, suffixes = macs.to_fragments(bits=bits)
+
+    for address, prefix, suffix in zip(ADDRESSES, prefixes, suffixes):
+        expected = MediaAccessControlAddress(address).to_fragments(bits=bits)
+        assert (int(prefix), int(suffix)) == tuple(
+            int(fragment, base=16) for fragment in expected
+        )
+
+
+def test_mixed_inputs():
+    ints = numpy.array([0xa0b1c2d3e4f5, 0], dtype=numpy.int64)
+
+    macs = MacAddressArray(
+        [
+            "00-00-00-00-00-00",
+            0xa0b1c2d3e4f5,
+            MediaAccessControlAddress(UAA_UNICAST)
+        ]
+    )
+
+    assert macs.decimal.dtype == numpy.uint64
+    assert list(macs.decimal) == [0, 0xa0b1c2d3e4f5, 0xa0b1c2d3e4f5]
+    assert list(MacAddressArray(ints).decimal) == [0xa0b1c2d3e4f5, 0]
+    assert list(MacAddressArray(macs).decimal) == list(macs.decimal)
+    assert list(MacAddressArray(list(macs.decimal)).decimal) == \
+        list(macs.decimal)
+    assert len(MacAddressArray()) == 0
+
+
+def test_sequence():
+    macs = MacAddressArray(ADDRESSES)
+
+    assert len(macs) == 4
+    assert str(macs[2]) == UAA_UNICAST
+    assert isinstance(macs[1:3], MacAddressArray)
+    assert [str(mac) for mac in macs[1:3]] == [MULTICAST, UAA_UNICAST]
+    assert [str(mac) for mac in macs[macs.is_laa]] == [LAA_UNICAST]
+    assert repr(macs[2:]) == "MacAddressArray(['{}', '{}'])".format(
+        UAA_UNICAST,
+        LAA_UNICAST
+    )
+    assert numpy.asarray(macs) is macs.decimal
+
+
+def test_array_copy():
+    macs = MacAddressArray([UAA_UNICAST, LAA_UNICAST])
+
+    copied = numpy.asarray(macs, copy=True)
+    copied[0] = 0
+
+    assert str(macs[0]) == UAA_UNICAST
+    assert numpy.asarray(macs, copy=False) is macs.decimal
+    assert numpy.asarray(macs, dtype=numpy.int64).dtype == numpy.int64
+
+    with raises(ValueError):
+        numpy.asarray(macs, dtype=numpy.int64, copy=False)
+
+
+@mark.parametrize(
+    "addresses",
+    [
+        ["0a"],
+        [-1],
+        [1 << 48],
+        numpy.array([-1]),
+        numpy.array([1 << 48], dtype=numpy.uint64)
+    ]
+)
+def test_address_error(addresses):
+    with raises(AddressError):
+        MacAddressArray(addresses)
+
+
+def test_bit_reverse():
+    macs = MacAddressArray(ADDRESSES)
+    expected = [
+        MediaAccessControlAddress(address).bit_reverse().decimal
+        for address in ADDRESSES
+    ]
+
+    assert macs.bit_reverse().decimal.tolist() == expected
+    assert macs.bit_reverse().bit_reverse().decimal.tolist() == [
+        mac.decimal for mac in macs
+    ]
+
+    # A strided view is copied before its bytes are looked up.
+
+    strided = MacAddressArray(macs.decimal[::2])
+
+    assert strided.bit_reverse().decimal.tolist() == expected[::2]
@@ -0,0 +1,176 @@
+from pytest import (
+    importorskip,
+    mark,
+    raises
+)
+
+from macaddress.block import (
+    BlockError,
+    MacAddressBlock,
+    collapse_blocks
+)
+
+from macaddress.macaddress import MediaAccessControlAddress
+
+
+def test_block(capsys):
+    block = MacAddressBlock("a0:b1:c2:00:00:00/24")
+
+    assert block == MacAddressBlock("a0b1c2000000")
+    assert block == MacAddressBlock(0xa0b1c2000000, 24)
+    assert block.prefix_length == 24
+    assert block.num_addresses == 1 << 24
+    assert str(block.base) == "a0b1c2000000"
+    assert str(block.last) == "a0b1c2ffffff"
+    assert block.values() == range(0xa0b1c2000000, 0xa0b1c3000000)
+    assert repr(block) == "MacAddressBlock('a0b1c2000000/24')"
+
+    print(block)
+    stdout, stderr = capsys.readouterr()
+    assert stdout == "a0b1c2000000/24\n"
+
+
+def test_contains():
+    block = MacAddressBlock("70b3d5f00000/28")
+
+    assert "70-b3-d5-f2-f0-01" in block
+    assert 0x70b3d5ffffff in block
+    assert MediaAccessControlAddress("70b3d5f00000") in block
+    assert "70b3d5e00000" not in block
+    assert "0a" not in block
+    assert MacAddressBlock("70b3d5f2f000/36") in block
+    assert MacAddressBlock("70b3d5000000/24") not in block
+
+
+def test_contains_numpy_integers():
+    numpy = importorskip("numpy")
+    block = MacAddressBlock("70b3d5f00000/28")
+
+    assert numpy.uint64(0x70b3d5ffffff) in block
+    assert numpy.int64(0x70b3d5f00000) in block
+    assert numpy.uint64(0x70b3d5e00000) not in block
+
+
+def test_iteration():
+    block = MacAddressBlock("a0b1c2d3e4f0/44")
+
+    macs = list(block)
+
+    assert len(macs) == 16
+    assert str(macs[0]) == "a0b1c2d3e4f0"
+    assert str(macs[-1]) == "a0b1c2d3e4ff"
+    assert str(block[5]) == "a0b1c2d3e4f5"
+    assert str(block[-1]) == "a0b1c2d3e4ff"
+    assert len(list(MacAddressBlock("a0b1c2d3e4f5/48"))) == 1
+
+    with raises(IndexError):
+        block[16]
+
+
+def test_slicing():
+    block = MacAddressBlock("a0b1c2d3e4f0/44")
+
+    assert [str(mac) for mac in block[0:2]] == ["a0b1c2d3e4f0", "a0b1c2d3e4f1"]
+    assert [str(mac) for mac in block[-2:]] == ["a0b1c2d3e4fe", "a0b1c2d3e4ff"]
+    assert [mac.decimal for mac in block[::8]] == [
+        0xa0b1c2d3e4f0,
+        0xa0b1c2d3e4f8
+    ]
+    assert list(block[20:]) == []
+    assert next(MacAddressBlock(0, 0)[1 << 47:]).decimal == 1 << 47
+
+
+def test_subnets_and_supernet():
+    block = MacAddressBlock("a0b1c2000000/24")
+
+    assert list(block.subnets()) == [
+        MacAddressBlock("a0b1c2000000/25"),
+        MacAddressBlock("a0b1c2800000/25")
+    ]
+    assert len(list(block.subnets(new_prefix_length=28))) == 16
+    assert list(block.subnets(prefix_length_diff=0)) == [block]
+    assert block.supernet() == MacAddressBlock("a0b1c2000000/23")
+    assert block.supernet(new_prefix_length=0) == MacAddressBlock(0, 0)
+
+    with raises(BlockError):
+        list(block.subnets(new_prefix_length=49))
+
+    with raises(BlockError):
+        block.supernet(new_prefix_length=25)
+
+
+def test_ordering():
+    blocks = [
+        MacAddressBlock("a0b1c2000000/24"),
+        MacAddressBlock("a0b1c2000000/25"),
+        MacAddressBlock("0180c2000000/24")
+    ]
+
+    assert sorted(blocks) == [blocks[2], blocks[0], blocks[1]]
+    assert len(set(blocks + [MacAddressBlock("a0b1c2000000/24")])) == 3
+    assert blocks[0] != "a0b1c2000000/24"
+    assert blocks[2] < blocks[0] < blocks[1]
+    assert blocks[0] <= blocks[0] <= blocks[1]
+    assert blocks[1] > blocks[0] > blocks[2]
+    assert blocks[1] >= blocks[1] >= blocks[0]
+    assert not blocks[0] > blocks[1]
+
+    with raises(TypeError):
+        blocks[0] <= "a0b1c2000000/24"
+
+
+def test_strict():
+    assert MacAddressBlock("a0b1c2d3e4f5/24", strict=False) == (
+        MacAddressBlock("a0b1c2000000/24")
+    )
+
+    with raises(BlockError):
+        MacAddressBlock("a0b1c2d3e4f5/24")
+
+
+@mark.parametrize(
+    ("address", "prefix_length"),
+    [
+        ("0a/24", None),
+        ("a0b1c2000000/x", None),
+        ("a0b1c2000000/49", None),
+        ("a0b1c2000000/24", 24),
+        ("a0b1c2000000", -1),
+        (1 << 48, 24)
+    ]
+)
+def test_block_error(address, prefix_length):
+    with raises(BlockError):
+        MacAddressBlock(address, prefix_length)
+
+
+@mark.parametrize(
+    ("blocks", "expected"),
+    [
+        (
+            ["a0b1c2000000/25", "a0b1c2800000/25"],
+            ["a0b1c2000000/24"]
+        ),
+        (
+            ["a0b1c2000000/24", "a0b1c2400000/26", "a0b1c3000000/24"],
+            ["a0b1c2000000/23"]
+        ),
+        (
+            ["a0b1c3000000/24", "a0b1c4000000/24"],
+            ["a0b1c3000000/24", "a0b1c4000000/24"]
+        ),
+        (
+            ["a0b1c2000001/48", "a0b1c2000002/47"],
+            ["a0b1c2000001/48", "a0b1c2000002/47"]
+        ),
+        (
+            ["000000000000/1", "800000000000/1"],
+            ["000000000000/0"]
+        ),
+        ([], [])
+    ]
+)
+def test_collapse_blocks(blocks, expected):
+    assert collapse_blocks(map(MacAddressBlock, blocks)) == [
+        MacAddressBlock(block) for block in expected
+    ]
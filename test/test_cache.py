@@ -0,0 +1,134 @@
+import gc
+
+from threading import Thread
+
+from pytest import raises
+
+from macaddress.cache import (
+    AddressCache,
+    CacheInfo
+)
+
+from macaddress.ei48 import ExtendedIdentifier48
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from constants import (
+    UAA_UNICAST,
+    LAA_UNICAST,
+    MULTICAST
+)
+
+
+def test_hit_and_miss():
+    cache = AddressCache()
+
+    mac = cache(UAA_UNICAST)
+
+    assert isinstance(mac, MediaAccessControlAddress)
+    assert cache(UAA_UNICAST) is mac
+    assert cache.get(UAA_UNICAST) is mac
+    assert UAA_UNICAST in cache
+    assert len(cache) == 1
+    assert cache.cache_info() == CacheInfo(2, 1, 0, 4096, 1)
+
+
+def test_lru_eviction():
+    cache = AddressCache(maxsize=2)
+
+    first = cache(UAA_UNICAST)
+    cache(LAA_UNICAST)
+    cache(UAA_UNICAST)
+    cache(MULTICAST)
+
+    assert UAA_UNICAST in cache
+    assert LAA_UNICAST not in cache
+    assert cache(UAA_UNICAST) is first
+    assert cache.cache_info() == CacheInfo(2, 3, 1, 2, 2)
+
+
+def test_weak():
+    cache = AddressCache(maxsize=0, weak=True)
+
+    mac = cache(UAA_UNICAST)
+
+    assert len(cache) == 0
+    assert cache(UAA_UNICAST) is mac
+
+    del mac
+    gc.collect()
+
+    assert UAA_UNICAST not in cache
+    assert cache.cache_info().hits == 1
+
+
+def test_invalid_is_not_cached():
+    cache = AddressCache()
+
+    with raises(AddressError):
+        cache("0a")
+
+    assert "0a" not in cache
+    assert cache.cache_info() == CacheInfo(0, 1, 0, 4096, 0)
+
+
+def test_cls_and_clear():
+    cache = AddressCache(maxsize=None, cls=ExtendedIdentifier48)
+
+    ei48 = cache(UAA_UNICAST)
+
+    assert type(ei48) is ExtendedIdentifier48
+    assert repr(cache) == "AddressCache(maxsize=None, weak=False)"
+
+    cache.cache_clear()
+
+    assert cache.cache_info() == CacheInfo(0, 0, 0, None, 0)
+
+
+def test_negative_maxsize():
+    with raises(ValueError):
+        AddressCache(maxsize=-1)
+
+
+def test_shared_instance_is_immutable():
+    cache = AddressCache()
+
+    mac = cache(UAA_UNICAST)
+
+    with raises(AttributeError):
+        mac.original = LAA_UNICAST
+
+    with raises(AttributeError):
+        mac._value = 0
+
+    assert cache(UAA_UNICAST).original == UAA_UNICAST
+
+
+def test_threads():
+    cache = AddressCache(maxsize=8)
+    addresses = ["{:012x}".format(value) for value in range(16)]
+    results = [[] for _ in range(4)]
+
+    def lookup(macs):
+        for _ in range(500):
+            for address in addresses:
+                macs.append(cache(address))
+
+    threads = [Thread(target=lookup, args=(macs,)) for macs in results]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(len(macs) == 500 * len(addresses) for macs in results)
+    assert all(
+        str(mac) == addresses[index % len(addresses)]
+        for macs in results
+        for index, mac in enumerate(macs)
+    )
+    assert len(cache) <= 8
@@ -0,0 +1,63 @@
+from array import array
+
+from pytest import (
+    fixture,
+    raises
+)
+
+import macaddress.canonical
+
+from macaddress.canonical import bit_reverse_many
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from constants import EUI
+
+
+VALUES = [eui[2] for eui in EUI]
+
+
+@fixture
+def numpy_module():
+    return macaddress.canonical
+
+
+def as_list(values):
+    return [int(value) for value in getattr(values, "decimal", values)]
+
+
+def test_bit_reverse_many(with_numpy):
+    values = bit_reverse_many(VALUES)
+
+    if with_numpy:
+        assert type(values).__name__ == "MacAddressArray"
+    else:
+        assert isinstance(values, array)
+
+    assert as_list(values) == [
+        MediaAccessControlAddress.from_int(value).bit_reverse().decimal
+        for value in VALUES
+    ]
+    assert as_list(bit_reverse_many(values)) == VALUES
+
+
+def test_mixed_inputs(with_numpy):
+    addresses = [
+        "a0-b1-c2-d3-e4-f5",
+        0xa0b1c2d3e4f5,
+        MediaAccessControlAddress("a0b1.c2d3.e4f5")
+    ]
+
+    assert as_list(bit_reverse_many(addresses)) == [0x058d43cb27af] * 3
+
+
+def test_empty(with_numpy):
+    assert as_list(bit_reverse_many([])) == []
+
+
+def test_address_error(with_numpy):
+    with raises(AddressError):
+        bit_reverse_many(["a0b1c2d3e4f5", "0a"])
@@ -5,7 +5,8 @@ from pytest import (
 
 from macaddress.ei48 import (
     ExtendedIdentifier48,
-    IdentifierError
+    IdentifierError,
+    parse_integer
 )
 
 from macaddress.octet import Octet
@@ -219,3 +220,135 @@ def test_null_eui(
     print(ei48)
     stdout, stderr = capsys.readouterr()
     assert stdout == normalized + "\n"
+
+
+def test_slots():
+    ei48 = ExtendedIdentifier48("a0b1c2d3e4f5")
+
+    assert not hasattr(ei48, "__dict__")
+
+    with raises(AttributeError):
+        ei48.extra = True
+
+
+@mark.parametrize("identifier", INVALID_IDENTIFIER + [None, 0xa0b1c2d3e4f5])
+def test_parse_integer_invalid(identifier):
+    assert parse_integer(identifier) is None
+
+
+@mark.parametrize("eui", EUI)
+def test_parse_integer(eui):
+    assert parse_integer(eui[0]) == eui[2]
+
+
+def test_comparison():
+    identifiers = [ExtendedIdentifier48(eui[0]) for eui in EUI]
+    first = identifiers[0]
+
+    assert all(identifier == first for identifier in identifiers)
+    assert not any(identifier != first for identifier in identifiers)
+    assert len(set(identifiers)) == 1
+    assert {first: True}[ExtendedIdentifier48("A0:B1:C2:D3:E4:F5")]
+
+    low = ExtendedIdentifier48("0a1b2c3d4e5f")
+
+    assert low < first and low <= first and low <= low
+    assert first > low and first >= low and first >= first
+    assert sorted([first, low]) == [low, first]
+    assert first != first.normalized
+    assert first != first.decimal
+
+    with raises(TypeError):
+        first < first.decimal
+
+
+def test_integer():
+    ei48 = ExtendedIdentifier48("a0-b1-c2-d3-e4-f5")
+
+    assert int(ei48) == 176685338322165
+    assert hex(ei48) == "0xa0b1c2d3e4f5"
+    assert [0, 1][ExtendedIdentifier48("000000000001")] == 1
+
+
+def test_bytes():
+    ei48 = ExtendedIdentifier48.from_bytes(b"\x00\x00\x00\x00\x00\x01")
+
+    assert type(ei48) is ExtendedIdentifier48
+    assert ei48.decimal == 1
+    assert ei48.to_bytes() == b"\x00\x00\x00\x00\x00\x01"
+
+    with raises(IdentifierError):
+        ExtendedIdentifier48.from_bytes(b"\x01")
+
+
+def test_patterns():
+    from macaddress import ei48
+
+    assert ei48.IDENTIFIER.match("a0:b1:c2:d3:e4:f5")
+    assert ei48.PLAIN.pattern == "^[0-9A-Fa-f]{12}$"
+    assert ei48.PLAIN is ei48.compile_pattern("PLAIN")
+
+    with raises(AttributeError):
+        ei48.MISSING
+
+
+def test_from_int():
+    identifier = ExtendedIdentifier48.from_int(0)
+
+    assert type(identifier) is ExtendedIdentifier48
+    assert identifier.original == "000000000000"
+
+    with raises(IdentifierError) as exception:
+        ExtendedIdentifier48.from_int(-1)
+
+    assert "Pass in a 48-bit integer." == str(exception.value)
+
+
+def test_from_trusted():
+    identifier = ExtendedIdentifier48.from_trusted("0A-1B-2C-3D-4E-5F")
+
+    assert type(identifier) is ExtendedIdentifier48
+    assert identifier.original == "0A-1B-2C-3D-4E-5F"
+    assert identifier.decimal == 0x0a1b2c3d4e5f
+
+
+@mark.parametrize(("original", "reversed"), [
+    ("a0b1c2d3e4f5", "058d43cb27af"),
+    ("010203040506", "8040c020a060"),
+    ("ffffffffffff", "ffffffffffff"),
+    ("000000000000", "000000000000")
+])
+def test_bit_reverse(original, reversed):
+    identifier = ExtendedIdentifier48(original)
+
+    assert type(identifier.bit_reverse()) is ExtendedIdentifier48
+    assert identifier.bit_reverse().normalized == reversed
+    assert identifier.bit_reverse().binary == identifier.reverse_binary
+    assert identifier.bit_reverse().bit_reverse() == identifier
+
+
+def test_pickle():
+    from pickle import dumps, loads
+
+    identifier = ExtendedIdentifier48("0A:1B:2C:3D:4E:5F")
+    restored = loads(dumps(identifier))
+
+    assert type(restored) is ExtendedIdentifier48
+    assert restored.original == "0A:1B:2C:3D:4E:5F"
+    assert restored.decimal == identifier.decimal
+
+
+def test_immutable():
+    identifier = ExtendedIdentifier48("0A:1B:2C:3D:4E:5F")
+
+    with raises(AttributeError):
+        identifier.original = "a0b1c2d3e4f5"
+
+    with raises(AttributeError):
+        identifier._value = 0
+
+    with raises(AttributeError):
+        del identifier.original
+
+    assert identifier.original == "0A:1B:2C:3D:4E:5F"
+    assert hash(identifier) == hash(0x0a1b2c3d4e5f)
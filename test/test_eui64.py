@@ -0,0 +1,139 @@
+from array import array
+
+from ipaddress import IPv6Address
+
+from pytest import (
+    fixture,
+    importorskip,
+    mark,
+    raises
+)
+
+import macaddress.eui64
+
+from macaddress.eui64 import (
+    from_modified_eui64_many,
+    to_ipv6_many,
+    to_modified_eui64_many
+)
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from constants import EUI
+
+
+VALUES = [eui[2] for eui in EUI]
+
+INTERFACE_IDS = [
+    MediaAccessControlAddress.from_int(value).to_modified_eui64()
+    for value in VALUES
+]
+
+
+@fixture
+def numpy_module():
+    return macaddress.eui64
+
+
+def as_lists(result):
+    values, mask = result
+    values = getattr(values, "decimal", values)
+    return ([int(value) for value in values], [bool(item) for item in mask])
+
+
+def test_to_modified_eui64_many(with_numpy):
+    interface_ids = to_modified_eui64_many(VALUES)
+
+    if not with_numpy:
+        assert isinstance(interface_ids, array)
+
+    assert [int(item) for item in interface_ids] == INTERFACE_IDS
+    assert [
+        int(item) for item in to_modified_eui64_many(["a0:b1:c2:d3:e4:f5"])
+    ] == [0xa2b1c2fffed3e4f5]
+
+
+def test_from_modified_eui64_many(with_numpy):
+    values, mask = from_modified_eui64_many(INTERFACE_IDS)
+
+    if with_numpy:
+        assert type(values).__name__ == "MacAddressArray"
+    else:
+        assert isinstance(mask, bytearray)
+
+    assert as_lists((values, mask)) == (VALUES, [True] * len(VALUES))
+
+
+def test_ipv6_addresses(with_numpy):
+    addresses = [
+        IPv6Address("fe80::a2b1:c2ff:fed3:e4f5"),
+        IPv6Address("2001:db8::a2b1:c2ff:fed3:e4f5")
+    ]
+
+    assert as_lists(from_modified_eui64_many(addresses)) == (
+        [0xa0b1c2d3e4f5] * 2,
+        [True] * 2
+    )
+
+
+def test_numpy_input():
+    numpy = importorskip("numpy")
+    interface_ids = numpy.array(INTERFACE_IDS, dtype=numpy.uint64)
+
+    assert as_lists(from_modified_eui64_many(interface_ids))[0] == VALUES
+
+    signed = numpy.array([-1, 0x02b1c2fffed3e4f5], dtype=numpy.int64)
+
+    assert as_lists(from_modified_eui64_many(signed, errors="mask")) == (
+        [0, 0x00b1c2d3e4f5],
+        [False, True]
+    )
+
+
+@mark.parametrize(("errors", "expected"), [
+    ("skip", ([VALUES[0], VALUES[1]], [True, False, False, True, False])),
+    (
+        "mask",
+        ([VALUES[0], 0, 0, VALUES[1], 0], [True, False, False, True, False])
+    )
+])
+def test_errors(with_numpy, errors, expected):
+    interface_ids = [INTERFACE_IDS[0], 0, 2 ** 64, INTERFACE_IDS[1], "fe80::"]
+
+    assert as_lists(
+        from_modified_eui64_many(interface_ids, errors=errors)
+    ) == expected
+
+
+def test_strict_types(with_numpy):
+    interface_ids = ["123", 1.9, True, INTERFACE_IDS[0]]
+
+    assert as_lists(
+        from_modified_eui64_many(interface_ids, errors="mask")
+    ) == ([0, 0, 0, VALUES[0]], [False, False, False, True])
+
+
+def test_address_error(with_numpy):
+    with raises(AddressError) as exception:
+        from_modified_eui64_many([INTERFACE_IDS[0], 0xa0b1c2d3e4f5])
+
+    assert "Pass in a modified EUI-64 interface ID (item 1)." == \
+        str(exception.value)
+
+    with raises(ValueError):
+        from_modified_eui64_many([], errors="ignore")
+
+
+def test_to_ipv6_many(with_numpy):
+    assert to_ipv6_many(["a0b1c2d3e4f5"]) == [
+        IPv6Address("fe80::a2b1:c2ff:fed3:e4f5")
+    ]
+    assert to_ipv6_many([0xa0b1c2d3e4f5], prefix="2001:db8:1:2::/64") == [
+        IPv6Address("2001:db8:1:2:a2b1:c2ff:fed3:e4f5")
+    ]
+
+    with raises(AddressError):
+        to_ipv6_many([0xa0b1c2d3e4f5], prefix="2001:db8::/48")
@@ -0,0 +1,71 @@
+from mmap import mmap
+
+from pytest import mark
+
+from macaddress.extract import (
+    extract,
+    extract_file
+)
+
+from constants import EUI
+
+
+LOG = (
+    "Oct 18 10:00:00 dhcpd: DHCPACK on 10.0.0.7 to a0:b1:c2:d3:e4:f5 "
+    "via eth0\n"
+    "Oct 18 10:00:01 switch: learned AAB1.C2D3.E4F5 on port 7, "
+    "moved from a0-b1-c2-d3-e4-f5.\n"
+    "Oct 18 10:00:02 kernel: ignored fe80::a0b1:c2d3:e4f5 and "
+    "0a:1b:2c:3d:4e:5f:60 and 0a1b2c3d4e5f6 and 12:34:56\n"
+    "Oct 18 10:00:03 agent: id=ffffffffffff\n"
+)
+
+EXPECTED = [
+    (LOG.index("a0:b1"), 0xa0b1c2d3e4f5),
+    (LOG.index("AAB1"), 0xaab1c2d3e4f5),
+    (LOG.index("a0-b1"), 0xa0b1c2d3e4f5),
+    (LOG.index("ffff"), 0xffffffffffff)
+]
+
+
+@mark.parametrize("eui", EUI)
+def test_notations(eui):
+    assert list(extract(eui[0])) == [(0, eui[2])]
+
+
+def test_text():
+    assert list(extract(LOG)) == EXPECTED
+
+
+def test_bytes():
+    assert list(extract(LOG.encode("ascii"))) == EXPECTED
+    assert list(extract(bytearray(LOG, "ascii"))) == EXPECTED
+
+
+def test_byte_offsets():
+    text = "café a0b1c2d3e4f5"
+
+    assert list(extract(text)) == [(5, 0xa0b1c2d3e4f5)]
+    assert list(extract(text.encode("utf-8"))) == [(6, 0xa0b1c2d3e4f5)]
+
+
+def test_mmap():
+    with mmap(-1, len(LOG)) as buffer:
+        buffer.write(LOG.encode("ascii"))
+
+        assert list(extract(buffer)) == EXPECTED
+
+
+def test_file(tmp_path):
+    path = tmp_path / "syslog"
+    path.write_bytes(LOG.encode("ascii"))
+
+    assert list(extract_file(path)) == EXPECTED
+    assert list(extract_file(str(path))) == EXPECTED
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+
+    assert list(extract_file(path)) == []
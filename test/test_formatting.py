@@ -0,0 +1,76 @@
+from pytest import (
+    fixture,
+    importorskip,
+    mark,
+    raises
+)
+
+import macaddress.formatting
+
+from macaddress.formatting import format_many
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from constants import EUI
+
+
+ADDRESSES = [eui[0] for eui in EUI]
+
+NOTATIONS = [
+    ("plain", 7),
+    ("hyphen", 8),
+    ("colon", 9),
+    ("dot", 10)
+]
+
+
+@fixture
+def numpy_module():
+    return macaddress.formatting
+
+
+@mark.parametrize(("notation", "column"), NOTATIONS)
+def test_notations(notation, column, with_numpy):
+    expected = [eui[column] for eui in EUI]
+
+    assert format_many(ADDRESSES, notation=notation) == "\n".join(expected)
+    assert format_many(
+        [MediaAccessControlAddress(address) for address in ADDRESSES],
+        notation=notation,
+        uppercase=True,
+        separator=", "
+    ) == ", ".join(expected).upper()
+
+
+def test_integers(with_numpy):
+    assert format_many(
+        [0xa0b1c2d3e4f5, 0, 0xaab1c2d3e4f5],
+        separator="\r\n"
+    ) == "a0:b1:c2:d3:e4:f5\r\n00:00:00:00:00:00\r\naa:b1:c2:d3:e4:f5"
+
+
+def test_empty(with_numpy):
+    assert format_many([]) == ""
+    assert format_many([0], separator="") == "00:00:00:00:00:00"
+
+
+def test_array():
+    numpy = importorskip("numpy")
+
+    values = numpy.array([0xa0b1c2d3e4f5, 0xffffffffffff], dtype=numpy.uint64)
+
+    assert format_many(
+        macaddress.MacAddressArray(values),
+        notation="dot"
+    ) == "a0b1.c2d3.e4f5\nffff.ffff.ffff"
+
+
+def test_errors(with_numpy):
+    with raises(ValueError):
+        format_many(ADDRESSES, notation="space")
+
+    with raises(AddressError):
+        format_many([1 << 48])
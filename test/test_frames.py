@@ -0,0 +1,94 @@
+from array import array
+
+from mmap import mmap
+
+from pytest import (
+    fixture,
+    mark,
+    raises
+)
+
+import macaddress.frames
+
+from macaddress.frames import unpack_frames
+
+
+DESTINATIONS = [0xffffffffffff, 0xa0b1c2d3e4f5, 0x0180c2000000]
+
+SOURCES = [0xa0b1c2d3e4f5, 0xaab1c2d3e4f5, 0x000000000001]
+
+
+def build(stride, offset, trailer=b""):
+    buffer = bytearray(b"\xee" * offset)
+
+    for destination, source in zip(DESTINATIONS, SOURCES):
+        frame = destination.to_bytes(6, "big") + source.to_bytes(6, "big")
+        buffer += frame + b"\xee" * (stride - 12)
+
+    return bytes(buffer[:len(buffer) - stride + 12] + trailer)
+
+
+@fixture
+def numpy_module():
+    return macaddress.frames
+
+
+def as_lists(result):
+    return tuple(
+        [int(value) for value in getattr(values, "decimal", values)]
+        for values in result
+    )
+
+
+@mark.parametrize(("stride", "offset"), [(12, 0), (64, 0), (60, 16)])
+def test_unpack_frames(with_numpy, stride, offset):
+    buffer = build(stride, offset)
+
+    assert as_lists(unpack_frames(buffer, stride, offset)) == (
+        DESTINATIONS,
+        SOURCES
+    )
+    assert as_lists(unpack_frames(memoryview(buffer), stride, offset)) == (
+        DESTINATIONS,
+        SOURCES
+    )
+    assert as_lists(unpack_frames(buffer, stride, offset, count=2)) == (
+        DESTINATIONS[:2],
+        SOURCES[:2]
+    )
+
+
+def test_types(with_numpy):
+    destinations, sources = unpack_frames(build(64, 0), 64)
+
+    if with_numpy:
+        assert type(destinations).__name__ == "MacAddressArray"
+    else:
+        assert isinstance(destinations, array)
+
+
+def test_mmap(with_numpy):
+    buffer = build(64, 4, trailer=b"\xee" * 11)
+
+    with mmap(-1, len(buffer)) as mapped:
+        mapped.write(buffer)
+
+        assert as_lists(unpack_frames(mapped, 64, 4)) == (
+            DESTINATIONS,
+            SOURCES
+        )
+
+
+def test_empty(with_numpy):
+    assert as_lists(unpack_frames(b"", 64)) == ([], [])
+    assert as_lists(unpack_frames(b"\x00" * 11, 64)) == ([], [])
+    assert as_lists(unpack_frames(b"\x00" * 64, 64, offset=100)) == ([], [])
+
+
+@mark.parametrize(
+    ("stride", "offset", "count"),
+    [(11, 0, None), (64, -1, None), (64, 0, 4), (64, 0, -1)]
+)
+def test_value_error(stride, offset, count):
+    with raises(ValueError):
+        unpack_frames(build(64, 0), stride, offset, count)
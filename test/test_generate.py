@@ -0,0 +1,169 @@
+from array import array
+
+from random import Random
+
+from pytest import (
+    fixture,
+    importorskip,
+    mark,
+    raises
+)
+
+import macaddress.generate
+
+from macaddress.block import MacAddressBlock
+
+from macaddress.generate import (
+    AddressGenerator,
+    GeneratorError
+)
+
+from macaddress.macaddress import MediaAccessControlAddress
+
+
+@fixture
+def numpy_module():
+    return macaddress.generate
+
+
+def as_list(values):
+    return [int(value) for value in getattr(values, "decimal", values)]
+
+
+def test_laa_unicast(with_numpy):
+    generator = AddressGenerator(seed=0)
+    values = generator.take(1000)
+
+    if with_numpy:
+        assert type(values).__name__ == "MacAddressArray"
+    else:
+        assert isinstance(values, array)
+
+    macs = [
+        MediaAccessControlAddress.from_int(value)
+        for value in as_list(values)
+    ]
+
+    assert generator.capacity == 2 ** 46
+    assert generator.remaining == 2 ** 46 - 1000
+    assert len(set(macs)) == 1000
+    assert all(mac.is_laa and mac.is_unicast for mac in macs)
+
+
+@mark.parametrize("prefix", [
+    "02:00:00:00:00:00/40",
+    "0a:b1:c2:d3:e0:00/44",
+    "00:00:00:00:00:00/6",
+    "02:00:00:00:00:00/7"
+])
+def test_prefix(with_numpy, prefix):
+    block = MacAddressBlock(prefix)
+    generator = AddressGenerator(block, seed=1)
+    values = as_list(generator.take(min(generator.capacity, 4096)))
+
+    assert len(set(values)) == len(values)
+    assert all(value in block for value in values)
+    assert all(
+        MediaAccessControlAddress.from_int(value).is_laa
+        for value in values
+    )
+
+
+def test_single_address(with_numpy, monkeypatch):
+    # Before Python 3.9, getrandbits rejects zero bits.
+
+    getrandbits = Random.getrandbits
+
+    def strict_getrandbits(self, bits):
+        if bits == 0:
+            raise ValueError("number of bits must be greater than zero")
+
+        return getrandbits(self, bits)
+
+    monkeypatch.setattr(Random, "getrandbits", strict_getrandbits)
+
+    generator = AddressGenerator("02:00:00:00:00:07/48", seed=3)
+
+    assert generator.capacity == 1
+    assert as_list(generator.take(1)) == [0x020000000007]
+    assert generator.remaining == 0
+
+
+def test_exhaustion(with_numpy):
+    generator = AddressGenerator("02:00:00:00:00:00/40", seed=2)
+    batches = list(generator.batches(100))
+
+    assert [len(batch) for batch in batches] == [100, 100, 56]
+    assert sorted(sum(map(as_list, batches), [])) == list(
+        range(0x020000000000, 0x020000000100)
+    )
+    assert generator.remaining == 0
+    assert list(generator.batches(100)) == []
+
+    with raises(GeneratorError) as exception:
+        generator.take(1)
+
+    assert "Pass in a count of at most 0." == str(exception.value)
+
+
+def test_seed(with_numpy):
+    first = AddressGenerator(seed=3)
+    second = AddressGenerator(seed=3)
+
+    assert as_list(first.take(10)) == as_list(second.take(10))
+    assert as_list(first.take(10)) != as_list(AddressGenerator(seed=4).take(10))
+
+
+def test_same_with_and_without_numpy(monkeypatch):
+    numpy = importorskip("numpy")
+    monkeypatch.setattr(macaddress.generate, "numpy", numpy)
+    with_numpy = as_list(AddressGenerator(seed=5).take(100))
+    monkeypatch.setattr(macaddress.generate, "numpy", None)
+
+    assert as_list(AddressGenerator(seed=5).take(100)) == with_numpy
+
+
+def test_outputs(with_numpy):
+    generator = AddressGenerator("02:00:00:00:00:00/40", seed=6)
+    values = as_list(AddressGenerator("02:00:00:00:00:00/40", seed=6).take(4))
+
+    strings = generator.take(2, output="str", notation="hyphen")
+    objects = generator.take(2, output="object")
+
+    assert strings == [
+        MediaAccessControlAddress.from_int(value).to_hyphen_notation()
+        for value in values[:2]
+    ]
+    assert [mac.decimal for mac in objects] == values[2:]
+    assert all(isinstance(mac, MediaAccessControlAddress) for mac in objects)
+    assert generator.take(0, output="str") == []
+
+    batches = list(generator.batches(3, count=5, output="object"))
+
+    assert [len(batch) for batch in batches] == [3, 2]
+
+
+@mark.parametrize("prefix", [
+    "00:00:00:00:00:00/24",
+    "03:00:00:00:00:00/8",
+    "00:00:00:00:00:00/7"
+])
+def test_generator_error(prefix):
+    with raises(GeneratorError) as exception:
+        AddressGenerator(prefix)
+
+    assert "Pass in a prefix of locally-administered unicast addresses." == \
+        str(exception.value)
+
+
+def test_invalid_arguments():
+    generator = AddressGenerator(seed=7)
+
+    with raises(GeneratorError):
+        generator.take(-1)
+
+    with raises(GeneratorError):
+        list(generator.batches(0))
+
+    with raises(ValueError):
+        generator.take(1, output="bytes")
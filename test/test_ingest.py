@@ -0,0 +1,148 @@
+from pytest import (
+    fixture,
+    mark,
+    raises
+)
+
+import macaddress.ingest
+
+from macaddress.ingest import (
+    count_lines,
+    find_boundaries,
+    ingest_file,
+    read_blocks
+)
+
+from macaddress.macaddress import AddressError
+
+from constants import (
+    INVALID_ADDRESS,
+    EUI
+)
+
+
+LINES = [eui[0] for eui in EUI] + ["", INVALID_ADDRESS[0], "  0180c2000000\r"]
+
+VALUES = [eui[2] for eui in EUI] + [0, 0, 0x0180c2000000]
+
+MASK = [True] * len(EUI) + [False, False, True]
+
+
+@fixture
+def path(tmp_path):
+    path = tmp_path / "addresses.txt"
+    path.write_text("\n".join(LINES) + "\n")
+    return path
+
+
+@fixture
+def numpy_module():
+    return macaddress.ingest
+
+
+def as_lists(result):
+    values, mask = result
+    values = getattr(values, "decimal", values)
+    return ([int(value) for value in values], [bool(item) for item in mask])
+
+
+@mark.parametrize("workers", [1, 3, 64])
+def test_mask(path, with_numpy, workers):
+    assert as_lists(ingest_file(path, workers=workers, errors="mask")) == (
+        VALUES,
+        MASK
+    )
+
+
+def test_skip(path, with_numpy):
+    assert as_lists(ingest_file(path, workers=2, errors="skip")) == (
+        [value for value, valid in zip(VALUES, MASK) if valid],
+        MASK
+    )
+
+
+def test_no_trailing_newline(tmp_path, with_numpy):
+    path = tmp_path / "addresses.txt"
+    path.write_text("a0b1c2d3e4f5\naab1c2d3e4f5")
+
+    assert as_lists(ingest_file(path, workers=2)) == (
+        [0xa0b1c2d3e4f5, 0xaab1c2d3e4f5],
+        [True, True]
+    )
+
+
+def test_empty(tmp_path, with_numpy):
+    path = tmp_path / "empty.txt"
+    path.write_text("")
+
+    assert as_lists(ingest_file(path)) == ([], [])
+
+
+def test_raise(path):
+    with raises(AddressError) as exception:
+        ingest_file(path, workers=2)
+
+    assert "Pass in 12 hexadecimal digits (line {}).".format(
+        len(EUI) + 1
+    ) == str(exception.value)
+
+
+def test_boundaries(path):
+    data = path.read_bytes()
+
+    for count in range(1, 40):
+        ranges = find_boundaries(path, count)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        assert all(
+            data[end - 1:end] == b"\n" for start, end in ranges[:-1]
+        )
+        assert all(
+            end == start for (_, end), (start, _) in zip(ranges, ranges[1:])
+        )
+
+
+@mark.parametrize(
+    "data",
+    [b"", b"\n", b"\n\n", b"a", b"a\n", b"a\nb", b"a\nb\n", b"a\n" * 5000]
+)
+def test_read_blocks(tmp_path, monkeypatch, data):
+    monkeypatch.setattr(macaddress.ingest, "BLOCK_SIZE", 3)
+
+    path = tmp_path / "lines.txt"
+    path.write_bytes(data)
+
+    for start, end in [(0, len(data)), (1, len(data)), (0, len(data) // 2)]:
+        expected = data[start:end].split(b"\n")
+
+        if expected[-1] == b"":
+            expected.pop()
+
+        blocks = list(read_blocks(path, start, end))
+
+        assert [line for lines in blocks for line in lines] == expected
+        assert all(blocks)
+        assert count_lines(path, start, end) == len(expected)
+
+
+@mark.parametrize("errors", ["mask", "raise"])
+def test_small_blocks(path, monkeypatch, with_numpy, errors):
+    monkeypatch.setattr(macaddress.ingest, "BLOCK_SIZE", 7)
+
+    if errors == "mask":
+        assert as_lists(ingest_file(path, workers=2, errors=errors)) == (
+            VALUES,
+            MASK
+        )
+    else:
+        with raises(AddressError) as exception:
+            ingest_file(path, workers=2, errors=errors)
+
+        assert "(line {})".format(len(EUI) + 1) in str(exception.value)
+
+
+@mark.parametrize(("workers", "errors"), [(0, "raise"), (1, "ignore")])
+def test_value_error(path, workers, errors):
+    with raises(ValueError):
+        ingest_file(path, workers=workers, errors=errors)
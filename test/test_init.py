@@ -0,0 +1,78 @@
+import subprocess
+
+import sys
+
+from pytest import (
+    mark,
+    raises
+)
+
+import macaddress
+
+
+def imported_modules(statement):
+    # Run a statement in a fresh interpreter, which reports the
+    # modules it imported.
+
+    script = "{}\nimport sys\nprint(' '.join(sys.modules))".format(statement)
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True
+    ).stdout
+    return set(output.split())
+
+
+def test_import_is_lazy():
+    modules = imported_modules("import macaddress")
+
+    assert "macaddress.ei48" in modules
+    assert "macaddress.extract" in modules
+    assert "macaddress.registry" not in modules
+    assert "numpy" not in modules
+    assert "re" not in modules
+
+
+def test_first_use():
+    modules = imported_modules(
+        "from macaddress import lookup_vendor\n"
+        "from macaddress import MediaAccessControlAddress\n"
+        "MediaAccessControlAddress('a0b1c2d3e4f5').is_valid"
+    )
+
+    assert "macaddress.registry" in modules
+    assert "macaddress.ingest" not in modules
+    assert "re" in modules
+
+
+@mark.parametrize("name", macaddress.__all__)
+def test_all(name):
+    assert getattr(macaddress, name).__name__ == name
+    assert name in dir(macaddress)
+
+
+def test_submodules():
+    assert macaddress.instrument.stats is macaddress.stats
+    assert macaddress.extract is macaddress.extract_file.__globals__["extract"]
+
+
+def test_missing():
+    with raises(AttributeError):
+        macaddress.missing
+
+
+@mark.parametrize(
+    ("module", "name"),
+    [("macaddress.ei48", "PLAIN"), ("macaddress.octet", "DIGITS"),
+     ("macaddress.extract", "TEXT"), ("macaddress.extract", "BYTES")]
+)
+def test_deferred_patterns(module, name):
+    module = sys.modules[module]
+    pattern = getattr(module, name)
+
+    assert pattern.pattern == module.PATTERNS[name]
+    assert vars(module)[name] is pattern
+
+    with raises(AttributeError):
+        module.MISSING
@@ -0,0 +1,169 @@
+import subprocess
+
+import sys
+
+from pytest import (
+    fixture,
+    raises
+)
+
+import macaddress
+
+from macaddress import instrument
+
+from macaddress.cache import AddressCache
+
+from macaddress.ei48 import (
+    ExtendedIdentifier48,
+    parse_integer
+)
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from macaddress.octet import (
+    Octet,
+    OctetError
+)
+
+from macaddress.parse import parse_many
+
+from constants import (
+    INVALID_ADDRESS,
+    UAA_UNICAST
+)
+
+
+@fixture
+def updates():
+    updates = []
+    instrument.reset()
+    instrument.enable(callback=lambda *update: updates.append(update))
+
+    yield updates
+
+    instrument.disable()
+    instrument.reset()
+
+
+def test_constructions(updates):
+    MediaAccessControlAddress(UAA_UNICAST)
+    MediaAccessControlAddress.from_bytes(b"\x00" * 6)
+    ExtendedIdentifier48(UAA_UNICAST)
+    Octet("a0")
+
+    assert macaddress.stats()["constructions"] == {
+        "Octet": 1,
+        "ExtendedIdentifier48": 1,
+        "MediaAccessControlAddress": 2
+    }
+    assert ("constructions", "Octet", 1) in updates
+
+
+def test_validation_failures(updates):
+    for address in INVALID_ADDRESS:
+        with raises(AddressError):
+            MediaAccessControlAddress(address)
+
+    parse_many(["0a:1b"], errors="skip")
+
+    with raises(OctetError):
+        Octet("g")
+
+    stats = macaddress.stats()
+
+    assert stats["validation_failures"] == {
+        "plain": 3,
+        "hyphen": 3,
+        "colon": 4,
+        "dot": 3,
+        "octet": 1
+    }
+    assert stats["constructions"]["MediaAccessControlAddress"] == 0
+    assert stats["seconds"]["validation"] > 0
+
+
+def test_cache(updates):
+    cache = AddressCache()
+    cache(UAA_UNICAST)
+    cache(UAA_UNICAST)
+    cache.get(UAA_UNICAST)
+
+    assert macaddress.stats()["cache"] == {"hits": 2, "misses": 1}
+
+
+def test_timing(updates):
+    mac = MediaAccessControlAddress(UAA_UNICAST)
+    mac.to_colon_notation()
+    mac.normalized
+    macaddress.format_many([mac])
+
+    seconds = macaddress.stats()["seconds"]
+
+    assert all(seconds[key] > 0 for key in seconds)
+    assert all(
+        amount > 0 for counter, key, amount in updates
+        if counter == "seconds"
+    )
+
+
+def test_disable():
+    original = ExtendedIdentifier48.__dict__["__init__"]
+    new = Octet.__dict__["__new__"]
+
+    instrument.enable()
+    instrument.enable()
+
+    assert macaddress.stats()["enabled"] is True
+    assert ExtendedIdentifier48.__dict__["__init__"] is not original
+
+    instrument.disable()
+    instrument.reset()
+
+    MediaAccessControlAddress(UAA_UNICAST)
+
+    stats = macaddress.stats()
+
+    assert stats["enabled"] is False
+    assert stats["constructions"]["MediaAccessControlAddress"] == 0
+    assert ExtendedIdentifier48.__dict__["__init__"] is original
+    assert Octet.__dict__["__new__"] is new
+    assert macaddress.ei48.parse_integer is parse_integer
+    assert macaddress.parse.parse_integer is parse_integer
+
+
+def test_lazy_import_while_enabled():
+    # Import modules for the first time while instrumentation is
+    # enabled, in a fresh interpreter, and check that disable leaves
+    # no instrumented function behind.
+
+    script = "\n".join([
+        "import sys",
+        "import macaddress",
+        "from macaddress import instrument",
+        "instrument.enable()",
+        "generator = macaddress.AddressGenerator(seed=0)",
+        "macaddress.format_many",
+        "macaddress.parse_many",
+        "instrument.disable()",
+        "instrument.reset()",
+        "generator.take(5, output='str')",
+        "macaddress.parse_many(['a0b1c2d3e4f5'])",
+        "print(sum(macaddress.stats()['seconds'].values()))",
+        "print(sorted(",
+        "    name for name, module in list(sys.modules.items())",
+        "    if name.startswith('macaddress')",
+        "    for value in vars(module).values()",
+        "    if getattr(value, '__wrapped__', None) is not None",
+        "))"
+    ])
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True
+    ).stdout
+
+    assert output.split("\n")[:2] == ["0", "[]"]
@@ -1,11 +1,34 @@
+from bisect import bisect_left
+
+from copy import (
+    copy,
+    deepcopy
+)
+
+from ipaddress import (
+    IPv4Address,
+    IPv6Address,
+    IPv6Network
+)
+
+from pickle import (
+    dumps,
+    loads
+)
+
 from pytest import (
+    importorskip,
     mark,
     raises
 )
 
+from macaddress.ei48 import ExtendedIdentifier48
+
 from macaddress.macaddress import (
     AddressError,
-    MediaAccessControlAddress
+    MediaAccessControlAddress,
+    is_valid_address,
+    try_parse
 )
 
 from constants import (
@@ -143,3 +166,215 @@ def test_laa_unicast(capsys):
     print(mac)
     stdout, stderr = capsys.readouterr()
     assert stdout == LAA_UNICAST.lower() + "\n"
+
+
+def test_slots():
+    mac = MediaAccessControlAddress(UAA_UNICAST)
+
+    assert not hasattr(mac, "__dict__")
+
+    with raises(AttributeError):
+        mac.extra = True
+
+
+def test_comparison():
+    mac = MediaAccessControlAddress("A0-B1-C2-D3-E4-F5")
+    macs = sorted(
+        MediaAccessControlAddress(address)
+        for address in [BROADCAST, MULTICAST, UAA_UNICAST, LAA_UNICAST]
+    )
+
+    assert mac == MediaAccessControlAddress("a0b1c2d3e4f5")
+    assert mac == ExtendedIdentifier48("a0:b1:c2:d3:e4:f5")
+    assert hash(mac) == hash(ExtendedIdentifier48("a0b1.c2d3.e4f5"))
+    assert [str(mac) for mac in macs] == [
+        MULTICAST,
+        UAA_UNICAST,
+        LAA_UNICAST,
+        BROADCAST
+    ]
+    assert bisect_left(macs, mac) == 1
+    assert int(mac) == 0xa0b1c2d3e4f5
+
+
+def test_bytes():
+    data = b"\xa0\xb1\xc2\xd3\xe4\xf5"
+
+    mac = MediaAccessControlAddress.from_bytes(data)
+
+    assert isinstance(mac, MediaAccessControlAddress)
+    assert mac == MediaAccessControlAddress(UAA_UNICAST)
+    assert mac.to_bytes() == data
+    assert repr(mac) == "MediaAccessControlAddress('{}')".format(UAA_UNICAST)
+    assert MediaAccessControlAddress.from_bytes(bytearray(data)) == mac
+
+    with raises(AddressError) as exception:
+        MediaAccessControlAddress.from_bytes(data + b"\x00")
+
+    assert "Pass in six bytes." == str(exception.value)
+
+
+def test_from_int():
+    mac = MediaAccessControlAddress.from_int(0xa0b1c2d3e4f5)
+
+    assert isinstance(mac, MediaAccessControlAddress)
+    assert mac.original == UAA_UNICAST
+    assert mac.is_uaa == True
+
+    for value in [-1, 0x1000000000000, "a0b1c2d3e4f5", 1.0]:
+        with raises(AddressError) as exception:
+            MediaAccessControlAddress.from_int(value)
+
+        assert "Pass in a 48-bit integer." == str(exception.value)
+
+
+@mark.parametrize(
+    "address",
+    ["A0B1C2D3E4F5", "a0-b1-c2-d3-e4-f5", "A0:B1:C2:D3:E4:F5", "a0b1.c2d3.e4f5"]
+)
+def test_from_trusted(address):
+    mac = MediaAccessControlAddress.from_trusted(address)
+
+    assert isinstance(mac, MediaAccessControlAddress)
+    assert mac.original == address
+    assert mac == MediaAccessControlAddress(address)
+    assert str(mac) == UAA_UNICAST
+
+
+@mark.parametrize("address", INVALID_ADDRESS + [None, 0xa0b1c2d3e4f5])
+def test_invalid_without_raising(address):
+    assert is_valid_address(address) == False
+    assert try_parse(address) is None
+
+
+def test_valid_without_raising():
+    mac = try_parse("A0:B1:C2:D3:E4:F5")
+
+    assert is_valid_address("A0:B1:C2:D3:E4:F5") == True
+    assert isinstance(mac, MediaAccessControlAddress)
+    assert mac.original == "A0:B1:C2:D3:E4:F5"
+    assert mac.is_valid == True
+    assert mac == MediaAccessControlAddress(UAA_UNICAST)
+
+
+@mark.parametrize(("address", "interface_id"), [
+    (UAA_UNICAST, 0xa2b1c2fffed3e4f5),
+    (LAA_UNICAST, 0xa8b1c2fffed3e4f5),
+    (BROADCAST, 0xfdfffffffeffffff)
+])
+def test_modified_eui64(address, interface_id):
+    mac = MediaAccessControlAddress(address)
+
+    assert mac.to_modified_eui64() == interface_id
+    assert MediaAccessControlAddress.from_modified_eui64(interface_id) == mac
+
+
+def test_ipv6():
+    mac = MediaAccessControlAddress(UAA_UNICAST)
+    link_local = IPv6Address("fe80::a2b1:c2ff:fed3:e4f5")
+
+    assert mac.to_ipv6() == link_local
+    assert mac.to_ipv6(IPv6Network("2001:db8::/64")) == \
+        IPv6Address("2001:db8::a2b1:c2ff:fed3:e4f5")
+    assert MediaAccessControlAddress.from_modified_eui64(link_local) == mac
+
+    for prefix in ["2001:db8::/48", "2001:db8::1/64", "fe80::"]:
+        with raises(AddressError) as exception:
+            mac.to_ipv6(prefix)
+
+        assert "Pass in a /64 prefix." == str(exception.value)
+
+
+@mark.parametrize(
+    "interface_id",
+    [
+        0xa2b1c2d3e4f5a6b7,
+        -1,
+        2 ** 64,
+        "fe80::",
+        "123",
+        1.9,
+        True,
+        IPv6Address("fe80::1")
+    ]
+)
+def test_modified_eui64_error(interface_id):
+    with raises(AddressError) as exception:
+        MediaAccessControlAddress.from_modified_eui64(interface_id)
+
+    assert "Pass in a modified EUI-64 interface ID." == str(exception.value)
+
+
+def test_modified_eui64_numpy_integer():
+    numpy = importorskip("numpy")
+    mac = MediaAccessControlAddress(UAA_UNICAST)
+
+    assert MediaAccessControlAddress.from_modified_eui64(
+        numpy.uint64(0xa2b1c2fffed3e4f5)
+    ) == mac
+
+
+@mark.parametrize(("group", "address"), [
+    ("224.0.0.251", "01005e0000fb"),
+    (IPv4Address("239.129.2.3"), "01005e010203"),
+    ("ff02::fb", "3333000000fb"),
+    (IPv6Address("ff02::1:ffd3:e4f5"), "3333ffd3e4f5")
+])
+def test_from_multicast_group(group, address):
+    mac = MediaAccessControlAddress.from_multicast_group(group)
+
+    assert mac == MediaAccessControlAddress(address)
+    assert mac.is_multicast == True
+
+
+@mark.parametrize("group", ["10.0.0.1", "fe80::1", "x", None])
+def test_multicast_group_error(group):
+    with raises(AddressError) as exception:
+        MediaAccessControlAddress.from_multicast_group(group)
+
+    assert "Pass in an IPv4 or IPv6 multicast group." == str(exception.value)
+
+
+def test_to_multicast_groups():
+    ipv4 = MediaAccessControlAddress("01-00-5E-01-02-03").to_multicast_groups()
+    ipv6 = MediaAccessControlAddress("33-33-FF-D3-E4-F5")
+
+    assert len(ipv4) == 32
+    assert len(set(ipv4)) == 32
+    assert IPv4Address("224.1.2.3") in ipv4
+    assert IPv4Address("239.129.2.3") in ipv4
+    assert all(group.is_multicast for group in ipv4)
+    assert ipv6.to_multicast_groups() == [IPv6Address("ff02::ffd3:e4f5")]
+    assert ipv6.to_multicast_groups("ff02::1:0:0/96") == [
+        IPv6Address("ff02::1:ffd3:e4f5")
+    ]
+    assert MediaAccessControlAddress("01005e810203").to_multicast_groups() == []
+    assert MediaAccessControlAddress(UAA_UNICAST).to_multicast_groups() == []
+
+    with raises(AddressError):
+        ipv6.to_multicast_groups("ff02::/64")
+
+
+@mark.parametrize("address", [UAA_UNICAST, "A0-B1-C2-D3-E4-F5"])
+def test_pickle(address):
+    mac = MediaAccessControlAddress(address)
+
+    for protocol in range(6):
+        restored = loads(dumps(mac, protocol=protocol))
+
+        assert type(restored) is MediaAccessControlAddress
+        assert restored == mac
+        assert restored.original == address
+
+    assert copy(mac).original == address
+    assert deepcopy(mac) == mac
+
+
+def test_pickle_size():
+    # The plain notation is not pickled alongside the integer.
+
+    plain = MediaAccessControlAddress(UAA_UNICAST)
+    hyphen = MediaAccessControlAddress("a0-b1-c2-d3-e4-f5")
+
+    assert UAA_UNICAST.encode("ascii") not in dumps(plain)
+    assert len(dumps(plain)) < len(dumps(hyphen))
@@ -0,0 +1,145 @@
+from ipaddress import (
+    IPv4Address,
+    IPv6Address
+)
+
+from pytest import (
+    fixture,
+    importorskip,
+    mark,
+    raises
+)
+
+import macaddress.multicast
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from macaddress.multicast import (
+    ipv4_groups_many,
+    ipv4_multicast_many,
+    ipv6_groups_many,
+    ipv6_multicast_many
+)
+
+from constants import UAA_UNICAST
+
+
+IPV4_GROUPS = ["224.0.0.251", IPv4Address("239.255.255.250"), 0xE1020304]
+
+IPV4_ADDRESSES = [0x01005e0000fb, 0x01005e7ffffa, 0x01005e020304]
+
+IPV6_GROUPS = ["ff02::fb", IPv6Address("ff02::1:ffd3:e4f5"), 0xff05 << 112]
+
+IPV6_ADDRESSES = [0x3333000000fb, 0x3333ffd3e4f5, 0x333300000000]
+
+
+@fixture
+def numpy_module():
+    return macaddress.multicast
+
+
+def as_lists(result):
+    values, mask = result
+    values = getattr(values, "decimal", values)
+    return ([int(value) for value in values], [bool(item) for item in mask])
+
+
+def as_flat_list(candidates):
+    # Flatten a NumPy array with one row of candidates per address.
+
+    if hasattr(candidates, "ravel"):
+        candidates = candidates.ravel()
+
+    return [int(candidate) for candidate in candidates]
+
+
+def test_ipv4_multicast_many(with_numpy):
+    assert as_lists(ipv4_multicast_many(IPV4_GROUPS)) == (
+        IPV4_ADDRESSES,
+        [True] * 3
+    )
+
+
+def test_ipv6_multicast_many(with_numpy):
+    assert as_lists(ipv6_multicast_many(IPV6_GROUPS)) == (
+        IPV6_ADDRESSES,
+        [True] * 3
+    )
+
+
+def test_numpy_groups():
+    numpy = importorskip("numpy")
+    groups = numpy.array(
+        [0xE00000FB, 0x0A000001, 0xEFFFFFFA],
+        dtype=numpy.uint32
+    )
+
+    assert as_lists(ipv4_multicast_many(groups, errors="skip")) == (
+        [IPV4_ADDRESSES[0], IPV4_ADDRESSES[1]],
+        [True, False, True]
+    )
+
+
+@mark.parametrize(("function", "groups"), [
+    (ipv4_multicast_many, ["224.0.0.1", "10.0.0.1", "ff02::1", None, -1]),
+    (ipv6_multicast_many, ["ff02::1", "fe80::1", "224.0.0.1", "x", 2 ** 128])
+])
+def test_multicast_errors(with_numpy, function, groups):
+    mask = as_lists(function(groups, errors="mask"))[1]
+
+    assert mask == [True] + [False] * 4
+    assert len(as_lists(function(groups, errors="skip"))[0]) == 1
+
+    with raises(AddressError) as exception:
+        function(groups)
+
+    assert "(item 1)." in str(exception.value)
+
+    with raises(ValueError):
+        function(groups, errors="ignore")
+
+
+def test_ipv4_groups_many(with_numpy):
+    candidates, mask = ipv4_groups_many(
+        IPV4_ADDRESSES + [UAA_UNICAST],
+        errors="mask"
+    )
+    candidates = as_flat_list(candidates)
+    mac = MediaAccessControlAddress.from_int(IPV4_ADDRESSES[0])
+
+    assert [bool(item) for item in mask] == [True, True, True, False]
+    assert len(candidates) == 4 * 32
+    assert candidates[:32] == [
+        int(group) for group in mac.to_multicast_groups()
+    ]
+    assert int(IPv4Address("239.255.255.250")) in candidates[32:64]
+    assert candidates[96:] == [0] * 32
+
+    with raises(AddressError) as exception:
+        ipv4_groups_many(IPV6_ADDRESSES)
+
+    assert "Pass in an IPv4 multicast MAC address (item 0)." == \
+        str(exception.value)
+
+
+def test_ipv6_groups_many(with_numpy):
+    group_ids, mask = ipv6_groups_many(
+        IPV4_ADDRESSES[:1] + IPV6_ADDRESSES,
+        errors="skip"
+    )
+
+    assert [int(group_id) for group_id in group_ids] == [
+        0x000000fb,
+        0xffd3e4f5,
+        0x00000000
+    ]
+    assert [bool(item) for item in mask] == [False, True, True, True]
+
+    with raises(AddressError) as exception:
+        ipv6_groups_many(IPV4_ADDRESSES)
+
+    assert "Pass in an IPv6 multicast MAC address (item 0)." == \
+        str(exception.value)
@@ -1,9 +1,19 @@
+from copy import deepcopy
+
+from pickle import (
+    dumps,
+    loads
+)
+
 from pytest import (
     mark,
     raises
 )
 
 from macaddress.octet import (
+    BINARY,
+    OCTETS,
+    REVERSE_BINARY,
     Octet,
     OctetError
 )
@@ -14,7 +24,7 @@ from constants import (
 )
 
 
-@mark.parametrize("digits", INVALID_OCTET)
+@mark.parametrize("digits", INVALID_OCTET + ["a0\n", None, ["a0"]])
 def test_octet_error(digits):
     with raises(OctetError) as exception:
         octet = Octet(digits)
@@ -49,3 +59,30 @@ def test_octet(original, normalized, decimal, binary, reverse_binary, capsys):
     print(octet)
     stdout, stderr = capsys.readouterr()
     assert stdout == normalized + "\n"
+
+
+def test_flyweights():
+    octet = Octet("A0")
+
+    assert Octet("A0") is octet
+    assert Octet("a0") is OCTETS[160]
+    assert Octet("a0") is not octet
+    assert deepcopy(octet) is octet
+    assert loads(dumps(octet)) is octet
+
+    with raises(AttributeError):
+        octet.original = "b1"
+
+    with raises(AttributeError):
+        octet.extra = True
+
+
+def test_tables():
+    assert len(OCTETS) == 256
+
+    for decimal, octet in enumerate(OCTETS):
+        assert octet.decimal == decimal
+        assert octet.binary == BINARY[decimal]
+        assert int(octet.binary, base=2) == decimal
+        assert octet.reverse_binary == REVERSE_BINARY[decimal]
+        assert octet.reverse_binary == octet.binary[::-1]
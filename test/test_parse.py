@@ -0,0 +1,101 @@
+from array import array
+
+from pytest import (
+    fixture,
+    mark,
+    raises
+)
+
+import macaddress.parse
+
+from macaddress.macaddress import AddressError
+
+from macaddress.parse import (
+    convert_many,
+    parse_many
+)
+
+from constants import (
+    INVALID_ADDRESS,
+    EUI
+)
+
+
+VALID = [eui[0] for eui in EUI]
+
+VALUES = [eui[2] for eui in EUI]
+
+MIXED = [VALID[0], INVALID_ADDRESS[0], VALID[1], None, VALID[2]]
+
+
+@fixture
+def numpy_module():
+    return macaddress.parse
+
+
+def as_lists(result):
+    values, mask = result
+    values = getattr(values, "decimal", values)
+    return ([int(value) for value in values], [bool(item) for item in mask])
+
+
+def test_valid(with_numpy):
+    values, mask = parse_many(VALID)
+
+    if with_numpy:
+        assert type(values).__name__ == "MacAddressArray"
+    else:
+        assert isinstance(values, array)
+        assert isinstance(mask, bytearray)
+
+    assert as_lists((values, mask)) == (VALUES, [True] * len(VALID))
+
+
+def test_skip(with_numpy):
+    assert as_lists(parse_many(MIXED, errors="skip")) == (
+        VALUES[:3],
+        [True, False, True, False, True]
+    )
+
+
+def test_mask(with_numpy):
+    assert as_lists(parse_many(iter(MIXED), errors="mask")) == (
+        [VALUES[0], 0, VALUES[1], 0, VALUES[2]],
+        [True, False, True, False, True]
+    )
+
+
+def test_empty(with_numpy):
+    assert as_lists(parse_many([])) == ([], [])
+
+
+@mark.parametrize("identifier", INVALID_ADDRESS)
+def test_raise(identifier):
+    with raises(AddressError) as exception:
+        parse_many([VALID[0], identifier])
+
+    assert "Pass in 12 hexadecimal digits (item 1)." == str(exception.value)
+
+
+def test_errors():
+    with raises(ValueError):
+        parse_many(VALID, errors="ignore")
+
+
+@mark.parametrize(("errors", "expected"), [
+    ("skip", ([4, 8], [True, False, True])),
+    ("mask", ([4, 0, 8], [True, False, True]))
+])
+def test_convert_many(errors, expected):
+    def halve(item):
+        return item // 2 if item % 2 == 0 else None
+
+    values, mask = convert_many([8, 3, 16], halve, errors, "", typecode="I")
+
+    assert values.typecode == "I"
+    assert (list(values), list(mask)) == expected
+
+    with raises(AddressError) as exception:
+        convert_many([8, 3], halve, "raise", "Pass in {}.", start=10)
+
+    assert "Pass in 11." == str(exception.value)
@@ -0,0 +1,232 @@
+import struct
+
+from pytest import (
+    fixture,
+    mark,
+    raises
+)
+
+import macaddress.pcap
+
+from macaddress.pcap import (
+    PcapError,
+    read_pcap
+)
+
+
+FRAMES = [
+    (1603000000, 123456, 0xffffffffffff, 0xa0b1c2d3e4f5),
+    (1603000001, 0, 0xa0b1c2d3e4f5, 0xaab1c2d3e4f5),
+    (1603000002, 999999, 0x0180c2000000, 0x000000000001)
+]
+
+
+def frame(destination, source):
+    return (
+        destination.to_bytes(6, "big") +
+        source.to_bytes(6, "big") +
+        b"\x08\x00" +
+        b"\x00" * 46
+    )
+
+
+def classic(order="<", nanoseconds=False, link_type=1, frames=FRAMES):
+    magic = 0xA1B23C4D if nanoseconds else 0xA1B2C3D4
+    data = struct.pack(order + "IHHiIII", magic, 2, 4, 0, 0, 65535, link_type)
+
+    for seconds, fraction, destination, source in frames:
+        packet = frame(destination, source)
+        data += struct.pack(
+            order + "IIII",
+            seconds,
+            fraction,
+            len(packet),
+            len(packet)
+        )
+        data += packet
+
+    # A runt frame, which should be skipped.
+
+    return data + struct.pack(order + "IIII", 0, 0, 4, 4) + b"\x00" * 4
+
+
+def block(order, block_type, body):
+    body += b"\x00" * (-len(body) % 4)
+    length = len(body) + 12
+    return struct.pack(order + "II", block_type, length) + body + struct.pack(
+        order + "I",
+        length
+    )
+
+
+def pcapng(order="<", resolution=None):
+    data = block(
+        order,
+        0x0A0D0D0A,
+        struct.pack(order + "IHHq", 0x1A2B3C4D, 1, 0, -1)
+    )
+
+    options = b""
+
+    if resolution is not None:
+        options = struct.pack(order + "HHB", 9, 1, resolution) + b"\x00" * 3
+        options += struct.pack(order + "HH", 0, 0)
+
+    data += block(
+        order,
+        1,
+        struct.pack(order + "HHI", 1, 0, 65535) + options
+    )
+
+    # A second interface that is not Ethernet.
+
+    data += block(order, 1, struct.pack(order + "HHI", 105, 0, 65535))
+
+    if resolution is None:
+        units = 1000000
+    elif resolution & 0x80:
+        units = 1 << (resolution & 0x7F)
+    else:
+        units = 10 ** resolution
+
+    for seconds, fraction, destination, source in FRAMES:
+        packet = frame(destination, source)
+        timestamp = seconds * units + fraction * units // 1000000
+
+        for interface in (0, 1):
+            data += block(
+                order,
+                6,
+                struct.pack(
+                    order + "IIIII",
+                    interface,
+                    timestamp >> 32,
+                    timestamp & 0xFFFFFFFF,
+                    len(packet),
+                    len(packet)
+                ) + packet
+            )
+
+    data += block(
+        order,
+        3,
+        struct.pack(order + "I", 60) + frame(0xa0b1c2d3e4f5, 0x0)
+    )
+
+    return data
+
+
+def expected(simple=False):
+    frames = [
+        (
+            seconds * 1000000000 + fraction * 1000,
+            destination,
+            source
+        )
+        for seconds, fraction, destination, source in FRAMES
+    ]
+
+    if simple:
+        frames.append((0, 0xa0b1c2d3e4f5, 0x0))
+
+    return frames
+
+
+@fixture
+def numpy_module():
+    return macaddress.pcap
+
+
+def read(path, chunk_size=65536):
+    rows = []
+
+    for chunk in read_pcap(path, chunk_size=chunk_size):
+        timestamps, destinations, sources = chunk
+        destinations = getattr(destinations, "decimal", destinations)
+        sources = getattr(sources, "decimal", sources)
+        rows += zip(
+            [int(timestamp) for timestamp in timestamps],
+            [int(value) for value in destinations],
+            [int(value) for value in sources]
+        )
+
+    return rows
+
+
+@mark.parametrize("order", ["<", ">"])
+def test_classic(tmp_path, with_numpy, order):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(classic(order))
+
+    assert read(path) == expected()
+
+
+def test_classic_nanoseconds(tmp_path, with_numpy):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(classic(nanoseconds=True))
+
+    assert [row[0] for row in read(path)] == [
+        seconds * 1000000000 + fraction
+        for seconds, fraction, destination, source in FRAMES
+    ]
+
+
+@mark.parametrize("order", ["<", ">"])
+@mark.parametrize("resolution", [None, 6, 9, 0x94])
+def test_pcapng(tmp_path, with_numpy, order, resolution):
+    path = tmp_path / "capture.pcapng"
+    path.write_bytes(pcapng(order, resolution))
+
+    rows = read(path)
+
+    if resolution == 0x94:
+        # Binary fractions of a second lose precision.
+
+        assert [row[1:] for row in rows] == [
+            row[1:] for row in expected(simple=True)
+        ]
+    else:
+        assert rows == expected(simple=True)
+
+
+def test_chunks(tmp_path, with_numpy):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(classic())
+
+    chunks = list(read_pcap(path, chunk_size=2))
+
+    assert [len(chunk.timestamps) for chunk in chunks] == [2, 1]
+    assert read(path, chunk_size=1) == expected()
+
+
+def test_empty_capture(tmp_path):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(classic(frames=[]))
+
+    assert list(read_pcap(path)) == []
+
+
+@mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x00" * 24,
+        classic(link_type=105),
+        classic()[:40],
+        pcapng()[:-8]
+    ]
+)
+def test_pcap_error(tmp_path, data):
+    path = tmp_path / "invalid.pcap"
+    path.write_bytes(data)
+
+    with raises(PcapError):
+        list(read_pcap(path))
+
+
+def test_chunk_size(tmp_path):
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(classic())
+
+    with raises(ValueError):
+        list(read_pcap(path, chunk_size=0))
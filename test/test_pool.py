@@ -0,0 +1,186 @@
+from threading import Thread
+
+from pytest import (
+    mark,
+    raises
+)
+
+from macaddress.block import MacAddressBlock
+
+from macaddress.macaddress import MediaAccessControlAddress
+
+from macaddress.pool import (
+    AddressPool,
+    PoolError
+)
+
+from constants import (
+    LAA_UNICAST,
+    UAA_UNICAST
+)
+
+
+PREFIX = "02:00:00:00:00:00/40"
+
+FIRST = 0x020000000000
+
+LAA_MESSAGE = "Pass in a prefix of locally-administered unicast addresses."
+
+
+def test_allocate():
+    pool = AddressPool(PREFIX)
+    macs = [pool.allocate() for _ in range(256)]
+
+    assert all(isinstance(mac, MediaAccessControlAddress) for mac in macs)
+    assert sorted(mac.decimal for mac in macs) == list(
+        range(FIRST, FIRST + 256)
+    )
+    assert all(mac.is_laa for mac in macs)
+    assert (pool.size, pool.allocated, pool.available) == (256, 256, 0)
+    assert len(pool) == 256
+
+    with raises(PoolError) as exception:
+        pool.allocate()
+
+    assert "Release an address first.  The pool is full." == \
+        str(exception.value)
+
+
+def test_release():
+    pool = AddressPool(PREFIX)
+    macs = [pool.allocate() for _ in range(10)]
+
+    pool.release(macs[3])
+    pool.release(macs[7].to_colon_notation())
+
+    assert pool.allocated == 8
+    assert pool.is_allocated(macs[3]) == False
+    assert pool.allocate() == macs[7]
+    assert pool.allocate() == macs[3]
+    assert pool.allocate().decimal == FIRST + 10
+
+    with raises(PoolError) as exception:
+        pool.release(FIRST + 100)
+
+    assert "Pass in an allocated address." == str(exception.value)
+
+
+def test_reserve():
+    pool = AddressPool(MacAddressBlock(PREFIX))
+
+    pool.reserve(FIRST)
+    pool.reserve(FIRST + 2)
+
+    assert pool.allocate().decimal == FIRST + 1
+    assert pool.allocate().decimal == FIRST + 3
+
+    with raises(PoolError) as exception:
+        pool.reserve(FIRST + 1)
+
+    assert "Pass in a free address." == str(exception.value)
+
+    # A released address that is then reserved is not allocated.
+
+    pool.release(FIRST + 1)
+    pool.reserve(FIRST + 1)
+
+    assert pool.allocate().decimal == FIRST + 4
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "pool"
+    pool = AddressPool(MediaAccessControlAddress("0a0000000000"), 44)
+    macs = [pool.allocate() for _ in range(5)]
+    pool.release(macs[1])
+    pool.save(path)
+    pool.allocate()
+    pool.save(str(path))
+
+    restored = AddressPool.load(path)
+
+    assert list(tmp_path.iterdir()) == [path]
+    assert restored.block == pool.block
+    assert restored.allocated == 5
+    assert restored.allocate() == pool.allocate()
+    assert restored.is_allocated(macs[1]) == True
+
+
+def test_load_error(tmp_path):
+    path = tmp_path / "pool"
+    path.write_bytes(b"MACREG\x00\x01")
+
+    with raises(PoolError) as exception:
+        AddressPool.load(path)
+
+    assert "Pass in a saved pool." == str(exception.value)
+
+
+@mark.parametrize(
+    ("count", "bitmap"),
+    [(999, b"\x03"), (1, b"\x03"), (3, b"\x13"), (3, b"\x83")]
+)
+def test_load_inconsistent(tmp_path, count, bitmap):
+    path = tmp_path / "pool"
+    pool = AddressPool("02:00:00:00:00:00/46")
+    pool.allocate()
+    pool.allocate()
+    pool.save(path)
+
+    data = path.read_bytes()
+
+    assert data[-1:] == b"\x03"
+    assert AddressPool.load(path).available == 2
+
+    header = data[:-5] + count.to_bytes(4, "little")
+    path.write_bytes(header + bitmap)
+
+    with raises(PoolError) as exception:
+        AddressPool.load(path)
+
+    assert "Pass in a saved pool." == str(exception.value)
+
+
+def test_threads():
+    pool = AddressPool("02:00:00:00:00:00/36")
+    results = [[] for _ in range(4)]
+
+    def allocate(macs):
+        for _ in range(1000):
+            macs.append(pool.allocate())
+
+    threads = [Thread(target=allocate, args=(macs,)) for macs in results]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    macs = [mac for result in results for mac in result]
+
+    assert len(set(macs)) == 4000
+    assert pool.allocated == 4000
+
+
+@mark.parametrize(("prefix", "prefix_length", "message"), [
+    (UAA_UNICAST[:6] + "000000", 24, LAA_MESSAGE),
+    ("030000000000", 24, LAA_MESSAGE),
+    ("020000000000", 16, "Pass in a prefix length from 24 to 48."),
+    ("020000000001", 40, "Pass in a base address without host bits.")
+])
+def test_pool_error(prefix, prefix_length, message):
+    with raises(PoolError) as exception:
+        AddressPool(prefix, prefix_length)
+
+    assert message == str(exception.value)
+
+
+@mark.parametrize("address", [LAA_UNICAST, "0a", None])
+def test_address_error(address):
+    pool = AddressPool(PREFIX)
+
+    with raises(PoolError):
+        pool.reserve(address)
+
+    with raises(PoolError):
+        pool.is_allocated(address)
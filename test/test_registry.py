@@ -0,0 +1,197 @@
+from pytest import (
+    fixture,
+    mark,
+    raises
+)
+
+import macaddress.registry
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from macaddress.registry import (
+    CompiledRegistry,
+    Registry,
+    RegistryError,
+    compile_registry,
+    load_registry,
+    lookup_vendor,
+    lookup_vendors
+)
+
+
+HEADER = "Registry,Assignment,Organization Name,Organization Address\n"
+
+OUI = HEADER + (
+    'MA-L,A0B1C2,"Example Networks, Inc.",1 Main St\n'
+    "MA-L,70B3D5,IEEE Registration Authority,445 Hoes Lane\n"
+    "MA-L,0180C2,IEEE 802.1,445 Hoes Lane\n"
+)
+
+MAM = HEADER + "MA-M,70B3D5F,Example Sensors,2 Main St\n"
+
+OUI36 = HEADER + (
+    "MA-S,70B3D5F2F,Example Meters,3 Main St\n"
+    "MA-S,70B3D5F30,Example Sensors,2 Main St\n"
+)
+
+CID = HEADER + "CID,AAB1C2,Example Cloud,4 Main St\n"
+
+LOOKUPS = [
+    ("a0-b1-c2-d3-e4-f5", "Example Networks, Inc."),
+    ("70b3d5000001", "IEEE Registration Authority"),
+    ("70b3d5f00001", "Example Sensors"),
+    ("70b3d5f2f001", "Example Meters"),
+    ("70b3d5f30001", "Example Sensors"),
+    ("aab1c2d3e4f5", "Example Cloud"),
+    ("0a1b2c3d4e5f", None),
+    ("ffffffffffff", None)
+]
+
+
+@fixture
+def numpy_module():
+    return macaddress.registry
+
+
+@fixture
+def paths(tmp_path):
+    paths = []
+
+    for name, text in [
+        ("oui.csv", OUI),
+        ("mam.csv", MAM),
+        ("oui36.csv", OUI36),
+        ("cid.csv", CID)
+    ]:
+        path = tmp_path / name
+        path.write_text(text, encoding="utf-8")
+        paths.append(path)
+
+    return paths
+
+
+@fixture
+def registry(paths, monkeypatch):
+    monkeypatch.setattr(macaddress.registry, "default_registry", None)
+    return load_registry(*paths)
+
+
+@mark.parametrize(("address", "name"), LOOKUPS)
+def test_lookup(registry, address, name):
+    assert registry.lookup(address) == name
+    assert lookup_vendor(address) == name
+    assert MediaAccessControlAddress(address).vendor == name
+
+
+def test_lookup_many(registry, with_numpy):
+    addresses = [address for address, name in LOOKUPS]
+    names = [name for address, name in LOOKUPS]
+
+    assert registry.lookup_many(addresses) == names
+    assert lookup_vendors(addresses) == names
+
+
+def test_registry(registry):
+    assert len(registry) == 7
+    assert repr(registry) == "Registry(7 assignments)"
+    assert registry.names.count("Example Sensors") == 1
+    assert Registry().lookup(0) is None
+    assert Registry().lookup_many([0, 1]) == [None, None]
+
+
+def test_no_registry(monkeypatch):
+    monkeypatch.setattr(macaddress.registry, "default_registry", None)
+
+    assert lookup_vendor("a0b1c2d3e4f5") is None
+    assert lookup_vendors(["a0b1c2d3e4f5"]) == [None]
+    assert MediaAccessControlAddress("a0b1c2d3e4f5").vendor is None
+
+
+@mark.parametrize("digits", ["A0B1", "A0B1C2D3", "A0B1CG"])
+def test_registry_error(digits):
+    with raises(RegistryError):
+        Registry([(digits, "Example")])
+
+
+def test_address_error(registry):
+    with raises(AddressError):
+        registry.lookup("0a")
+
+
+def test_compiled(paths, tmp_path, monkeypatch):
+    monkeypatch.setattr(macaddress.registry, "default_registry", None)
+
+    output = tmp_path / "registry.bin"
+    compile_registry(output, *paths)
+    compiled = Registry.from_csv(*paths)
+
+    with CompiledRegistry(output) as registry:
+        assert len(registry) == 7
+        assert list(registry.names) == list(compiled.names)
+        assert repr(registry) == "CompiledRegistry('{}')".format(output)
+
+        for address, name in LOOKUPS:
+            assert registry.lookup(address) == name
+
+        assert registry.lookup_many(
+            [address for address, name in LOOKUPS]
+        ) == [name for address, name in LOOKUPS]
+
+        with raises(IndexError):
+            registry.names[7]
+
+    registry = load_registry(output)
+
+    assert isinstance(registry, CompiledRegistry)
+    assert MediaAccessControlAddress("70b3d5f2f001").vendor == "Example Meters"
+
+    registry.close()
+
+
+def test_compiled_close(paths, tmp_path, monkeypatch, with_numpy):
+    monkeypatch.setattr(macaddress.registry, "default_registry", None)
+
+    output = tmp_path / "registry.bin"
+    compile_registry(output, *paths)
+
+    registry = load_registry(output)
+    names = registry.names
+    name = names[0]
+
+    registry.close()
+
+    assert macaddress.registry.default_registry is None
+    assert lookup_vendor("a0b1c2d3e4f5") is None
+    assert registry.lookup("a0b1c2d3e4f5") is None
+    assert registry.lookup_many(["a0b1c2d3e4f5", 0]) == [None, None]
+    assert len(registry.names) == 0
+    assert name == "Example Networks, Inc."
+
+    with raises(ValueError):
+        names[0]
+
+    registry.close()
+
+
+def test_compiled_empty(tmp_path):
+    output = tmp_path / "empty.bin"
+    Registry().save(output)
+
+    with CompiledRegistry(output) as registry:
+        assert len(registry) == 0
+        assert registry.lookup("a0b1c2d3e4f5") is None
+
+
+@mark.parametrize(
+    "content",
+    [b"", b"MACREG", b"NOTAREGISTRY" * 4, b"MACREG\x00\x01" + b"\x01" * 28]
+)
+def test_compiled_error(tmp_path, content):
+    path = tmp_path / "invalid.bin"
+    path.write_bytes(content)
+
+    with raises(RegistryError):
+        CompiledRegistry(path)
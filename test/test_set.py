@@ -0,0 +1,132 @@
+from pytest import (
+    fixture,
+    importorskip,
+    mark,
+    raises
+)
+
+import macaddress.set
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from macaddress.set import MacAddressSet
+
+from constants import (
+    BROADCAST,
+    MULTICAST,
+    UAA_UNICAST,
+    LAA_UNICAST
+)
+
+
+LEFT = [UAA_UNICAST, "A0-B1-C2-D3-E4-F5", LAA_UNICAST, 0]
+
+RIGHT = [LAA_UNICAST, MULTICAST, BROADCAST, 0]
+
+
+@fixture
+def numpy_module():
+    return macaddress.set
+
+
+def as_set(addresses):
+    return {
+        MediaAccessControlAddress(address).decimal
+        if isinstance(address, str) else address
+        for address in addresses
+    }
+
+
+def test_set(with_numpy):
+    macs = MacAddressSet(LEFT)
+
+    assert len(macs) == 3
+    assert list(macs.decimal) == sorted(as_set(LEFT))
+    assert [str(mac) for mac in macs] == [
+        "000000000000",
+        UAA_UNICAST,
+        LAA_UNICAST
+    ]
+    assert repr(MacAddressSet([UAA_UNICAST])) == (
+        "MacAddressSet(['{}'])".format(UAA_UNICAST)
+    )
+    assert MacAddressSet(macs) == macs
+    assert MacAddressSet(macs) is not macs
+    assert len(MacAddressSet()) == 0
+
+
+def test_contains(with_numpy):
+    macs = MacAddressSet(LEFT)
+
+    assert UAA_UNICAST in macs
+    assert "a0:b1:c2:d3:e4:f5" in macs
+    assert 0xa0b1c2d3e4f5 in macs
+    assert MediaAccessControlAddress(LAA_UNICAST) in macs
+    assert MULTICAST not in macs
+    assert 0xffffffffffff + 1 not in macs
+    assert "0a" not in macs
+    assert None not in macs
+
+
+def test_contains_numpy_integers(with_numpy):
+    numpy = importorskip("numpy")
+    macs = MacAddressSet([5, 0xa0b1c2d3e4f5])
+
+    assert numpy.uint64(5) in macs
+    assert numpy.int64(5) in macs
+    assert numpy.uint64(0xa0b1c2d3e4f5) in macs
+    assert numpy.uint64(6) not in macs
+    assert numpy.int64(-1) not in macs
+    assert True not in MacAddressSet([1])
+    assert MacAddressSet(numpy.array([5], dtype=numpy.uint64)) == \
+        MacAddressSet([5])
+
+
+@mark.parametrize(
+    ("operation", "expected"),
+    [
+        ("union", as_set(LEFT) | as_set(RIGHT)),
+        ("intersection", as_set(LEFT) & as_set(RIGHT)),
+        ("difference", as_set(LEFT) - as_set(RIGHT)),
+        ("symmetric_difference", as_set(LEFT) ^ as_set(RIGHT))
+    ]
+)
+def test_algebra(with_numpy, operation, expected):
+    left = MacAddressSet(LEFT)
+    right = MacAddressSet(RIGHT)
+
+    assert list(getattr(left, operation)(right).decimal) == sorted(expected)
+    assert list(getattr(left, operation)(RIGHT).decimal) == sorted(expected)
+
+
+def test_operators(with_numpy):
+    left = MacAddressSet(LEFT)
+    right = MacAddressSet(RIGHT)
+
+    assert left | right == left.union(right)
+    assert left & right == left.intersection(right)
+    assert left - right == left.difference(right)
+    assert left ^ right == left.symmetric_difference(right)
+    assert left != right
+    assert left != LEFT
+    assert not left.isdisjoint(right)
+    assert left.isdisjoint([MULTICAST])
+    assert (left & right).issubset(left)
+    assert not left.issubset(right)
+
+
+def test_hash(with_numpy):
+    left = MacAddressSet(LEFT)
+    same = MacAddressSet(reversed(LEFT)) | MacAddressSet()
+
+    assert hash(left) == hash(same)
+    assert {left: True}[same]
+    assert len({left, same, MacAddressSet(RIGHT)}) == 2
+
+
+def test_address_error(with_numpy):
+    with raises(AddressError):
+        MacAddressSet(["0a"])
@@ -0,0 +1,63 @@
+from pickle import (
+    dumps,
+    loads
+)
+
+from pytest import raises
+
+from macaddress.ei48 import ExtendedIdentifier48
+
+from macaddress.macaddress import (
+    AddressError,
+    MediaAccessControlAddress
+)
+
+from macaddress.transfer import (
+    pack_many,
+    unpack_many
+)
+
+from constants import EUI
+
+
+VALUES = [eui[2] for eui in EUI]
+
+
+def test_pack_many():
+    data = pack_many(["a0:b1:c2:d3:e4:f5", 0xffffffffffff])
+
+    assert data == b"\xf5\xe4\xd3\xc2\xb1\xa0\x00\x00" + b"\xff" * 6 + \
+        b"\x00\x00"
+    assert pack_many([]) == b""
+
+
+def test_unpack_many():
+    macs = [MediaAccessControlAddress.from_int(value) for value in VALUES]
+    restored = unpack_many(loads(dumps(pack_many(macs))))
+
+    assert restored == macs
+    assert all(type(mac) is MediaAccessControlAddress for mac in restored)
+    assert [mac.original for mac in restored] == [
+        format(value, "012x") for value in VALUES
+    ]
+
+
+def test_unpack_many_cls():
+    restored = unpack_many(
+        bytearray(pack_many(VALUES)),
+        cls=ExtendedIdentifier48
+    )
+
+    assert all(
+        type(identifier) is ExtendedIdentifier48 for identifier in restored
+    )
+
+
+def test_address_error():
+    with raises(AddressError) as exception:
+        unpack_many(b"\x00" * 7)
+
+    assert "Pass in eight bytes per address." == str(exception.value)
+
+    with raises(AddressError):
+        pack_many(["0a"])